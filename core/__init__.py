@@ -9,10 +9,11 @@ Contiene:
 
 # Importar funciones geométricas
 from .geometry import (
-    calcular_y_circulo, interpolar_terreno, calcular_angulo_alpha,
+    calcular_y_circulo, calcular_y_circulo_vec, interpolar_terreno, calcular_angulo_alpha,
     calcular_longitud_arco, calcular_altura_dovela, calcular_peso_dovela,
-    calcular_presion_poros, crear_dovelas, validar_geometria_circulo,
-    crear_perfil_simple, crear_nivel_freatico_horizontal
+    calcular_presion_poros, crear_dovelas, crear_dovelas_lote, validar_geometria_circulo,
+    crear_perfil_simple, crear_nivel_freatico_horizontal, InterpoladorTerreno,
+    perfil_a_arreglos, interpolar_terreno_vec
 )
 
 # Importar método de Fellenius
@@ -28,7 +29,14 @@ from .fellenius import (
 # Importar funciones del módulo bishop
 from .bishop import (
     analizar_bishop,
+    analizar_bishop_soa,
+    analizar_bishop_geometria,
+    analizar_bishop_batch,
+    analizar_bishop_casos,
+    analizar_bishop_cacheado,
+    limpiar_cache_bishop,
     ResultadoBishop,
+    ResultadoBishopLote,
     calcular_m_alpha,
     calcular_fuerza_resistente_bishop,
     calcular_fuerza_actuante_bishop,
@@ -40,14 +48,22 @@ from .bishop import (
     generar_reporte_comparacion
 )
 
+# Búsqueda del círculo crítico
+from .search import buscar_circulo_critico, ResultadoBusquedaCritica
+
 # Lista de todas las funciones y clases exportadas
 __all__ = [
     # Geometría
     'crear_perfil_simple',
     'crear_nivel_freatico_horizontal',
     'crear_dovelas',
+    'crear_dovelas_lote',
     'calcular_presion_poros',
     'validar_geometria_circulo',
+    'InterpoladorTerreno',
+    'perfil_a_arreglos',
+    'interpolar_terreno_vec',
+    'calcular_y_circulo_vec',
     
     # Fellenius
     'analizar_fellenius',
@@ -59,7 +75,14 @@ __all__ = [
     
     # Bishop
     'analizar_bishop',
+    'analizar_bishop_soa',
+    'analizar_bishop_geometria',
+    'analizar_bishop_batch',
+    'analizar_bishop_casos',
+    'analizar_bishop_cacheado',
+    'limpiar_cache_bishop',
     'ResultadoBishop',
+    'ResultadoBishopLote',
     'calcular_m_alpha',
     'calcular_fuerza_resistente_bishop',
     'calcular_fuerza_actuante_bishop',
@@ -68,5 +91,9 @@ __all__ = [
     'bishop_talud_homogeneo',
     'bishop_con_nivel_freatico',
     'comparar_bishop_fellenius',
-    'generar_reporte_comparacion'
+    'generar_reporte_comparacion',
+    
+    # Búsqueda
+    'buscar_circulo_critico',
+    'ResultadoBusquedaCritica'
 ]
@@ -13,10 +13,14 @@ Objetivo: Garantizar que NUNCA fallen los cálculos por configuraciones imposibl
 
 import math
 from typing import List, Tuple, Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import lru_cache
 import logging
 
+import numpy as np
+
+from core.geometry import _clave_perfil
 from data.models import CirculoFalla, Estrato
 
 
@@ -92,88 +96,38 @@ class CalculadorLimites:
         if not perfil_terreno:
             raise ValueError("Perfil de terreno no puede estar vacío")
 
-        # ANÁLISIS GEOMÉTRICO DEL TALUD REAL
-        x_coords = [p[0] for p in perfil_terreno]
-        y_coords = [p[1] for p in perfil_terreno]
-
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
-
-        # Calcular dimensiones del talud
-        altura_talud = y_max - y_min
-        longitud_base = x_max - x_min
-
-        # Estimar ángulo del talud
-        if altura_talud > 0 and longitud_base > 0:
-            angulo_talud_rad = math.atan(altura_talud / longitud_base)
-            angulo_talud_deg = math.degrees(angulo_talud_rad)
-        else:
-            angulo_talud_deg = 45.0
+        # Las búsquedas piden los límites del mismo perfil una y otra vez: se
+        # calculan una vez por perfil/configuración y se devuelve una copia
+        clave_configuracion = (
+            None if configuracion is None else tuple(sorted(configuracion.items()))
+        )
+        limites = replace(
+            _limites_cacheados(_clave_perfil(perfil_terreno), clave_configuracion)
+        )
 
-        # Obtener configuración
+        # El resumen se registra fuera de la caché para que salga en cada llamada
         if configuracion is None:
-            # Detectar tipo de talud automáticamente basado en el ángulo
-            tipo_talud_detectado = detectar_tipo_talud_desde_angulo(angulo_talud_deg)
-            print(
-                f" Tipo de talud detectado: {tipo_talud_detectado} (ángulo: {angulo_talud_deg:.1f}°)"
+            logging.debug(
+                "Tipo de talud detectado: %s (ángulo: %.1f°)",
+                detectar_tipo_talud_desde_angulo(limites.pendiente_talud),
+                limites.pendiente_talud,
             )
-
-            configuraciones_predefinidas = crear_limites_predefinidos()
-            configuracion = configuraciones_predefinidas.get(
-                tipo_talud_detectado, configuraciones_predefinidas["talud_empinado"]
-            )
-
-        print(f"📐 GEOMETRÍA DEL TALUD:")
-        print(f"   Altura: {altura_talud:.2f}m")
-        print(f"   Base: {longitud_base:.2f}m")
-        print(f"   Ángulo: {angulo_talud_deg:.1f}°")
-        print(f"   Rango X: [{x_min:.2f}, {x_max:.2f}]")
-        print(f"   Rango Y: [{y_min:.2f}, {y_max:.2f}]")
-
-        # LÍMITES INTELIGENTES BASADOS EN GEOMETRÍA REAL Y CONFIGURACIÓN
-
-        # Centro X: usar factor de margen lateral de la configuración
-        margen_x = altura_talud * configuracion.get("factor_margen_lateral", 1.0)
-        centro_x_min = x_min - margen_x
-        centro_x_max = x_max + margen_x
-
-        # Centro Y: usar factor de altura máxima de la configuración
-        altura_minima_centro = y_max + altura_talud * 0.3  # Mínimo 30% arriba
-        altura_maxima_centro = y_max + altura_talud * configuracion.get(
-            "factor_altura_maxima", 2.0
-        )
-        centro_y_min = altura_minima_centro
-        centro_y_max = altura_maxima_centro
-
-        # Radio: usar factor de radio máximo de la configuración
-        radio_min = altura_talud * 0.8  # Mínimo 80% de la altura
-        radio_max = altura_talud * configuracion.get("factor_radio_max", 1.5)
-
-        print(f"🎯 LÍMITES CALCULADOS:")
-        print(
-            f"   Centro X: [{centro_x_min:.2f}, {centro_x_max:.2f}] (margen: ±{margen_x:.2f})"
-        )
-        print(
-            f"   Centro Y: [{centro_y_min:.2f}, {centro_y_max:.2f}] (altura talud + {altura_talud*0.3:.2f} a +{altura_talud*configuracion.get('factor_altura_maxima', 2.0):.2f})"
-        )
-        print(
-            f"   Radio: [{radio_min:.2f}, {radio_max:.2f}] ({altura_talud*0.8:.2f}H a {altura_talud*configuracion.get('factor_radio_max', 2.0):.2f}H)"
+        logging.debug(
+            "Geometría del talud: altura=%.2fm, base=%.2fm, ángulo=%.1f°",
+            limites.altura_talud,
+            limites.ancho_talud,
+            limites.pendiente_talud,
         )
-
-        return LimitesGeometricos(
-            centro_x_min=centro_x_min,
-            centro_x_max=centro_x_max,
-            centro_y_min=centro_y_min,
-            centro_y_max=centro_y_max,
-            radio_min=radio_min,
-            radio_max=radio_max,
-            distancia_minima_talud=0.0,
-            cobertura_minima_requerida=0.0,
-            ancho_talud=longitud_base,
-            altura_talud=altura_talud,
-            longitud_diagonal=math.sqrt(longitud_base**2 + altura_talud**2),
-            pendiente_talud=angulo_talud_deg,
+        logging.debug(
+            "Límites calculados: centro X=[%.2f, %.2f], centro Y=[%.2f, %.2f], radio=[%.2f, %.2f]",
+            limites.centro_x_min,
+            limites.centro_x_max,
+            limites.centro_y_min,
+            limites.centro_y_max,
+            limites.radio_min,
+            limites.radio_max,
         )
+        return limites
 
     def validar_y_corregir_circulo(
         self,
@@ -192,44 +146,32 @@ class CalculadorLimites:
             violaciones.append(
                 f"Centro X muy a la izquierda: {circulo.xc:.2f} < {limites.centro_x_min:.2f}"
             )
-            if corregir_automaticamente:
-                xc_corregido = limites.centro_x_min
 
         if circulo.xc > limites.centro_x_max:
             violaciones.append(
                 f"Centro X muy a la derecha: {circulo.xc:.2f} > {limites.centro_x_max:.2f}"
             )
-            if corregir_automaticamente:
-                xc_corregido = limites.centro_x_max
 
         if circulo.yc < limites.centro_y_min:
             violaciones.append(
                 f"Centro Y muy bajo: {circulo.yc:.2f} < {limites.centro_y_min:.2f}"
             )
-            if corregir_automaticamente:
-                yc_corregido = limites.centro_y_min
 
         if circulo.yc > limites.centro_y_max:
             violaciones.append(
                 f"Centro Y muy alto: {circulo.yc:.2f} > {limites.centro_y_max:.2f}"
             )
-            if corregir_automaticamente:
-                yc_corregido = limites.centro_y_max
 
         # Validar límites del radio
         if circulo.radio < limites.radio_min:
             violaciones.append(
                 f"Radio muy pequeño: {circulo.radio:.2f} < {limites.radio_min:.2f}"
             )
-            if corregir_automaticamente:
-                radio_corregido = limites.radio_min
 
         if circulo.radio > limites.radio_max:
             violaciones.append(
                 f"Radio muy grande: {circulo.radio:.2f} > {limites.radio_max:.2f}"
             )
-            if corregir_automaticamente:
-                radio_corregido = limites.radio_max
 
         # Generar sugerencias
         if violaciones:
@@ -282,61 +224,167 @@ class CalculadorLimites:
 
         return CirculoFalla(xc=nuevo_cx, yc=nuevo_cy, radio=nuevo_r)
 
+    def corregir_circulos_lote(
+        self, circulos: np.ndarray, limites: LimitesGeometricos
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Versión vectorizada de validar_y_corregir_circulo para N círculos.
+
+        Recorta todas las filas (xc, yc, radio) contra los límites con un solo
+        np.clip, sin mensajes de violación ni sugerencias.
+
+        Args:
+            circulos: Arreglo (N, 3) con columnas xc, yc, radio
+            limites: Límites geométricos a aplicar
+
+        Returns:
+            Tupla (círculos corregidos (N, 3), máscara (N,) de los que ya
+            cumplían los límites)
+        """
+        circulos = np.asarray(circulos, dtype=float).reshape(-1, 3)
+        minimos = np.array([limites.centro_x_min, limites.centro_y_min, limites.radio_min])
+        maximos = np.array([limites.centro_x_max, limites.centro_y_max, limites.radio_max])
+        corregidos = np.clip(circulos, minimos, maximos)
+        return corregidos, np.all(corregidos == circulos, axis=1)
+
     def generar_circulos_dentro_limites(
         self,
         limites: LimitesGeometricos,
         cantidad: int = 10,
         distribucion: str = "uniforme",
+        semilla: Optional[int] = None,
     ) -> List[CirculoFalla]:
         """
         Genera círculos automáticamente dentro de los límites establecidos
+
+        Los centros y radios se sortean en bloque con un generador de NumPy.
+        Sin semilla, el generador se inicializa desde el módulo random, de modo
+        que random.seed() sigue haciendo reproducibles las búsquedas.
         """
         import random
 
-        circulos = []
-
-        for _ in range(cantidad):
-            if distribucion == "uniforme":
-                # Distribución uniforme
-                cx = random.uniform(limites.centro_x_min, limites.centro_x_max)
-                cy = random.uniform(limites.centro_y_min, limites.centro_y_max)
-                r = random.uniform(limites.radio_min, limites.radio_max)
-
-            elif distribucion == "gaussiana":
-                # Distribución gaussiana centrada
-                cx_medio = (limites.centro_x_min + limites.centro_x_max) / 2
-                cy_medio = (limites.centro_y_min + limites.centro_y_max) / 2
-                r_medio = (limites.radio_min + limites.radio_max) / 2
-
-                # Desviación estándar como 1/4 del rango
-                std_cx = (limites.centro_x_max - limites.centro_x_min) / 4
-                std_cy = (limites.centro_y_max - limites.centro_y_min) / 4
-                std_r = (limites.radio_max - limites.radio_min) / 4
-
-                cx = random.gauss(cx_medio, std_cx)
-                cy = random.gauss(cy_medio, std_cy)
-                r = random.gauss(r_medio, std_r)
-
-                # Asegurar que estén dentro de límites
-                cx = max(limites.centro_x_min, min(cx, limites.centro_x_max))
-                cy = max(limites.centro_y_min, min(cy, limites.centro_y_max))
-                r = max(limites.radio_min, min(r, limites.radio_max))
-
-            else:  # "critico" - enfocado en círculos más grandes y cercanos
-                # Favorecer radios grandes y centros más cercanos al talud
-                cx = random.uniform(
-                    limites.centro_x_min * 0.7, limites.centro_x_max * 0.7
-                )
-                cy = random.uniform(
-                    limites.centro_y_min,
-                    limites.centro_y_min
-                    + (limites.centro_y_max - limites.centro_y_min) * 0.4,
-                )
-                r = random.uniform(limites.radio_min * 1.2, limites.radio_max * 0.9)
+        rng = np.random.default_rng(
+            random.getrandbits(64) if semilla is None else semilla
+        )
+
+        if distribucion == "uniforme":
+            # Distribución uniforme
+            cx = rng.uniform(limites.centro_x_min, limites.centro_x_max, cantidad)
+            cy = rng.uniform(limites.centro_y_min, limites.centro_y_max, cantidad)
+            r = rng.uniform(limites.radio_min, limites.radio_max, cantidad)
+
+        elif distribucion == "gaussiana":
+            # Distribución gaussiana centrada
+            cx_medio = (limites.centro_x_min + limites.centro_x_max) / 2
+            cy_medio = (limites.centro_y_min + limites.centro_y_max) / 2
+            r_medio = (limites.radio_min + limites.radio_max) / 2
+
+            # Desviación estándar como 1/4 del rango
+            std_cx = (limites.centro_x_max - limites.centro_x_min) / 4
+            std_cy = (limites.centro_y_max - limites.centro_y_min) / 4
+            std_r = (limites.radio_max - limites.radio_min) / 4
+
+            # Asegurar que estén dentro de límites
+            cx = np.clip(rng.normal(cx_medio, std_cx, cantidad),
+                         limites.centro_x_min, limites.centro_x_max)
+            cy = np.clip(rng.normal(cy_medio, std_cy, cantidad),
+                         limites.centro_y_min, limites.centro_y_max)
+            r = np.clip(rng.normal(r_medio, std_r, cantidad),
+                        limites.radio_min, limites.radio_max)
+
+        else:  # "critico" - enfocado en círculos más grandes y cercanos
+            # Favorecer radios grandes y centros más cercanos al talud
+            cx = rng.uniform(
+                limites.centro_x_min * 0.7, limites.centro_x_max * 0.7, cantidad
+            )
+            cy = rng.uniform(
+                limites.centro_y_min,
+                limites.centro_y_min
+                + (limites.centro_y_max - limites.centro_y_min) * 0.4,
+                cantidad,
+            )
+            r = rng.uniform(limites.radio_min * 1.2, limites.radio_max * 0.9, cantidad)
+
+        return [
+            CirculoFalla(xc=x, yc=y, radio=radio)
+            for x, y, radio in zip(cx.tolist(), cy.tolist(), r.tolist())
+        ]
+
+
+@lru_cache(maxsize=128)
+def _limites_cacheados(
+    perfil_terreno: Tuple[Tuple[float, float], ...],
+    clave_configuracion: Optional[Tuple[Tuple[str, float], ...]],
+) -> LimitesGeometricos:
+    """Límites de CalculadorLimites.calcular_limites_desde_perfil para un perfil hashable."""
+    # ANÁLISIS GEOMÉTRICO DEL TALUD REAL
+    x_coords = [p[0] for p in perfil_terreno]
+    y_coords = [p[1] for p in perfil_terreno]
+
+    x_min, x_max = min(x_coords), max(x_coords)
+    y_min, y_max = min(y_coords), max(y_coords)
+
+    # Calcular dimensiones del talud
+    altura_talud = y_max - y_min
+    longitud_base = x_max - x_min
+
+    # Estimar ángulo del talud
+    if altura_talud > 0 and longitud_base > 0:
+        angulo_talud_rad = math.atan(altura_talud / longitud_base)
+        angulo_talud_deg = math.degrees(angulo_talud_rad)
+    else:
+        angulo_talud_deg = 45.0
 
-            circulos.append(CirculoFalla(xc=cx, yc=cy, radio=r))
+    # Obtener configuración
+    if clave_configuracion is None:
+        # Detectar tipo de talud automáticamente basado en el ángulo
+        tipo_talud_detectado = detectar_tipo_talud_desde_angulo(angulo_talud_deg)
 
-        return circulos
+        configuraciones_predefinidas = crear_limites_predefinidos()
+        configuracion = configuraciones_predefinidas.get(
+            tipo_talud_detectado, configuraciones_predefinidas["talud_empinado"]
+        )
+    else:
+        configuracion = dict(clave_configuracion)
+
+    # LÍMITES INTELIGENTES BASADOS EN GEOMETRÍA REAL Y CONFIGURACIÓN
+
+    # Centro X: usar factor de margen lateral de la configuración
+    margen_x = altura_talud * configuracion.get("factor_margen_lateral", 1.0)
+    centro_x_min = x_min - margen_x
+    centro_x_max = x_max + margen_x
+
+    # Centro Y: usar factor de altura máxima de la configuración
+    altura_minima_centro = y_max + altura_talud * 0.3  # Mínimo 30% arriba
+    altura_maxima_centro = y_max + altura_talud * configuracion.get(
+        "factor_altura_maxima", 2.0
+    )
+    centro_y_min = altura_minima_centro
+    centro_y_max = altura_maxima_centro
+
+    # Radio: usar factor de radio máximo de la configuración
+    radio_min = altura_talud * 0.8  # Mínimo 80% de la altura
+    radio_max = altura_talud * configuracion.get("factor_radio_max", 1.5)
+
+    return LimitesGeometricos(
+        centro_x_min=centro_x_min,
+        centro_x_max=centro_x_max,
+        centro_y_min=centro_y_min,
+        centro_y_max=centro_y_max,
+        radio_min=radio_min,
+        radio_max=radio_max,
+        distancia_minima_talud=0.0,
+        cobertura_minima_requerida=0.0,
+        ancho_talud=longitud_base,
+        altura_talud=altura_talud,
+        longitud_diagonal=math.sqrt(longitud_base**2 + altura_talud**2),
+        pendiente_talud=angulo_talud_deg,
+    )
+
+
+# CalculadorLimites no guarda estado entre llamadas: las funciones de
+# conveniencia comparten una única instancia
+_CALCULADOR = CalculadorLimites()
 
 
 def detectar_tipo_talud_desde_angulo(angulo_grados: float) -> str:
@@ -392,17 +440,11 @@ def aplicar_limites_inteligentes(
     """
     Función de conveniencia para aplicar límites inteligentes
     """
-    calculador = CalculadorLimites()
-
-    # Aplicar configuración predefinida si existe
-    configuraciones = crear_limites_predefinidos()
-    if tipo_talud in configuraciones:
-        config = configuraciones[tipo_talud]
-        for attr, valor in config.items():
-            if hasattr(calculador, attr):
-                setattr(calculador, attr, valor)
-
-    return calculador.calcular_limites_desde_perfil(perfil_terreno)
+    # Los factores del preset solo se asignaban como atributos de un calculador
+    # nuevo que calcular_limites_desde_perfil nunca lee: el resultado depende
+    # únicamente del perfil, así que se reutiliza el calculador del módulo y la
+    # caché por perfil de _limites_cacheados
+    return _CALCULADOR.calcular_limites_desde_perfil(perfil_terreno)
 
 
 def validar_circulo_geometricamente(
@@ -412,8 +454,7 @@ def validar_circulo_geometricamente(
 ) -> ResultadoValidacion:
     """Valida un círculo usando límites pre-calculados."""
 
-    calculador = CalculadorLimites()
-    return calculador.validar_y_corregir_circulo(
+    return _CALCULADOR.validar_y_corregir_circulo(
         circulo, limites, corregir_automaticamente
     )
 
@@ -437,8 +478,7 @@ def validar_circulo_con_limites(
     print(f"   Centro Y: [{limites.centro_y_min:.2f}, {limites.centro_y_max:.2f}]")
     print(f"   Radio: [{limites.radio_min:.2f}, {limites.radio_max:.2f}]")
 
-    calculador = CalculadorLimites()
-    resultado = calculador.validar_y_corregir_circulo(
+    resultado = _CALCULADOR.validar_y_corregir_circulo(
         circulo, limites, corregir_automaticamente=True
     )
 
@@ -17,7 +17,7 @@ from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
-from data.models import CirculoFalla, Estrato
+from data.models import CirculoFalla, Dovela, Estrato
 from core.geometry import crear_dovelas
 
 
@@ -60,6 +60,20 @@ class MetricasCirculo:
     es_computacionalmente_valido: bool = False
 
 
+@dataclass
+class ContextoCirculo:
+    """
+    Cálculos geométricos de un círculo que comparten validación y métricas.
+    
+    Lo construye GeometriaCirculoAvanzada.preparar; solo es válido para el
+    círculo, perfil, estrato y número de dovelas con que se preparó.
+    """
+    intersecciones: List[Tuple[float, float]]
+    longitud_arco: float
+    dovelas: Optional[List[Dovela]]
+    error_dovelas: Optional[Exception] = None
+
+
 class GeometriaCirculoAvanzada:
     """Clase principal para manejo avanzado de geometría de círculos"""
     
@@ -132,14 +146,19 @@ class GeometriaCirculoAvanzada:
         Calcula la longitud del arco del círculo que está por debajo del terreno.
         """
         intersecciones = self.calcular_intersecciones_circulo_terreno(circulo, perfil_terreno)
-        
+        return self._longitud_arco_entre_intersecciones(circulo, intersecciones)
+    
+    def _longitud_arco_entre_intersecciones(self,
+                                            circulo: CirculoFalla,
+                                            intersecciones: List[Tuple[float, float]]) -> float:
+        """Longitud del arco entre las intersecciones extremas (no modifica la lista)."""
         if len(intersecciones) < 2:
             return 0.0
             
-        # Tomar las intersecciones más extremas
-        intersecciones.sort(key=lambda p: p[0])  # Ordenar por x
-        p1 = intersecciones[0]
-        p2 = intersecciones[-1]
+        # Tomar las intersecciones más extremas (con empates en x, la primera
+        # y la última de la lista, como al ordenarla de forma estable)
+        p1 = min(intersecciones, key=lambda p: p[0])
+        p2 = max(reversed(intersecciones), key=lambda p: p[0])
         
         # Calcular ángulos desde el centro del círculo
         angulo1 = math.atan2(p1[1] - circulo.centro_y, p1[0] - circulo.centro_x)
@@ -153,21 +172,55 @@ class GeometriaCirculoAvanzada:
         # Longitud del arco = radio * ángulo
         return circulo.radio * diff_angulo
     
+    def preparar(self,
+                 circulo: CirculoFalla,
+                 perfil_terreno: List[Tuple[float, float]],
+                 estrato: Estrato,
+                 num_dovelas: int = 10) -> ContextoCirculo:
+        """
+        Calcula una sola vez intersecciones, longitud de arco y dovelas del círculo.
+        
+        Un error al crear las dovelas no se propaga: queda en error_dovelas
+        para que la validación lo informe.
+        """
+        intersecciones = self.calcular_intersecciones_circulo_terreno(circulo, perfil_terreno)
+        try:
+            dovelas = crear_dovelas(circulo, perfil_terreno, estrato, num_dovelas)
+            error_dovelas = None
+        except Exception as e:
+            dovelas = None
+            error_dovelas = e
+        
+        return ContextoCirculo(
+            intersecciones=intersecciones,
+            longitud_arco=self._longitud_arco_entre_intersecciones(circulo, intersecciones),
+            dovelas=dovelas,
+            error_dovelas=error_dovelas
+        )
+    
     def validar_circulo_completo(self, 
                                 circulo: CirculoFalla,
                                 perfil_terreno: List[Tuple[float, float]],
                                 estrato: Estrato,
-                                num_dovelas: int = 10) -> List[ResultadoValidacionCirculo]:
+                                num_dovelas: int = 10,
+                                contexto: Optional[ContextoCirculo] = None) -> List[ResultadoValidacionCirculo]:
         """
         Validación completa de un círculo de falla.
         
+        Args:
+            contexto: Resultado de preparar con los mismos argumentos; si no se
+                da, se calcula aquí
+        
         Returns:
             Lista de resultados de validación
         """
+        if contexto is None:
+            contexto = self.preparar(circulo, perfil_terreno, estrato, num_dovelas)
+        
         resultados = []
         
         # 1. Validar intersección con terreno
-        intersecciones = self.calcular_intersecciones_circulo_terreno(circulo, perfil_terreno)
+        intersecciones = contexto.intersecciones
         
         resultado_interseccion = ResultadoValidacionCirculo(
             es_valido=len(intersecciones) >= 2,
@@ -180,7 +233,7 @@ class GeometriaCirculoAvanzada:
         resultados.append(resultado_interseccion)
         
         # 2. Validar cobertura suficiente
-        longitud_arco = self.calcular_longitud_arco_terreno(circulo, perfil_terreno)
+        longitud_arco = contexto.longitud_arco
         cobertura_minima = circulo.radio * 0.5  # Al menos 50% del radio como arco
         
         resultado_cobertura = ResultadoValidacionCirculo(
@@ -229,10 +282,9 @@ class GeometriaCirculoAvanzada:
         )
         resultados.append(resultado_radio)
         
-        # 5. Intentar crear dovelas y validar
-        try:
-            dovelas = crear_dovelas(circulo, perfil_terreno, estrato, num_dovelas)
-            num_validas = len(dovelas)
+        # 5. Validar las dovelas creadas en preparar
+        if contexto.error_dovelas is None:
+            num_validas = len(contexto.dovelas)
             porcentaje_validas = (num_validas / num_dovelas) * 100
             
             resultado_dovelas = ResultadoValidacionCirculo(
@@ -245,11 +297,11 @@ class GeometriaCirculoAvanzada:
             )
             resultados.append(resultado_dovelas)
             
-        except Exception as e:
+        else:
             resultado_dovelas = ResultadoValidacionCirculo(
                 es_valido=False,
                 tipo=TipoValidacion.DOVELAS_VALIDAS,
-                mensaje=f"Error creando dovelas: {str(e)}",
+                mensaje=f"Error creando dovelas: {str(contexto.error_dovelas)}",
                 severidad="ERROR"
             )
             resultados.append(resultado_dovelas)
@@ -260,15 +312,24 @@ class GeometriaCirculoAvanzada:
                                  circulo: CirculoFalla,
                                  perfil_terreno: List[Tuple[float, float]],
                                  estrato: Estrato,
-                                 num_dovelas: int = 10) -> MetricasCirculo:
+                                 num_dovelas: int = 10,
+                                 contexto: Optional[ContextoCirculo] = None) -> MetricasCirculo:
         """
         Calcula métricas completas para un círculo.
+        
+        Args:
+            contexto: Resultado de preparar con los mismos argumentos; si no se
+                da, se calcula aquí
         """
+        if contexto is None:
+            contexto = self.preparar(circulo, perfil_terreno, estrato, num_dovelas)
+        
         # Validaciones
-        validaciones = self.validar_circulo_completo(circulo, perfil_terreno, estrato, num_dovelas)
+        validaciones = self.validar_circulo_completo(circulo, perfil_terreno, estrato, num_dovelas,
+                                                     contexto=contexto)
         
         # Métricas geométricas
-        longitud_interseccion = self.calcular_longitud_arco_terreno(circulo, perfil_terreno)
+        longitud_interseccion = contexto.longitud_arco
         cobertura_terreno = longitud_interseccion / (2 * math.pi * circulo.radio) * 100
         
         # Métricas de dovelas
@@ -277,7 +338,9 @@ class GeometriaCirculoAvanzada:
         factor_seguridad = None
         
         try:
-            dovelas = crear_dovelas(circulo, perfil_terreno, estrato, num_dovelas)
+            if contexto.error_dovelas is not None:
+                raise contexto.error_dovelas
+            dovelas = contexto.dovelas
             num_dovelas_validas = len(dovelas)
             
             # Calcular suma de fuerzas actuantes
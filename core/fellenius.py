@@ -21,12 +21,15 @@ import math
 from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 
-from data.models import Estrato, Dovela, CirculoFalla
+import numpy as np
+
+from data.models import Estrato, Dovela, DovelaArrays, CirculoFalla
 from data.validation import (
     validar_entrada_completa, validar_conjunto_dovelas, 
     validar_factor_seguridad, lanzar_si_invalido, ValidacionError
 )
 from core.geometry import crear_dovelas
+from utils.jit import njit, NUMBA_DISPONIBLE
 
 
 @dataclass
@@ -110,6 +113,58 @@ def calcular_fuerza_actuante_dovela(dovela: Dovela) -> float:
     return dovela.peso * dovela.sin_alpha
 
 
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _fuerzas_fellenius_jit(peso, cos_alpha, sin_alpha, tan_phi, cohesion, longitud_arco,
+                           presion_poros, normal_efectiva, fuerzas_r, fuerzas_a):
+    """Versión compilada de _fuerzas_fellenius: un solo recorrido por dovela."""
+    suma_r = 0.0
+    suma_a = 0.0
+    for i in range(peso.shape[0]):
+        normal = peso[i] * cos_alpha[i] - presion_poros[i] * longitud_arco[i]
+        normal_efectiva[i] = normal
+        r = cohesion[i] * longitud_arco[i] + normal * tan_phi[i]
+        if r < 0.0:
+            r = 0.0
+        fuerzas_r[i] = r
+        suma_r += r
+        a = peso[i] * sin_alpha[i]
+        fuerzas_a[i] = a
+        suma_a += a
+    return suma_r, suma_a
+
+
+def _fuerzas_fellenius(arreglos: DovelaArrays,
+                       sin_alpha: np.ndarray,
+                       cos_alpha: np.ndarray,
+                       tan_phi: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float, float]:
+    """
+    Fuerzas de Fellenius por dovela y sus sumas.
+    
+    Con numba usa el kernel compilado; sin numba, operaciones NumPy.
+    
+    Args:
+        arreglos: Dovelas en formato columnar
+        sin_alpha, cos_alpha, tan_phi: Trigonometría ya evaluada por dovela
+        
+    Returns:
+        Tupla (normal_efectiva, fuerzas_resistentes, fuerzas_actuantes,
+        Σ resistentes, Σ actuantes)
+    """
+    if NUMBA_DISPONIBLE:
+        normal_efectiva = np.empty_like(cos_alpha)
+        fuerzas_r = np.empty_like(cos_alpha)
+        fuerzas_a = np.empty_like(cos_alpha)
+        suma_r, suma_a = _fuerzas_fellenius_jit(
+            arreglos.peso, cos_alpha, sin_alpha, tan_phi, arreglos.cohesion,
+            arreglos.longitud_arco, arreglos.presion_poros, normal_efectiva, fuerzas_r, fuerzas_a)
+        return normal_efectiva, fuerzas_r, fuerzas_a, suma_r, suma_a
+    
+    normal_efectiva = arreglos.peso * cos_alpha - arreglos.presion_poros * arreglos.longitud_arco
+    fuerzas_r = np.maximum(arreglos.cohesion * arreglos.longitud_arco + normal_efectiva * tan_phi, 0.0)
+    fuerzas_a = arreglos.peso * sin_alpha
+    return normal_efectiva, fuerzas_r, fuerzas_a, float(fuerzas_r.sum()), float(fuerzas_a.sum())
+
+
 def analizar_fellenius(circulo: CirculoFalla,
                       perfil_terreno: List[Tuple[float, float]],
                       estrato: Estrato,
@@ -119,6 +174,9 @@ def analizar_fellenius(circulo: CirculoFalla,
     """
     Realiza el análisis de estabilidad usando el método de Fellenius.
     
+    El método no es iterativo: Fs = Σ[c'·ΔL + (W·cos α - u·ΔL)·tan φ'] / |Σ W·sin α|
+    se evalúa una sola vez sobre las dovelas en arreglos columnares.
+    
     Args:
         circulo: Círculo de falla a analizar
         perfil_terreno: Perfil del terreno [(x, y), ...]
@@ -164,39 +222,47 @@ def analizar_fellenius(circulo: CirculoFalla,
     elif resultado_dovelas.codigo_error:
         advertencias.append(resultado_dovelas.mensaje)
     
-    # Calcular fuerzas por dovela
-    fuerzas_resistentes = []
-    fuerzas_actuantes = []
-    dovelas_problematicas = []
-    
-    for i, dovela in enumerate(dovelas):
-        try:
-            # Fuerza resistente
-            fuerza_r = calcular_fuerza_resistente_dovela(dovela)
-            fuerzas_resistentes.append(fuerza_r)
-            
-            # Fuerza actuante
-            fuerza_a = calcular_fuerza_actuante_dovela(dovela)
-            fuerzas_actuantes.append(fuerza_a)
-            
-            # Verificar dovelas problemáticas
-            if dovela.calcular_fuerza_normal_efectiva() < 0:
-                dovelas_problematicas.append(i)
-                advertencias.append(f"Dovela {i} en tracción: N' = {dovela.calcular_fuerza_normal_efectiva():.1f} kN")
-            
-        except Exception as e:
-            raise ValidacionError(f"Error calculando fuerzas en dovela {i}: {e}")
+    # Fuerzas por dovela sobre arreglos columnares
+    arreglos = DovelaArrays.desde_dovelas(dovelas)
+    sin_alpha = arreglos.sin_alpha
+    cos_alpha = arreglos.cos_alpha
+    tan_phi = arreglos.tan_phi
+    
+    # Las comprobaciones de validar_dovela_critica sobre los arreglos; solo las
+    # dovelas sospechosas pasan por la validación escalar, que da el mensaje
+    from data.validation import validar_dovela_critica
+    sospechosas = np.flatnonzero(
+        (arreglos.ancho <= 0) | (arreglos.altura <= 0) | (arreglos.peso <= 0)
+        | (np.abs(arreglos.angulo_alpha) > math.pi / 2)
+        | (cos_alpha + sin_alpha * tan_phi <= 0)
+    )
+    for i in sospechosas.tolist():
+        resultado_validacion = validar_dovela_critica(dovelas[i])
+        if not resultado_validacion.es_valido:
+            raise ValidacionError(f"Error calculando fuerzas en dovela {i}: "
+                                  f"Dovela inválida: {resultado_validacion.mensaje}")
+    normal_efectiva, fuerzas_r, fuerzas_a, suma_resistentes, suma_actuantes = _fuerzas_fellenius(
+        arreglos, sin_alpha, cos_alpha, tan_phi)
+    
+    # Verificar dovelas problemáticas
+    dovelas_problematicas = np.flatnonzero(normal_efectiva < 0).tolist()
+    for dovela, normal in zip(dovelas, normal_efectiva.tolist()):
+        dovela.fuerza_normal_efectiva = normal
+        dovela.tiene_traccion = normal < 0
+    for i in dovelas_problematicas:
+        advertencias.append(f"Dovela {i} en tracción: N' = {normal_efectiva[i]:.1f} kN")
+    
+    fuerzas_resistentes = fuerzas_r.tolist()
+    fuerzas_actuantes = fuerzas_a.tolist()
     
     # Calcular momentos totales
-    momento_resistente = sum(fuerzas_resistentes) * circulo.radio
-    suma_actuantes = sum(fuerzas_actuantes)
+    momento_resistente = suma_resistentes * circulo.radio
     if suma_actuantes == 0:
         raise ValidacionError("Momento actuante ≤ 0: superficie de falla inválida")
     momento_actuante = abs(suma_actuantes) * circulo.radio
 
-    # Calcular factor de seguridad
-    
-    factor_seguridad = momento_resistente / momento_actuante
+    # Forma cerrada: el radio se cancela en el cociente de momentos
+    factor_seguridad = suma_resistentes / abs(suma_actuantes)
     
     # Validar factor de seguridad
     resultado_fs = validar_factor_seguridad(factor_seguridad)
@@ -208,8 +274,8 @@ def analizar_fellenius(circulo: CirculoFalla,
         'num_dovelas': len(dovelas),
         'dovelas_en_traccion': len(dovelas_problematicas),
         'porcentaje_traccion': (len(dovelas_problematicas) / len(dovelas)) * 100,
-        'suma_fuerzas_resistentes': sum(fuerzas_resistentes),
-        'suma_fuerzas_actuantes': abs(sum(fuerzas_actuantes)),
+        'suma_fuerzas_resistentes': suma_resistentes,
+        'suma_fuerzas_actuantes': abs(suma_actuantes),
         'radio_circulo': circulo.radio,
         'centro_circulo': (circulo.xc, circulo.yc),
         'metodo': 'Fellenius',
@@ -366,7 +432,8 @@ def fellenius_talud_homogeneo(altura: float,
                              phi_grados: float,
                              gamma: float,
                              factor_radio: float = 1.5,
-                             num_dovelas: int = 10) -> ResultadoFellenius:
+                             num_dovelas: int = 10,
+                             validar_entrada: bool = True) -> ResultadoFellenius:
     """
     Análisis de Fellenius para un talud homogéneo simple.
     
@@ -378,6 +445,7 @@ def fellenius_talud_homogeneo(altura: float,
         gamma: Peso específico (kN/m³)
         factor_radio: Factor para calcular radio (radio = factor_radio * altura)
         num_dovelas: Número de dovelas
+        validar_entrada: Si validar datos de entrada
         
     Returns:
         Resultado del análisis
@@ -397,7 +465,8 @@ def fellenius_talud_homogeneo(altura: float,
     # Estrato homogéneo
     estrato = Estrato(cohesion=cohesion, phi_grados=phi_grados, gamma=gamma, nombre="Homogéneo")
     
-    return analizar_fellenius(circulo, perfil, estrato, num_dovelas=num_dovelas)
+    return analizar_fellenius(circulo, perfil, estrato, num_dovelas=num_dovelas,
+                              validar_entrada=validar_entrada)
 
 
 def fellenius_con_nivel_freatico(altura: float,
@@ -408,7 +477,8 @@ def fellenius_con_nivel_freatico(altura: float,
                                 gamma_sat: float,
                                 profundidad_freatico: float,
                                 factor_radio: float = 1.5,
-                                num_dovelas: int = 10) -> ResultadoFellenius:
+                                num_dovelas: int = 10,
+                                validar_entrada: bool = True) -> ResultadoFellenius:
     """
     Análisis de Fellenius con nivel freático.
     
@@ -422,6 +492,7 @@ def fellenius_con_nivel_freatico(altura: float,
         profundidad_freatico: Profundidad del nivel freático desde la superficie (m)
         factor_radio: Factor para calcular radio
         num_dovelas: Número de dovelas
+        validar_entrada: Si validar datos de entrada
         
     Returns:
         Resultado del análisis
@@ -458,5 +529,6 @@ def fellenius_con_nivel_freatico(altura: float,
     return analizar_fellenius(
         circulo, perfil, estrato, 
         nivel_freatico=nivel_freatico, 
-        num_dovelas=num_dovelas
+        num_dovelas=num_dovelas,
+        validar_entrada=validar_entrada
     )
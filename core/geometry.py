@@ -8,11 +8,21 @@ Este módulo contiene las funciones fundamentales para:
 - Discretización de círculos de falla en dovelas
 """
 
+import logging
 import math
-from typing import List, Tuple, Optional
+from bisect import bisect_left
+from functools import lru_cache
+from typing import List, Tuple, Optional, Union
 import numpy as np
 
-from data.models import Dovela, CirculoFalla, Estrato
+from data.models import Dovela, CirculoFalla, Estrato, LoteDovelas, ALPHA_MAXIMO_DOVELA
+from logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Desde este número de dovelas crear_dovelas usa el cálculo vectorizado de
+# crear_dovelas_lote; por debajo el costo fijo de NumPy supera al bucle escalar
+MIN_DOVELAS_VECTORIZADO = 50
 
 
 def calcular_y_circulo(x: float, xc: float, yc: float, radio: float, 
@@ -33,14 +43,18 @@ def calcular_y_circulo(x: float, xc: float, yc: float, radio: float,
     Returns:
         Coordenada Y del círculo, o None si X está fuera del círculo
     """
+    # Se deja en Python a propósito: llamada desde Python, una versión @njit
+    # con firma fija cuesta más por la conversión de argumentos de numba
+    # (~0.26 µs frente a ~0.21 µs por llamada). Los kernels compilados, como
+    # _build_dovelas_kernel, calculan y_base en línea.
     # Verificar que X esté dentro del rango del círculo
-    distancia_x = abs(x - xc)
-    if distancia_x > radio:
+    dx = x - xc
+    if abs(dx) > radio:
         return None
     
-    # Calcular discriminante
-    discriminante = radio**2 - (x - xc)**2
-    if discriminante < 0:
+    # Calcular discriminante (productos directos, sin potencias)
+    discriminante = radio * radio - dx * dx
+    if discriminante < 0.0:
         return None
     
     # Calcular Y
@@ -51,7 +65,103 @@ def calcular_y_circulo(x: float, xc: float, yc: float, radio: float,
         return yc - sqrt_discriminante
 
 
-def interpolar_terreno(x: float, perfil_terreno: List[Tuple[float, float]]) -> float:
+def calcular_y_circulo_vec(x, xc: float, yc: float, radio: float,
+                           parte_superior: bool = True) -> np.ndarray:
+    """
+    Versión vectorizada de calcular_y_circulo sobre un arreglo de X.
+    
+    Args:
+        x: Coordenada o arreglo de coordenadas X
+        xc: Coordenada X del centro del círculo
+        yc: Coordenada Y del centro del círculo
+        radio: Radio del círculo
+        parte_superior: Si True, devuelve la parte superior del círculo
+        
+    Returns:
+        Coordenadas Y con la forma de x; NaN donde X está fuera del círculo
+    """
+    # r² se calcula una vez para todo el arreglo y los pasos reutilizan el
+    # mismo buffer (dx → discriminante → raíz → Y)
+    radio_cuadrado = radio * radio
+    buffer = np.array(x, dtype=float)
+    buffer -= xc
+    # Fuera del círculo se devuelve NaN, el equivalente de None en la versión
+    # escalar; con |dx| ≤ r el discriminante redondeado nunca es negativo
+    fuera = np.abs(buffer) > radio
+    np.multiply(buffer, buffer, out=buffer)
+    np.subtract(radio_cuadrado, buffer, out=buffer)
+    buffer[fuera] = np.nan
+    np.sqrt(buffer, out=buffer)
+    if parte_superior:
+        buffer += yc
+    else:
+        np.subtract(yc, buffer, out=buffer)
+    return buffer
+
+
+class InterpoladorTerreno:
+    """
+    Interpolador lineal de un perfil que recuerda el último segmento usado.
+    
+    Pensado para consultas con X creciente (recorrido de dovelas): si X cae en
+    el segmento anterior o en el siguiente se resuelve en O(1); en otro caso
+    se localiza el segmento por búsqueda binaria. Devuelve los mismos valores
+    que interpolar_terreno.
+    """
+    
+    def __init__(self, perfil_terreno: List[Tuple[float, float]]):
+        if len(perfil_terreno) < 2:
+            raise ValueError("El perfil debe tener al menos 2 puntos")
+        
+        perfil_ordenado = sorted(perfil_terreno, key=lambda punto: punto[0])
+        self.xs = [punto[0] for punto in perfil_ordenado]
+        self.ys = [punto[1] for punto in perfil_ordenado]
+        self._ultimo = 0
+    
+    def _segmento(self, x: float) -> int:
+        """Índice del primer segmento [xs[i], xs[i+1]] que contiene X."""
+        xs = self.xs
+        i = self._ultimo
+        if x <= xs[i + 1] and (i == 0 or xs[i] < x):
+            return i
+        if x > xs[i + 1] and i + 2 < len(xs) and x <= xs[i + 2]:
+            return i + 1
+        return bisect_left(xs, x, 1) - 1
+    
+    def __call__(self, x: float) -> float:
+        xs, ys = self.xs, self.ys
+        if x < xs[0] or x > xs[-1]:
+            raise ValueError(f"X={x} está fuera del rango del perfil [{xs[0]}, {xs[-1]}]")
+        
+        i = self._segmento(x)
+        self._ultimo = i
+        
+        x1, x2 = xs[i], xs[i + 1]
+        if x2 == x1:  # Evitar división por cero
+            return ys[i]
+        
+        factor = (x - x1) / (x2 - x1)
+        return ys[i] + factor * (ys[i + 1] - ys[i])
+
+
+def _clave_perfil(perfil_terreno: List[Tuple[float, float]]) -> Tuple[Tuple[float, float], ...]:
+    """Convierte un perfil en una tupla hashable (la clave depende del contenido, no de la lista)."""
+    return tuple((float(x), float(y)) for x, y in perfil_terreno)
+
+
+@lru_cache(maxsize=128)
+def _arreglos_cacheados(perfil_terreno: Tuple[Tuple[float, float], ...]) -> Tuple[np.ndarray, np.ndarray]:
+    px = np.fromiter((punto[0] for punto in perfil_terreno), dtype=float, count=len(perfil_terreno))
+    py = np.fromiter((punto[1] for punto in perfil_terreno), dtype=float, count=len(perfil_terreno))
+    orden = np.argsort(px, kind='stable')
+    px, py = px[orden], py[orden]
+    px.flags.writeable = False
+    py.flags.writeable = False
+    return px, py
+
+
+def interpolar_terreno(x: float,
+                       perfil_terreno: Union[List[Tuple[float, float]], InterpoladorTerreno]) -> float:
     """
     Interpola la elevación del terreno en una coordenada X dada.
     
@@ -59,7 +169,8 @@ def interpolar_terreno(x: float, perfil_terreno: List[Tuple[float, float]]) -> f
     
     Args:
         x: Coordenada X donde interpolar
-        perfil_terreno: Lista de tuplas (x, y) que definen el perfil
+        perfil_terreno: Lista de tuplas (x, y) que definen el perfil, o un
+            InterpoladorTerreno ya construido para consultas repetidas
         
     Returns:
         Elevación Y interpolada del terreno
@@ -67,6 +178,12 @@ def interpolar_terreno(x: float, perfil_terreno: List[Tuple[float, float]]) -> f
     Raises:
         ValueError: Si X está fuera del rango del perfil o perfil inválido
     """
+    # Para consultas repetidas sobre el mismo perfil conviene construir un
+    # InterpoladorTerreno una vez (o usar perfil_a_arreglos con la versión
+    # vectorizada) en lugar de pasar la lista en cada llamada
+    if isinstance(perfil_terreno, InterpoladorTerreno):
+        return perfil_terreno(x)
+    
     if len(perfil_terreno) < 2:
         raise ValueError("El perfil debe tener al menos 2 puntos")
     
@@ -97,6 +214,67 @@ def interpolar_terreno(x: float, perfil_terreno: List[Tuple[float, float]]) -> f
     raise ValueError(f"No se pudo interpolar para X={x}")
 
 
+def perfil_a_arreglos(perfil_terreno: List[Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convierte un perfil en arreglos (px, py) ordenados por X.
+    
+    Pensado para reutilizarse con interpolar_terreno_vec. Los arreglos se
+    memoizan por contenido del perfil, así que llamadas repetidas con el
+    mismo perfil no vuelven a ordenarlo.
+    
+    Args:
+        perfil_terreno: Lista de tuplas (x, y) que definen el perfil
+        
+    Returns:
+        Tupla (px, py) de arreglos float64 de solo lectura
+        
+    Raises:
+        ValueError: Si el perfil tiene menos de 2 puntos
+    """
+    if len(perfil_terreno) < 2:
+        raise ValueError("El perfil debe tener al menos 2 puntos")
+    
+    return _arreglos_cacheados(_clave_perfil(perfil_terreno))
+
+
+def interpolar_terreno_vec(x, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+    """
+    Versión vectorizada de interpolar_terreno sobre arreglos (px, py).
+    
+    Localiza los segmentos con np.searchsorted y aplica la misma fórmula que
+    la versión escalar, por lo que devuelve los mismos valores (incluido el
+    criterio en escalones verticales: se usa el primer segmento que contiene X).
+    
+    Args:
+        x: Coordenada o arreglo de coordenadas X
+        px: Coordenadas X del perfil, ordenadas (ver perfil_a_arreglos)
+        py: Coordenadas Y del perfil
+        
+    Returns:
+        Elevaciones interpoladas, con la forma de x
+        
+    Raises:
+        ValueError: Si algún X está fuera del rango del perfil
+    """
+    x = np.asarray(x, dtype=float)
+    if x.size and (x.min() < px[0] or x.max() > px[-1]):
+        raise ValueError(f"Hay valores de X fuera del rango del perfil [{px[0]}, {px[-1]}]")
+    
+    i = np.searchsorted(px, x, side='left') - 1
+    np.clip(i, 0, len(px) - 2, out=i)
+    x1 = px[i]
+    y1 = py[i]
+    dx = px[i + 1] - x1
+    dy = py[i + 1] - y1
+    # En escalones verticales (dx = 0) se devuelve py[i]: dividir por 1 y
+    # sumar 0 evita el contexto np.errstate, caro en arreglos pequeños
+    vertical = dx == 0
+    if vertical.any():
+        dx = np.where(vertical, 1.0, dx)
+        dy = np.where(vertical, 0.0, dy)
+    return y1 + (x - x1) / dx * dy
+
+
 def calcular_angulo_alpha(x: float, xc: float, yc: float, radio: float) -> float:
     """
     Calcula el ángulo α de la tangente al círculo en un punto X.
@@ -151,27 +329,23 @@ def calcular_longitud_arco(x1: float, x2: float, xc: float, yc: float, radio: fl
     Returns:
         Longitud del arco en metros
     """
-    # Calcular ángulos correspondientes a x1 y x2
-    try:
-        # Ángulos desde el centro del círculo
-        theta1 = math.asin((x1 - xc) / radio)
-        theta2 = math.asin((x2 - xc) / radio)
-        
-        # Diferencia angular
-        delta_theta = abs(theta2 - theta1)
-        
-        # Longitud del arco = radio * ángulo
-        longitud_arco = radio * delta_theta
-        
-        return longitud_arco
-        
-    except (ValueError, ZeroDivisionError):
-        # Si hay problemas, usar aproximación lineal
+    # Forma cerrada L = r·|asin(s2) - asin(s1)|; fuera del dominio de asin
+    # (o con radio nulo) se usa la aproximación lineal, como en crear_dovelas_lote.
+    # El dominio se comprueba antes para no pagar una excepción por dovela de borde
+    if radio == 0:
+        return abs(x2 - x1)
+    sin_theta1 = (x1 - xc) / radio
+    sin_theta2 = (x2 - xc) / radio
+    if abs(sin_theta1) > 1 or abs(sin_theta2) > 1:
         return abs(x2 - x1)
+    
+    # Longitud del arco = radio * diferencia angular
+    return radio * abs(math.asin(sin_theta2) - math.asin(sin_theta1))
 
 
 def calcular_altura_dovela(x: float, ancho: float, perfil_terreno: List[Tuple[float, float]], 
-                          xc: float, yc: float, radio: float) -> float:
+                          xc: float, yc: float, radio: float,
+                          y_terreno: Optional[float] = None) -> float:
     """
     Calcula la altura de una dovela desde el terreno hasta el círculo de falla.
     
@@ -182,6 +356,7 @@ def calcular_altura_dovela(x: float, ancho: float, perfil_terreno: List[Tuple[fl
         xc: Centro X del círculo
         yc: Centro Y del círculo
         radio: Radio del círculo
+        y_terreno: Elevación del terreno en X ya interpolada (opcional)
         
     Returns:
         Altura de la dovela en metros
@@ -190,7 +365,8 @@ def calcular_altura_dovela(x: float, ancho: float, perfil_terreno: List[Tuple[fl
         ValueError: Si no se puede calcular la altura
     """
     # Calcular elevación del terreno en el centro de la dovela
-    y_terreno = interpolar_terreno(x, perfil_terreno)
+    if y_terreno is None:
+        y_terreno = interpolar_terreno(x, perfil_terreno)
     
     # Calcular elevación del círculo (parte inferior)
     y_circulo = calcular_y_circulo(x, xc, yc, radio, parte_superior=False)
@@ -226,7 +402,8 @@ def calcular_peso_dovela(altura: float, ancho: float, gamma: float) -> float:
 
 
 def calcular_presion_poros(x: float, altura_dovela: float, perfil_terreno: List[Tuple[float, float]], 
-                          nivel_freatico: Optional[List[Tuple[float, float]]] = None) -> float:
+                          nivel_freatico: Optional[List[Tuple[float, float]]] = None,
+                          y_terreno: Optional[float] = None) -> float:
     """
     Calcula la presión de poros en la base de una dovela.
     
@@ -235,6 +412,7 @@ def calcular_presion_poros(x: float, altura_dovela: float, perfil_terreno: List[
         altura_dovela: Altura de la dovela
         perfil_terreno: Perfil del terreno
         nivel_freatico: Perfil del nivel freático (opcional)
+        y_terreno: Elevación del terreno en X ya interpolada (opcional)
         
     Returns:
         Presión de poros u en kPa
@@ -244,7 +422,8 @@ def calcular_presion_poros(x: float, altura_dovela: float, perfil_terreno: List[
     
     try:
         # Elevación del terreno y del nivel freático
-        y_terreno = interpolar_terreno(x, perfil_terreno)
+        if y_terreno is None:
+            y_terreno = interpolar_terreno(x, perfil_terreno)
         y_freatico = interpolar_terreno(x, nivel_freatico)
         
         # Elevación de la base de la dovela (donde actúa la presión)
@@ -282,78 +461,93 @@ def crear_dovelas(circulo: CirculoFalla, perfil_terreno: List[Tuple[float, float
     Raises:
         ValueError: Si no se pueden crear las dovelas
     """
-    print(f"\n--- DEBUG: Iniciando crear_dovelas ---")
-    print(f"DEBUG: Círculo: Centro=({circulo.xc}, {circulo.yc}), Radio={circulo.radio}")
-    print(f"DEBUG: Perfil: {perfil_terreno}")
-    print(f"DEBUG: Estrato: c={estrato.cohesion}, φ={estrato.phi_grados}, γ={estrato.gamma}")
-    print(f"DEBUG: Num Dovelas: {num_dovelas}")
-    print(f"DEBUG: Nivel Freático: {'Sí' if nivel_freatico else 'No'}")
+    depurar = logger.isEnabledFor(logging.DEBUG)
+    logger.debug("Iniciando crear_dovelas")
+    logger.debug("Círculo: Centro=(%s, %s), Radio=%s", circulo.xc, circulo.yc, circulo.radio)
+    logger.debug("Perfil: %s", perfil_terreno)
+    logger.debug("Estrato: c=%s, φ=%s, γ=%s", estrato.cohesion, estrato.phi_grados, estrato.gamma)
+    logger.debug("Num Dovelas: %s", num_dovelas)
+    logger.debug("Nivel Freático: %s", 'Sí' if nivel_freatico else 'No')
 
     if num_dovelas < 3:
-        print("DEBUG: Error - Se necesitan al menos 3 dovelas")
+        logger.debug("Error - Se necesitan al menos 3 dovelas")
         raise ValueError("Se necesitan al menos 3 dovelas")
     
     # Determinar el rango X del círculo que intersecta el terreno
     x_min_circulo_abs = circulo.xc - circulo.radio
     x_max_circulo_abs = circulo.xc + circulo.radio
-    print(f"DEBUG: Rango X absoluto del círculo: [{x_min_circulo_abs:.2f}, {x_max_circulo_abs:.2f}]")
+    logger.debug("Rango X absoluto del círculo: [%.2f, %.2f]", x_min_circulo_abs, x_max_circulo_abs)
     
     # Ajustar al rango del perfil del terreno
     perfil_x_min = min(punto[0] for punto in perfil_terreno)
     perfil_x_max = max(punto[0] for punto in perfil_terreno)
-    print(f"DEBUG: Rango X del perfil: [{perfil_x_min:.2f}, {perfil_x_max:.2f}]")
+    logger.debug("Rango X del perfil: [%.2f, %.2f]", perfil_x_min, perfil_x_max)
     
     x_min_efectivo = max(x_min_circulo_abs, perfil_x_min)
     x_max_efectivo = min(x_max_circulo_abs, perfil_x_max)
-    print(f"DEBUG: Rango X efectivo para dovelas: [{x_min_efectivo:.2f}, {x_max_efectivo:.2f}]")
+    logger.debug("Rango X efectivo para dovelas: [%.2f, %.2f]", x_min_efectivo, x_max_efectivo)
     
     if x_min_efectivo >= x_max_efectivo:
-        print("DEBUG: Error - El círculo no intersecta el perfil del terreno en el rango efectivo")
+        logger.debug("Error - El círculo no intersecta el perfil del terreno en el rango efectivo")
         raise ValueError("El círculo no intersecta el perfil del terreno")
     
     # Crear dovelas uniformemente espaciadas
     ancho_dovela = (x_max_efectivo - x_min_efectivo) / num_dovelas
-    print(f"DEBUG: Ancho de cada dovela: {ancho_dovela:.2f}")
+    logger.debug("Ancho de cada dovela: %.2f", ancho_dovela)
+    
+    if num_dovelas >= MIN_DOVELAS_VECTORIZADO:
+        # Discretización fina: toda la geometría en una pasada NumPy
+        lote = crear_dovelas_lote([circulo.xc], [circulo.yc], [circulo.radio],
+                                  perfil_terreno, estrato, num_dovelas, nivel_freatico)
+        # La máscara de validez del lote ya exige altura > 0, |α| ≤ 80° y
+        # arco > 0, y c, φ, γ vienen de un Estrato validado
+        dovelas = lote.circulo(0).a_dovelas(validar=False)
+        logger.debug("Dovelas vectorizadas: %d válidas de %d", len(dovelas), num_dovelas)
+        if len(dovelas) == 0:
+            raise ValueError("No se pudo crear ninguna dovela válida.")
+        return dovelas
+    
     dovelas = []
     
+    # Las dovelas se recorren con X creciente: los interpoladores reutilizan el último segmento
+    terreno = InterpoladorTerreno(perfil_terreno)
+    freatico = nivel_freatico
+    if nivel_freatico is not None and len(nivel_freatico) >= 2:
+        freatico = InterpoladorTerreno(nivel_freatico)
+    
+    # Círculo y funciones por dovela como locales del bucle
+    xc, yc, radio = circulo.xc, circulo.yc, circulo.radio
+    altura_dovela, angulo_alpha_en = calcular_altura_dovela, calcular_angulo_alpha
+    longitud_arco_entre, y_circulo = calcular_longitud_arco, calcular_y_circulo
+    
     for i in range(num_dovelas):
         # Coordenada X del centro de la dovela
         x_centro = x_min_efectivo + (i + 0.5) * ancho_dovela
-        print(f"\nDEBUG: Intentando crear dovela {i} en X_centro = {x_centro:.2f}")
+        if depurar:
+            logger.debug("Intentando crear dovela %d en X_centro = %.2f", i, x_centro)
         
         try:
+            # Elevación del terreno: una sola interpolación por dovela, que
+            # reutilizan la altura, la presión de poros y y_superficie
+            y_superficie = terreno(x_centro)
+            
             # Calcular propiedades geométricas
-            print(f"DEBUG:   Llamando calcular_altura_dovela(x_centro={x_centro:.2f}, ancho_dovela={ancho_dovela:.2f}, ...)")
-            altura = calcular_altura_dovela(x_centro, ancho_dovela, perfil_terreno, 
-                                          circulo.xc, circulo.yc, circulo.radio)
-            print(f"DEBUG:     Altura calculada: {altura:.2f}")
+            altura = altura_dovela(x_centro, ancho_dovela, terreno, xc, yc, radio, y_superficie)
             
-            print(f"DEBUG:   Llamando calcular_angulo_alpha(x_centro={x_centro:.2f}, ...)")
-            angulo_alpha = calcular_angulo_alpha(x_centro, circulo.xc, circulo.yc, circulo.radio)
-            print(f"DEBUG:     Ángulo α calculado: {angulo_alpha:.2f}°")
+            angulo_alpha = angulo_alpha_en(x_centro, xc, yc, radio)
             
             x_izq_dovela = x_centro - ancho_dovela/2
             x_der_dovela = x_centro + ancho_dovela/2
-            print(f"DEBUG:   Llamando calcular_longitud_arco(x_izq={x_izq_dovela:.2f}, x_der={x_der_dovela:.2f}, ...)")
-            longitud_arco = calcular_longitud_arco(
-                x_izq_dovela, x_der_dovela,
-                circulo.xc, circulo.yc, circulo.radio
-            )
-            print(f"DEBUG:     Longitud de arco calculada: {longitud_arco:.2f}")
+            longitud_arco = longitud_arco_entre(x_izq_dovela, x_der_dovela, xc, yc, radio)
             
             # Calcular peso
-            print(f"DEBUG:   Llamando calcular_peso_dovela(altura={altura:.2f}, ancho_dovela={ancho_dovela:.2f}, gamma={estrato.gamma})")
             peso = calcular_peso_dovela(altura, ancho_dovela, estrato.gamma)
-            print(f"DEBUG:     Peso calculado: {peso:.2f}")
             
             # Calcular presión de poros
-            print(f"DEBUG:   Llamando calcular_presion_poros(x_centro={x_centro:.2f}, altura={altura:.2f}, ...)")
-            presion_poros = calcular_presion_poros(x_centro, altura, perfil_terreno, nivel_freatico)
-            print(f"DEBUG:     Presión de poros calculada: {presion_poros:.2f}")
+            presion_poros = calcular_presion_poros(x_centro, altura, terreno, freatico, y_superficie)
 
-            # Calcular y_base y y_superficie para la dovela
-            y_superficie = interpolar_terreno(x_centro, perfil_terreno)
-            y_base = calcular_y_circulo(x_centro, circulo.xc, circulo.yc, circulo.radio, parte_superior=False)
+            # Calcular y_base para la dovela
+            y_base = y_circulo(x_centro, xc, yc, radio, parte_superior=False)
             
             # Crear dovela
             dovela = Dovela(
@@ -370,21 +564,128 @@ def crear_dovelas(circulo: CirculoFalla, perfil_terreno: List[Tuple[float, float
                 y_base=y_base,
                 y_superficie=y_superficie
             )
-            print(f"DEBUG:   Dovela {i} CREADA con éxito.")
+            if depurar:
+                logger.debug(
+                    "Dovela %d creada: altura=%.2f, α=%.2f°, arco=%.2f, peso=%.2f, u=%.2f",
+                    i, altura, math.degrees(angulo_alpha), longitud_arco, peso, presion_poros
+                )
             dovelas.append(dovela)
             
         except Exception as e:
-            print(f"DEBUG:   ERROR al crear dovela {i} en X={x_centro:.2f}: {e}. Saltando dovela.")
+            logger.debug("Error al crear dovela %d en X=%.2f: %s. Saltando dovela.", i, x_centro, e)
             continue
     
     if len(dovelas) == 0:
-        print("DEBUG: Error - No se pudo crear ninguna dovela válida.")
+        logger.debug("Error - No se pudo crear ninguna dovela válida.")
         raise ValueError("No se pudo crear ninguna dovela válida.")
         
-    print(f"--- DEBUG: crear_dovelas finalizado. {len(dovelas)} dovelas creadas. ---")
+    logger.debug("crear_dovelas finalizado. %d dovelas creadas.", len(dovelas))
     return dovelas
 
 
+def crear_dovelas_lote(xc, yc, radio, perfil_terreno: List[Tuple[float, float]],
+                       estrato: Estrato, num_dovelas: int,
+                       nivel_freatico: Optional[List[Tuple[float, float]]] = None) -> LoteDovelas:
+    """
+    Discretiza M círculos a la vez con la misma geometría que crear_dovelas.
+    
+    Cada círculo se divide en num_dovelas posiciones sobre el tramo en que se
+    superpone con el perfil. Las posiciones que crear_dovelas habría saltado
+    (fuera del círculo, altura ≤ 0, |α| > 80°, arco nulo) quedan marcadas
+    como no válidas en lugar de eliminarse, para mantener arreglos (M, n).
+    
+    Args:
+        xc: Coordenadas X de los centros (M,)
+        yc: Coordenadas Y de los centros (M,)
+        radio: Radios (M,)
+        perfil_terreno: Perfil del terreno
+        estrato: Propiedades del suelo
+        num_dovelas: Número de dovelas por círculo
+        nivel_freatico: Nivel freático (opcional)
+        
+    Returns:
+        LoteDovelas con arreglos de forma (M, num_dovelas)
+        
+    Raises:
+        ValueError: Si num_dovelas < 3 o el perfil es inválido
+    """
+    if num_dovelas < 3:
+        raise ValueError("Se necesitan al menos 3 dovelas")
+    
+    xc = np.atleast_1d(np.asarray(xc, dtype=float))
+    yc = np.atleast_1d(np.asarray(yc, dtype=float))
+    radio = np.atleast_1d(np.asarray(radio, dtype=float))
+    px, py = perfil_a_arreglos(perfil_terreno)
+    
+    # Tramo de cada círculo sobre el perfil y posiciones de las dovelas
+    x_ini = np.maximum(xc - radio, px[0])
+    x_fin = np.minimum(xc + radio, px[-1])
+    corta = x_ini < x_fin
+    ancho = np.where(corta, (x_fin - x_ini) / num_dovelas, 0.0)
+    x = x_ini[:, None] + (np.arange(num_dovelas) + 0.5) * ancho[:, None]
+    
+    # Intersección sin ramas: el discriminante se recorta a 0 y las posiciones
+    # fuera del círculo solo se descartan en la máscara final
+    xc2, yc2, r2 = xc[:, None], yc[:, None], radio[:, None]
+    dx = x - xc2
+    discriminante = r2 * r2 - dx * dx
+    en_circulo = (np.abs(dx) <= r2) & (discriminante >= 0)
+    
+    y_superficie = interpolar_terreno_vec(np.clip(x, px[0], px[-1]), px, py)
+    y_base = yc2 - np.sqrt(np.maximum(discriminante, 0.0))
+    altura = y_superficie - y_base
+    angulo_alpha = np.arcsin(np.clip(dx / r2, -1.0, 1.0))
+    
+    # Longitud de arco entre los bordes (aproximación lineal fuera del dominio de asin)
+    medio_ancho = ancho[:, None] / 2
+    x_izq = x - medio_ancho
+    x_der = x + medio_ancho
+    s_izq = (x_izq - xc2) / r2
+    s_der = (x_der - xc2) / r2
+    fuera = (np.abs(s_izq) > 1) | (np.abs(s_der) > 1)
+    longitud_arco = np.where(
+        fuera,
+        np.abs(x_der - x_izq),
+        r2 * np.abs(np.arcsin(np.clip(s_der, -1.0, 1.0)) - np.arcsin(np.clip(s_izq, -1.0, 1.0)))
+    )
+    
+    anchos = np.broadcast_to(ancho[:, None], x.shape)
+    peso = estrato.gamma * altura * anchos
+    
+    presion_poros = np.zeros_like(x)
+    if nivel_freatico is not None and len(nivel_freatico) >= 2:
+        fx, fy = perfil_a_arreglos(nivel_freatico)
+        dentro = (x >= fx[0]) & (x <= fx[-1])
+        y_freatico = interpolar_terreno_vec(np.clip(x, fx[0], fx[-1]), fx, fy)
+        y_base_dovela = y_superficie - altura
+        con_agua = dentro & (y_freatico > y_base_dovela)
+        presion_poros = np.where(con_agua, 9.81 * (y_freatico - y_base_dovela), 0.0)
+    
+    valida = (
+        corta[:, None] & en_circulo
+        & (altura > 0)
+        & (np.abs(angulo_alpha) <= ALPHA_MAXIMO_DOVELA)
+        & (longitud_arco > 0)
+    )
+    
+    forma = x.shape
+    return LoteDovelas(
+        x_centro=x,
+        ancho=np.array(anchos),
+        altura=altura,
+        angulo_alpha=angulo_alpha,
+        cohesion=np.full(forma, float(estrato.cohesion)),
+        phi_grados=np.full(forma, float(estrato.phi_grados)),
+        gamma=np.full(forma, float(estrato.gamma)),
+        peso=peso,
+        presion_poros=presion_poros,
+        longitud_arco=longitud_arco,
+        y_base=y_base,
+        y_superficie=y_superficie,
+        valida=valida
+    )
+
+
 def validar_geometria_circulo(circulo: CirculoFalla, perfil_terreno: List[Tuple[float, float]]) -> bool:
     """
     Valida que un círculo de falla tenga geometría válida respecto al terreno.
@@ -441,6 +742,9 @@ def crear_perfil_simple(x_inicio: float, y_inicio: float, x_fin: float, y_fin: f
     """
     Crea un perfil de terreno simple (línea recta).
     
+    Los puntos se memoizan por argumentos; cada llamada devuelve una lista
+    nueva, que el llamador puede modificar sin afectar a las siguientes.
+    
     Args:
         x_inicio: Coordenada X inicial
         y_inicio: Coordenada Y inicial
@@ -451,6 +755,12 @@ def crear_perfil_simple(x_inicio: float, y_inicio: float, x_fin: float, y_fin: f
     Returns:
         Lista de puntos del perfil
     """
+    return list(_perfil_simple(x_inicio, y_inicio, x_fin, y_fin, num_puntos))
+
+
+@lru_cache(maxsize=128, typed=True)
+def _perfil_simple(x_inicio: float, y_inicio: float, x_fin: float, y_fin: float,
+                   num_puntos: int) -> Tuple[Tuple[float, float], ...]:
     puntos = []
     for i in range(num_puntos):
         factor = i / (num_puntos - 1)
@@ -458,7 +768,7 @@ def crear_perfil_simple(x_inicio: float, y_inicio: float, x_fin: float, y_fin: f
         y = y_inicio + factor * (y_fin - y_inicio)
         puntos.append((x, y))
     
-    return puntos
+    return tuple(puntos)
 
 
 def crear_nivel_freatico_horizontal(x_inicio: float, x_fin: float, elevacion: float, 
@@ -466,6 +776,9 @@ def crear_nivel_freatico_horizontal(x_inicio: float, x_fin: float, elevacion: fl
     """
     Crea un nivel freático horizontal.
     
+    Como crear_perfil_simple, los puntos se memoizan por argumentos y cada
+    llamada devuelve una lista nueva.
+    
     Args:
         x_inicio: Coordenada X inicial
         x_fin: Coordenada X final
@@ -475,13 +788,19 @@ def crear_nivel_freatico_horizontal(x_inicio: float, x_fin: float, elevacion: fl
     Returns:
         Lista de puntos del nivel freático
     """
+    return list(_nivel_freatico_horizontal(x_inicio, x_fin, elevacion, num_puntos))
+
+
+@lru_cache(maxsize=128, typed=True)
+def _nivel_freatico_horizontal(x_inicio: float, x_fin: float, elevacion: float,
+                               num_puntos: int) -> Tuple[Tuple[float, float], ...]:
     puntos = []
     for i in range(num_puntos):
         factor = i / (num_puntos - 1)
         x = x_inicio + factor * (x_fin - x_inicio)
         puntos.append((x, elevacion))
     
-    return puntos
+    return tuple(puntos)
 
 
 def crear_perfil_terreno(altura: float, angulo_grados: float, 
@@ -489,6 +808,9 @@ def crear_perfil_terreno(altura: float, angulo_grados: float,
     """
     Crea un perfil de terreno simple para un talud.
     
+    Los puntos se memoizan por argumentos; cada llamada devuelve una lista
+    nueva, que el llamador puede modificar sin afectar a las siguientes.
+    
     Args:
         altura: Altura del talud en metros
         angulo_grados: Ángulo del talud en grados
@@ -498,6 +820,12 @@ def crear_perfil_terreno(altura: float, angulo_grados: float,
     Returns:
         Lista de puntos (x, y) que definen el perfil del terreno
     """
+    return list(_perfil_talud(altura, angulo_grados, longitud_base, num_puntos))
+
+
+@lru_cache(maxsize=128, typed=True)
+def _perfil_talud(altura: float, angulo_grados: float, longitud_base: Optional[float],
+                  num_puntos: int) -> Tuple[Tuple[float, float], ...]:
     if longitud_base is None:
         # Calcular longitud base basada en la altura y ángulo
         angulo_rad = math.radians(angulo_grados)
@@ -527,7 +855,7 @@ def crear_perfil_terreno(altura: float, angulo_grados: float,
         y = altura
         perfil.append((x, y))
     
-    return perfil
+    return tuple(perfil)
 
 
 def crear_nivel_freatico(altura_nf: float, perfil_terreno: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
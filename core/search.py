@@ -0,0 +1,158 @@
+"""
+Búsqueda del círculo de falla crítico con grilla gruesa y refinamiento local.
+
+La búsqueda tiene dos etapas:
+1. Grilla gruesa de centros y radios evaluada en lote con analizar_bishop_batch.
+2. Desde los mejores puntos de la grilla, minimización continua del Fs de
+   Bishop con L-BFGS-B o con el símplex de Nelder-Mead (scipy) dentro de los
+   mismos límites.
+
+Sin scipy se devuelve el mejor círculo de la grilla.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Tuple, Optional
+
+import numpy as np
+
+from logging_utils import get_logger
+from utils.lazy import lazy_import
+from data.models import Estrato, CirculoFalla
+from data.constants import MAX_FACTOR_SEGURIDAD
+from data.validation import ValidacionError
+from core.bishop import analizar_bishop_batch, analizar_bishop_cacheado
+
+logger = get_logger(__name__)
+
+# scipy.optimize solo se carga al refinar
+optimize = lazy_import("scipy.optimize")
+
+# Fs asignado a los círculos inválidos durante la minimización: mayor que
+# cualquier Fs válido, para que el minimizador se aleje de ellos
+FS_PENALIZACION = 2 * MAX_FACTOR_SEGURIDAD
+
+METODOS_REFINAMIENTO = ('L-BFGS-B', 'Nelder-Mead')
+
+
+@dataclass
+class ResultadoBusquedaCritica:
+    """
+    Resultado de buscar_circulo_critico.
+
+    Attributes:
+        circulo: Círculo con menor Fs encontrado
+        factor_seguridad: Fs de Bishop del círculo crítico
+        evaluaciones: Número de análisis de Bishop realizados (grilla + local)
+        refinado: Si el círculo proviene de la minimización local
+    """
+    circulo: CirculoFalla
+    factor_seguridad: float
+    evaluaciones: int
+    refinado: bool
+
+
+def buscar_circulo_critico(perfil_terreno: List[Tuple[float, float]],
+                           estrato: Estrato,
+                           limites_x: Tuple[float, float],
+                           limites_y: Tuple[float, float],
+                           limites_radio: Tuple[float, float],
+                           nivel_freatico: Optional[List[Tuple[float, float]]] = None,
+                           num_dovelas: int = 10,
+                           puntos_grilla: int = 5,
+                           num_semillas: int = 3,
+                           max_iteraciones: int = 30,
+                           metodo: str = 'Nelder-Mead') -> Optional[ResultadoBusquedaCritica]:
+    """
+    Busca el círculo de falla de menor factor de seguridad (Bishop).
+
+    Evalúa una grilla de puntos_grilla³ círculos en lote y refina los
+    num_semillas mejores acotando el minimizador a los mismos límites.
+    L-BFGS-B estima el gradiente por diferencias finitas; Nelder-Mead no usa
+    derivadas y tolera mejor los saltos del Fs cuando cambia el número de
+    dovelas válidas.
+
+    Args:
+        perfil_terreno: Perfil del terreno [(x, y), ...]
+        estrato: Propiedades del suelo
+        limites_x: Rango (mínimo, máximo) de la coordenada X del centro
+        limites_y: Rango (mínimo, máximo) de la coordenada Y del centro
+        limites_radio: Rango (mínimo, máximo) del radio
+        nivel_freatico: Nivel freático opcional [(x, y), ...]
+        num_dovelas: Número de dovelas para discretización
+        puntos_grilla: Puntos por dimensión de la grilla gruesa
+        num_semillas: Puntos de la grilla desde los que se refina
+        max_iteraciones: Máximo de iteraciones del minimizador por semilla
+        metodo: Minimizador local, 'L-BFGS-B' o 'Nelder-Mead'
+
+    Returns:
+        Círculo crítico, o None si ningún círculo de la grilla es válido
+
+    Raises:
+        ValueError: Si metodo no está en METODOS_REFINAMIENTO
+    """
+    if metodo not in METODOS_REFINAMIENTO:
+        raise ValueError(f"Método de refinamiento desconocido: {metodo}")
+
+    limites = [limites_x, limites_y, limites_radio]
+    ejes = [np.linspace(minimo, maximo, puntos_grilla) for minimo, maximo in limites]
+    xc, yc, radio = (eje.ravel() for eje in np.meshgrid(*ejes, indexing='ij'))
+
+    lote = analizar_bishop_batch(xc, yc, radio, perfil_terreno, estrato,
+                                 num_dovelas=num_dovelas, nivel_freatico=nivel_freatico)
+    evaluaciones = len(xc)
+    validos = np.flatnonzero(lote.convergio)
+    if validos.size == 0:
+        logger.warning("Ningún círculo de la grilla gruesa es válido")
+        return None
+
+    orden = validos[np.argsort(lote.factor_seguridad[validos], kind='stable')]
+    i = orden[0]
+    mejor = ResultadoBusquedaCritica(
+        circulo=CirculoFalla(xc=float(xc[i]), yc=float(yc[i]), radio=float(radio[i])),
+        factor_seguridad=float(lote.factor_seguridad[i]),
+        evaluaciones=evaluaciones,
+        refinado=False
+    )
+
+    if optimize is None:
+        logger.warning("scipy no disponible: se devuelve el mejor círculo de la grilla")
+        return mejor
+
+    def factor_seguridad(parametros: np.ndarray) -> float:
+        nonlocal evaluaciones
+        evaluaciones += 1
+        circulo = CirculoFalla(xc=float(parametros[0]), yc=float(parametros[1]), radio=float(parametros[2]))
+        try:
+            # Las semillas y los pasos de diferencias finitas repiten círculos
+            return analizar_bishop_cacheado(circulo, perfil_terreno, estrato, nivel_freatico,
+                                            num_dovelas=num_dovelas).factor_seguridad
+        except (ValidacionError, ValueError):
+            return FS_PENALIZACION
+
+    # Paso de diferencias finitas (L-BFGS-B) o tolerancia en posición
+    # (Nelder-Mead) proporcional al tamaño de la grilla
+    paso = min(maximo - minimo for minimo, maximo in limites) / max(puntos_grilla - 1, 1) * 1e-3
+    if metodo == 'L-BFGS-B':
+        opciones = {'maxiter': max_iteraciones, 'ftol': 1e-4, 'eps': paso}
+    else:
+        opciones = {'maxiter': max_iteraciones, 'xatol': paso, 'fatol': 1e-4}
+
+    for i in orden[:num_semillas]:
+        semilla = np.array([xc[i], yc[i], radio[i]])
+        resultado = optimize.minimize(factor_seguridad, semilla, method=metodo, bounds=limites,
+                                      options=opciones)
+        fs = float(resultado.fun)
+        if fs < mejor.factor_seguridad and math.isfinite(fs) and fs < FS_PENALIZACION:
+            x, y, r = (float(valor) for valor in resultado.x)
+            mejor = ResultadoBusquedaCritica(
+                circulo=CirculoFalla(xc=x, yc=y, radio=r),
+                factor_seguridad=fs,
+                evaluaciones=0,
+                refinado=True
+            )
+
+    mejor.evaluaciones = evaluaciones
+    logger.debug("Círculo crítico: %s, Fs=%.3f en %d evaluaciones",
+                 mejor.circulo, mejor.factor_seguridad, evaluaciones)
+    return mejor
@@ -5,7 +5,7 @@ Ajusta las validaciones para permitir geometrías técnicamente válidas de lite
 
 from data.models import CirculoFalla, Estrato
 from data.validation import validar_geometria_circulo_avanzada, ResultadoValidacion
-from core.geometry import interpolar_terreno
+from core.geometry import InterpoladorTerreno
 import math
 
 def validar_geometria_literatura_compatible(circulo, perfil_terreno, tolerancia_interseccion=0.1):
@@ -46,7 +46,8 @@ def validar_geometria_literatura_compatible(circulo, perfil_terreno, tolerancia_
         # Verificar si al menos parte del círculo está cerca del terreno
         min_distancia_terreno = float('inf')
         
-        # Revisar puntos en el círculo
+        # Revisar puntos en el círculo (el perfil se ordena una sola vez)
+        terreno = InterpoladorTerreno(perfil_terreno)
         for angulo in range(0, 360, 10):  # Cada 10 grados
             rad = math.radians(angulo)
             x_circulo = circulo.xc + circulo.radio * math.cos(rad)
@@ -55,7 +56,7 @@ def validar_geometria_literatura_compatible(circulo, perfil_terreno, tolerancia_
             # Solo considerar puntos dentro del rango horizontal del terreno
             if x_min_terreno <= x_circulo <= x_max_terreno:
                 try:
-                    y_terreno = interpolar_terreno(x_circulo, perfil_terreno)
+                    y_terreno = terreno(x_circulo)
                     distancia_vertical = abs(y_circulo - y_terreno)
                     min_distancia_terreno = min(min_distancia_terreno, distancia_vertical)
                 except:
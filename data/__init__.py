@@ -10,6 +10,11 @@ Contiene:
 from .models import (
     Estrato,
     Dovela,
+    DovelaArrays,
+    DovelaVista,
+    DOVELA_DTYPE,
+    DOVELA_DTYPE_FP32,
+    LoteDovelas,
     CirculoFalla,
     crear_estrato_homogeneo,
     crear_circulo_simple,
@@ -45,6 +50,11 @@ __all__ = [
     # Modelos
     'Estrato',
     'Dovela',
+    'DovelaArrays',
+    'DovelaVista',
+    'DOVELA_DTYPE',
+    'DOVELA_DTYPE_FP32',
+    'LoteDovelas',
     'CirculoFalla',
     'crear_estrato_homogeneo',
     'crear_circulo_simple',
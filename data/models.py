@@ -7,12 +7,54 @@ Este módulo contiene las clases principales para representar:
 - Estratos de suelo con parámetros geotécnicos
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace, InitVar
 from typing import List, Optional, Tuple
 import math
+from operator import attrgetter
 
+import numpy as np
 
-@dataclass
+# Factor de conversión de grados a radianes: mismo resultado que
+# math.radians/np.radians (que multiplican por π/180), sin la llamada
+GRADOS_A_RADIANES = math.pi / 180.0
+
+# Inclinación máxima de la base de una dovela (80°), ya en radianes
+ALPHA_MAXIMO_DOVELA = 80 * GRADOS_A_RADIANES
+
+
+def _campo_con_derivados(cls, nombre: str, crear_setter) -> None:
+    """
+    Convierte el campo `nombre` de una dataclass con slots en una propiedad.
+
+    La propiedad lee el mismo slot y su setter, crear_setter(escribir_slot),
+    escribe el slot y recalcula los campos derivados. El __init__ generado
+    también pasa por ese setter; las demás asignaciones no pagan ningún
+    __setattr__ en Python.
+    """
+    slot = getattr(cls, nombre)
+    setattr(cls, nombre, property(slot.__get__, crear_setter(slot.__set__)))
+
+
+def _setter_phi(escribir_slot):
+    """Setter de phi_grados que recalcula phi_radianes y tan_phi."""
+    def asignar(objeto, phi_grados):
+        escribir_slot(objeto, phi_grados)
+        phi_radianes = phi_grados * GRADOS_A_RADIANES
+        objeto.phi_radianes = phi_radianes
+        objeto.tan_phi = math.tan(phi_radianes)
+    return asignar
+
+
+def _setter_alpha(escribir_slot):
+    """Setter de angulo_alpha que recalcula sin_alpha y cos_alpha."""
+    def asignar(dovela, angulo_alpha):
+        escribir_slot(dovela, angulo_alpha)
+        dovela.sin_alpha = math.sin(angulo_alpha)
+        dovela.cos_alpha = math.cos(angulo_alpha)
+    return asignar
+
+
+@dataclass(slots=True)
 class Estrato:
     """
     Representa un estrato de suelo con sus parámetros geotécnicos.
@@ -23,12 +65,17 @@ class Estrato:
         gamma: Peso específico γ en kN/m³
         gamma_sat: Peso específico saturado γsat en kN/m³ (opcional)
         nombre: Nombre descriptivo del estrato (opcional)
+        phi_radianes: Ángulo de fricción en radianes (calculado)
+        tan_phi: Tangente del ángulo de fricción (calculada)
     """
     cohesion: float  # c' en kPa
     phi_grados: float  # φ' en grados
     gamma: float  # γ en kN/m³
     gamma_sat: Optional[float] = None  # γsat en kN/m³
     nombre: str = "Estrato"
+    # Derivados de phi_grados: la propiedad de phi_grados los mantiene al día
+    phi_radianes: float = field(init=False, repr=False, compare=False)
+    tan_phi: float = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validaciones básicas de parámetros geotécnicos."""
@@ -40,19 +87,13 @@ class Estrato:
             raise ValueError(f"Peso específico debe ser > 0, recibido: {self.gamma}")
         if self.gamma_sat is not None and self.gamma_sat <= self.gamma:
             raise ValueError(f"Peso específico saturado debe ser > γ, recibido: γsat={self.gamma_sat}, γ={self.gamma}")
-    
-    @property
-    def phi_radianes(self) -> float:
-        """Ángulo de fricción en radianes."""
-        return math.radians(self.phi_grados)
-    
-    @property
-    def tan_phi(self) -> float:
-        """Tangente del ángulo de fricción."""
-        return math.tan(self.phi_radianes)
 
 
-@dataclass
+
+_campo_con_derivados(Estrato, 'phi_grados', _setter_phi)
+
+
+@dataclass(slots=True)
 class Dovela:
     """
     Representa una dovela individual en el análisis de estabilidad.
@@ -73,6 +114,10 @@ class Dovela:
         longitud_arco: Longitud del arco ΔL en m
         fuerza_normal_efectiva: Fuerza normal efectiva en kN (calculada)
         tiene_traccion: Indica si la dovela está en tracción
+        phi_radianes: Ángulo de fricción en radianes (calculado)
+        tan_phi: Tangente del ángulo de fricción (calculada)
+        sin_alpha: Seno del ángulo α (calculado)
+        cos_alpha: Coseno del ángulo α (calculado)
     """
     x_centro: float
     ancho: float  # Δx
@@ -84,59 +129,47 @@ class Dovela:
     peso: float  # W en kN
     presion_poros: float  # u en kPa
     longitud_arco: float  # ΔL en m
-    y_base: Optional[float] = None  # Coordenada Y de la base de la dovela
-    y_superficie: Optional[float] = None  # Coordenada Y de la superficie de la dovela
+    y_base: float = 0.0  # Coordenada Y de la base de la dovela
+    y_superficie: float = 0.0  # Coordenada Y de la superficie de la dovela
     fuerza_normal_efectiva: float = 0.0  # N' en kN
     tiene_traccion: bool = False
-    y_base: float = 0.0
-    y_superficie: float = 0.0
+    # Derivados de phi_grados y angulo_alpha: Bishop y Fellenius los leen en
+    # cada iteración. Las propiedades de esos dos campos los mantienen al día
+    phi_radianes: float = field(init=False, repr=False, compare=False)
+    tan_phi: float = field(init=False, repr=False, compare=False)
+    sin_alpha: float = field(init=False, repr=False, compare=False)
+    cos_alpha: float = field(init=False, repr=False, compare=False)
+    # False omite las validaciones de __post_init__: solo para constructores
+    # por lotes cuyos datos ya las cumplen (DovelaArrays.a_dovelas)
+    validar: InitVar[bool] = True
 
     @property
     def ancho_dovela(self) -> float:
         """Alias para el ancho de la dovela."""
         return self.ancho
     
-    def __post_init__(self):
+    def __post_init__(self, validar: bool):
         """Validaciones básicas de geometría y parámetros."""
-        if self.ancho <= 0:
-            raise ValueError(f"Ancho de dovela debe ser > 0, recibido: {self.ancho}")
-        if self.altura <= 0:
-            raise ValueError(f"Altura de dovela debe ser > 0, recibido: {self.altura}")
-        if abs(self.angulo_alpha) > math.radians(80):
-            raise ValueError(f"Ángulo α muy pronunciado: {math.degrees(self.angulo_alpha)}°")
-        if self.cohesion < 0:
-            raise ValueError(f"Cohesión debe ser ≥ 0, recibido: {self.cohesion}")
-        if not (0 <= self.phi_grados <= 45):
-            raise ValueError(f"Ángulo de fricción debe estar entre 0-45°, recibido: {self.phi_grados}")
-        if self.gamma <= 0:
-            raise ValueError(f"Peso específico debe ser > 0, recibido: {self.gamma}")
-        if self.longitud_arco <= 0:
-            raise ValueError(f"Longitud de arco debe ser > 0, recibido: {self.longitud_arco}")
-    
-    @property
-    def phi_radianes(self) -> float:
-        """Ángulo de fricción en radianes."""
-        return math.radians(self.phi_grados)
-    
-    @property
-    def tan_phi(self) -> float:
-        """Tangente del ángulo de fricción."""
-        return math.tan(self.phi_radianes)
-    
-    @property
-    def sin_alpha(self) -> float:
-        """Seno del ángulo α."""
-        return math.sin(self.angulo_alpha)
-    
-    @property
-    def cos_alpha(self) -> float:
-        """Coseno del ángulo α."""
-        return math.cos(self.angulo_alpha)
+        if validar:
+            if self.ancho <= 0:
+                raise ValueError(f"Ancho de dovela debe ser > 0, recibido: {self.ancho}")
+            if self.altura <= 0:
+                raise ValueError(f"Altura de dovela debe ser > 0, recibido: {self.altura}")
+            if abs(self.angulo_alpha) > ALPHA_MAXIMO_DOVELA:
+                raise ValueError(f"Ángulo α muy pronunciado: {math.degrees(self.angulo_alpha)}°")
+            if self.cohesion < 0:
+                raise ValueError(f"Cohesión debe ser ≥ 0, recibido: {self.cohesion}")
+            if not (0 <= self.phi_grados <= 45):
+                raise ValueError(f"Ángulo de fricción debe estar entre 0-45°, recibido: {self.phi_grados}")
+            if self.gamma <= 0:
+                raise ValueError(f"Peso específico debe ser > 0, recibido: {self.gamma}")
+            if self.longitud_arco <= 0:
+                raise ValueError(f"Longitud de arco debe ser > 0, recibido: {self.longitud_arco}")
     
     @property
     def tan_alpha(self) -> float:
         """Tangente del ángulo α."""
-        return math.tan(self.angulo_alpha)
+        return self.sin_alpha / self.cos_alpha
     
     def calcular_fuerza_normal_efectiva(self) -> float:
         """
@@ -165,11 +198,9 @@ class Dovela:
         """
         resistencia_cohesion = self.cohesion * self.longitud_arco
         
-        if self.tiene_traccion:
-            # En tracción, solo actúa la cohesión
-            resistencia_friccion = 0.0
-        else:
-            resistencia_friccion = self.fuerza_normal_efectiva * self.tan_phi
+        # Sin rama: en tracción N' < 0 y max(N', 0) anula la fricción, de modo
+        # que solo actúa la cohesión
+        resistencia_friccion = max(self.fuerza_normal_efectiva, 0.0) * self.tan_phi
         
         return resistencia_cohesion + resistencia_friccion
     
@@ -185,7 +216,274 @@ class Dovela:
         return self.peso * self.sin_alpha
 
 
-@dataclass
+_campo_con_derivados(Dovela, 'angulo_alpha', _setter_alpha)
+_campo_con_derivados(Dovela, 'phi_grados', _setter_phi)
+
+
+@dataclass(slots=True)
+class DovelaArrays:
+    """
+    Conjunto de dovelas en formato columnar: un arreglo NumPy por atributo.
+    
+    Permite que los métodos de cálculo operen sobre todas las dovelas con
+    operaciones vectorizadas en lugar de recorrer objetos Dovela. Todos los
+    arreglos tienen la misma longitud y los ángulos están en radianes.
+    
+    Attributes:
+        x_centro: Coordenadas X de los centros de las dovelas en m
+        ancho: Anchos de las dovelas en m
+        altura: Alturas de las dovelas en m
+        angulo_alpha: Ángulos α de las bases en radianes
+        cohesion: Cohesiones efectivas c' en kPa
+        phi_grados: Ángulos de fricción φ' en grados
+        gamma: Pesos específicos en kN/m³
+        peso: Pesos de las dovelas en kN
+        presion_poros: Presiones de poros en la base en kPa
+        longitud_arco: Longitudes del arco de falla en m
+        y_base: Coordenadas Y de la base en m
+        y_superficie: Coordenadas Y de la superficie en m
+    """
+    x_centro: np.ndarray
+    ancho: np.ndarray
+    altura: np.ndarray
+    angulo_alpha: np.ndarray
+    cohesion: np.ndarray
+    phi_grados: np.ndarray
+    gamma: np.ndarray
+    peso: np.ndarray
+    presion_poros: np.ndarray
+    longitud_arco: np.ndarray
+    y_base: np.ndarray
+    y_superficie: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.x_centro)
+    
+    @property
+    def tan_phi(self) -> np.ndarray:
+        """Tangentes del ángulo de fricción."""
+        return np.tan(self.phi_grados * GRADOS_A_RADIANES)
+    
+    @property
+    def sin_alpha(self) -> np.ndarray:
+        """Senos del ángulo α."""
+        return np.sin(self.angulo_alpha)
+    
+    @property
+    def cos_alpha(self) -> np.ndarray:
+        """Cosenos del ángulo α."""
+        return np.cos(self.angulo_alpha)
+    
+    @classmethod
+    def desde_dovelas(cls, dovelas: List[Dovela]) -> 'DovelaArrays':
+        """
+        Convierte una lista de dovelas al formato columnar.
+        
+        Args:
+            dovelas: Lista de dovelas
+            
+        Returns:
+            DovelaArrays con los mismos datos
+        """
+        # Una sola pasada por dovela; la transpuesta copiada deja cada
+        # columna contigua en memoria
+        campos = tuple(cls.__dataclass_fields__)
+        fila = attrgetter(*campos)
+        tabla = np.array([fila(d) for d in dovelas], dtype=float).reshape(len(dovelas), len(campos))
+        return cls(**dict(zip(campos, tabla.T.copy())))
+    
+    @classmethod
+    def desde_estructurado(cls, registros: np.ndarray) -> 'DovelaArrays':
+        """
+        Crea la vista columnar de un arreglo estructurado DOVELA_DTYPE.
+        
+        Las columnas son vistas sobre el mismo buffer, no copias.
+        
+        Args:
+            registros: Arreglo con dtype DOVELA_DTYPE
+            
+        Returns:
+            DovelaArrays que comparte memoria con registros
+        """
+        return cls(**{nombre: registros[nombre] for nombre in cls.__dataclass_fields__})
+    
+    def a_estructurado(self, dtype: Optional[np.dtype] = None) -> np.ndarray:
+        """
+        Copia las dovelas a un arreglo estructurado DOVELA_DTYPE.
+        
+        Args:
+            dtype: Tipo de registro (DOVELA_DTYPE por defecto, o DOVELA_DTYPE_FP32)
+        
+        Returns:
+            Arreglo de longitud len(self) con un registro por dovela
+        """
+        registros = np.empty(len(self), dtype=DOVELA_DTYPE if dtype is None else dtype)
+        for nombre in self.__dataclass_fields__:
+            registros[nombre] = getattr(self, nombre)
+        return registros
+    
+    def a_dovelas(self, validar: bool = True) -> List[Dovela]:
+        """
+        Construye la lista de objetos Dovela equivalente.
+        
+        Args:
+            validar: Si False, se omiten las validaciones de Dovela; solo
+                para arreglos que ya cumplen esas condiciones (p. ej. las
+                dovelas válidas de un LoteDovelas)
+        
+        Returns:
+            Lista de dovelas, en el mismo orden que los arreglos
+        """
+        # Los campos de DovelaArrays son los primeros de Dovela y en el mismo
+        # orden: los argumentos posicionales evitan armar un dict por dovela
+        columnas = [getattr(self, nombre).tolist() for nombre in self.__dataclass_fields__]
+        return [Dovela(*valores, validar=validar) for valores in zip(*columnas)]
+
+    def con_estrato(self, estrato: Estrato) -> 'DovelaArrays':
+        """
+        Misma geometría de dovelas con las propiedades de otro estrato.
+
+        La discretización (posiciones, alturas, α, arcos, presión de poros)
+        no depende del suelo; solo c, φ, γ y el peso W = γ·h·b cambian.
+
+        Args:
+            estrato: Propiedades del suelo a asignar
+
+        Returns:
+            Nuevas dovelas en formato columnar (los arreglos geométricos se comparten)
+        """
+        n = len(self)
+        return replace(
+            self,
+            cohesion=np.full(n, float(estrato.cohesion)),
+            phi_grados=np.full(n, float(estrato.phi_grados)),
+            gamma=np.full(n, float(estrato.gamma)),
+            peso=estrato.gamma * self.altura * self.ancho
+        )
+
+
+@dataclass(slots=True)
+class LoteDovelas:
+    """
+    Dovelas de M círculos en arreglos de forma (M, n).
+    
+    Cada fila corresponde a un círculo discretizado en n posiciones; las
+    posiciones que no forman una dovela válida tienen valida=False y sus
+    valores no deben usarse. Los campos son los mismos que en DovelaArrays.
+    
+    Attributes:
+        valida: Máscara (M, n) de dovelas válidas
+    """
+    x_centro: np.ndarray
+    ancho: np.ndarray
+    altura: np.ndarray
+    angulo_alpha: np.ndarray
+    cohesion: np.ndarray
+    phi_grados: np.ndarray
+    gamma: np.ndarray
+    peso: np.ndarray
+    presion_poros: np.ndarray
+    longitud_arco: np.ndarray
+    y_base: np.ndarray
+    y_superficie: np.ndarray
+    valida: np.ndarray
+    
+    def __len__(self) -> int:
+        return self.valida.shape[0]
+    
+    def circulo(self, indice: int) -> DovelaArrays:
+        """
+        Dovelas válidas de un círculo del lote.
+        
+        Args:
+            indice: Índice del círculo (fila)
+            
+        Returns:
+            DovelaArrays con las dovelas válidas de ese círculo
+        """
+        fila = self.valida[indice]
+        return DovelaArrays(**{nombre: getattr(self, nombre)[indice][fila]
+                               for nombre in DovelaArrays.__dataclass_fields__})
+    
+    @classmethod
+    def apilar(cls, lotes: List['LoteDovelas']) -> 'LoteDovelas':
+        """
+        Une varios lotes con el mismo número de posiciones por círculo.
+        
+        Args:
+            lotes: Lotes de forma (M_i, n)
+            
+        Returns:
+            Lote de forma (ΣM_i, n), en el orden recibido
+        """
+        return cls(**{nombre: np.concatenate([getattr(lote, nombre) for lote in lotes])
+                      for nombre in cls.__dataclass_fields__})
+    
+    def a_tipo(self, dtype) -> 'LoteDovelas':
+        """
+        Mismo lote con los campos numéricos convertidos a otro tipo.
+        
+        Args:
+            dtype: Tipo de punto flotante destino (p. ej. np.float32)
+            
+        Returns:
+            Nuevo lote (la máscara valida se comparte)
+        """
+        return replace(self, **{nombre: getattr(self, nombre).astype(dtype, copy=False)
+                                for nombre in DovelaArrays.__dataclass_fields__})
+
+
+# Registro de una dovela para arreglos estructurados: mismos campos que DovelaArrays
+DOVELA_DTYPE = np.dtype([(nombre, 'f8') for nombre in DovelaArrays.__dataclass_fields__])
+# Variante en precisión simple: mitad de memoria y de tráfico por dovela
+DOVELA_DTYPE_FP32 = np.dtype([(nombre, 'f4') for nombre in DovelaArrays.__dataclass_fields__])
+
+
+class DovelaVista:
+    """
+    Acceso por atributos a un registro de un arreglo DOVELA_DTYPE.
+    
+    Expone los mismos campos y propiedades trigonométricas que Dovela sin
+    copiar datos ni repetir las validaciones de construcción, para código que
+    todavía trabaja dovela a dovela.
+    """
+    __slots__ = ('_registro',)
+    
+    def __init__(self, registro):
+        self._registro = registro
+    
+    def __getattr__(self, nombre: str) -> float:
+        if nombre in DOVELA_DTYPE.names:
+            return float(self._registro[nombre])
+        raise AttributeError(f"'DovelaVista' no tiene el atributo '{nombre}'")
+    
+    @property
+    def phi_radianes(self) -> float:
+        """Ángulo de fricción en radianes."""
+        return self.phi_grados * GRADOS_A_RADIANES
+    
+    @property
+    def tan_phi(self) -> float:
+        """Tangente del ángulo de fricción."""
+        return math.tan(self.phi_radianes)
+    
+    @property
+    def sin_alpha(self) -> float:
+        """Seno del ángulo α."""
+        return math.sin(self.angulo_alpha)
+    
+    @property
+    def cos_alpha(self) -> float:
+        """Coseno del ángulo α."""
+        return math.cos(self.angulo_alpha)
+    
+    @property
+    def tan_alpha(self) -> float:
+        """Tangente del ángulo α."""
+        return math.tan(self.angulo_alpha)
+
+
+@dataclass(slots=True)
 class CirculoFalla:
     """
     Representa un círculo de falla para análisis de estabilidad.
@@ -219,6 +517,16 @@ class CirculoFalla:
         if self.radio <= 0:
             raise ValueError(f"Radio debe ser > 0, recibido: {self.radio}")
     
+    @property
+    def centro_x(self) -> float:
+        """Alias de xc usado por los módulos de geometría y optimización de círculos."""
+        return self.xc
+    
+    @property
+    def centro_y(self) -> float:
+        """Alias de yc usado por los módulos de geometría y optimización de círculos."""
+        return self.yc
+    
     @property
     def num_dovelas(self) -> int:
         """Número de dovelas en el círculo."""
@@ -243,6 +551,25 @@ class CirculoFalla:
         """
         self.dovelas.append(dovela)
     
+    def agregar_dovelas_lote(self, dovelas: DovelaArrays) -> None:
+        """
+        Agrega de una vez las dovelas dadas en formato columnar.
+        
+        Args:
+            dovelas: Dovelas a agregar
+        """
+        self.dovelas.extend(dovelas.a_dovelas())
+    
+    def dovelas_arreglos(self) -> DovelaArrays:
+        """
+        Dovelas del círculo en formato columnar.
+        
+        Returns:
+            DovelaArrays con los datos de self.dovelas, para operar con los
+            métodos vectorizados (analizar_bishop_soa, etc.)
+        """
+        return DovelaArrays.desde_dovelas(self.dovelas)
+    
     def validar_geometria(self) -> bool:
         """
         Valida que la geometría del círculo sea correcta.
@@ -259,7 +586,7 @@ class CirculoFalla:
             if dovela.altura <= 0:
                 self.es_valido = False
                 return False
-            if abs(dovela.angulo_alpha) > math.radians(80):
+            if abs(dovela.angulo_alpha) > ALPHA_MAXIMO_DOVELA:
                 self.es_valido = False
                 return False
         
@@ -313,8 +640,9 @@ class CirculoFalla:
             info.append(f"  Convergió: {'Sí' if self.convergio_bishop else 'No'}")
             info.append(f"  Iteraciones: {self.iteraciones_bishop}")
         
-        if self.tiene_dovelas_en_traccion():
-            traccion_indices = self.obtener_dovelas_en_traccion()
+        # Un solo recorrido: la lista vacía equivale a no tener dovelas en tracción
+        traccion_indices = self.obtener_dovelas_en_traccion()
+        if traccion_indices:
             info.append(f"  Dovelas en tracción: {traccion_indices}")
         
         return "\n".join(info)
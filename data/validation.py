@@ -10,14 +10,23 @@ Este módulo contiene todas las validaciones necesarias para garantizar:
 """
 
 import math
-from typing import List, Tuple, Optional, Dict, Any
+from itertools import pairwise
+from typing import List, Tuple, Optional, Dict, Any, Union
 from dataclasses import dataclass
 
-from data.models import Estrato, Dovela, CirculoFalla
+import numpy as np
+
+from data.models import Estrato, Dovela, DovelaArrays, CirculoFalla
 from data.constants import TOLERANCIA_CONVERGENCIA_BISHOP, MAX_ITERACIONES_BISHOP
+from utils.jit import njit, NUMBA_DISPONIBLE
+
+# (cos, sin) de los puntos del perímetro revisados cada 10 grados
+_PERIMETRO_CADA_10_GRADOS = tuple(
+    (math.cos(math.radians(angulo)), math.sin(math.radians(angulo))) for angulo in range(0, 360, 10)
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultadoValidacion:
     """
     Resultado de una validación con detalles del error si existe.
@@ -148,7 +157,7 @@ def validar_geometria_circulo_avanzada(circulo: CirculoFalla,
         )
     
     # Validar que el centro esté en posición razonable
-    from core.geometry import interpolar_terreno, calcular_y_circulo
+    from core.geometry import interpolar_terreno, calcular_y_circulo, InterpoladorTerreno
 
     # Verificar que el círculo intersecta o está cerca del terreno
     intersecta = False
@@ -178,15 +187,15 @@ def validar_geometria_circulo_avanzada(circulo: CirculoFalla,
     # Si no intersecta directamente, verificar distancia mínima
     if not intersecta:
         # Revisar puntos en el perímetro del círculo
-        for angulo in range(0, 360, 10):  # Cada 10 grados
-            rad = math.radians(angulo)
-            x_circulo = circulo.xc + circulo.radio * math.cos(rad)
-            y_circulo = circulo.yc + circulo.radio * math.sin(rad)
+        terreno = InterpoladorTerreno(perfil_terreno)
+        for cos_angulo, sin_angulo in _PERIMETRO_CADA_10_GRADOS:
+            x_circulo = circulo.xc + circulo.radio * cos_angulo
+            y_circulo = circulo.yc + circulo.radio * sin_angulo
             
             # Solo considerar puntos dentro del rango horizontal del terreno
             if x_min_terreno <= x_circulo <= x_max_terreno:
                 try:
-                    y_terreno = interpolar_terreno(x_circulo, perfil_terreno)
+                    y_terreno = terreno(x_circulo)
                     distancia_vertical = abs(y_circulo - y_terreno)
                     min_distancia_terreno = min(min_distancia_terreno, distancia_vertical)
                 except:
@@ -300,12 +309,12 @@ def validar_dovela_critica(dovela: Dovela) -> ResultadoValidacion:
     )
 
 
-def validar_conjunto_dovelas(dovelas: List[Dovela]) -> ResultadoValidacion:
+def validar_conjunto_dovelas(dovelas: Union[List[Dovela], DovelaArrays]) -> ResultadoValidacion:
     """
     Valida un conjunto de dovelas como sistema.
     
     Args:
-        dovelas: Lista de dovelas a validar
+        dovelas: Lista de dovelas a validar, o las mismas en formato columnar
         
     Returns:
         Resultado de la validación
@@ -327,18 +336,29 @@ def validar_conjunto_dovelas(dovelas: List[Dovela]) -> ResultadoValidacion:
         )
     
     # Contar dovelas problemáticas
-    dovelas_en_traccion = 0
-    dovelas_m_alpha_problematico = 0
-    
-    for i, dovela in enumerate(dovelas):
-        # Verificar tracción
-        if dovela.calcular_fuerza_normal_efectiva() < 0:
-            dovelas_en_traccion += 1
+    if isinstance(dovelas, DovelaArrays):
+        cos_alpha = dovelas.cos_alpha
+        normal_efectiva = dovelas.peso * cos_alpha - dovelas.presion_poros * dovelas.longitud_arco
+        dovelas_en_traccion = int(np.count_nonzero(normal_efectiva < 0))
+        m_alpha = cos_alpha + dovelas.sin_alpha * dovelas.tan_phi
+        dovelas_m_alpha_problematico = int(np.count_nonzero(m_alpha <= 0))
+    else:
+        # Con pocas decenas de dovelas pasarlas a arreglos cuesta más que
+        # recorrerlas; el recorrido usa los senos y cosenos ya calculados en
+        # cada Dovela y evita la llamada a calcular_fuerza_normal_efectiva
+        dovelas_en_traccion = 0
+        dovelas_m_alpha_problematico = 0
         
-        # Verificar mα
-        m_alpha = dovela.cos_alpha + (dovela.sin_alpha * dovela.tan_phi)
-        if m_alpha <= 0:
-            dovelas_m_alpha_problematico += 1
+        for dovela in dovelas:
+            # Verificar tracción (deja N' y tiene_traccion en la dovela, igual
+            # que calcular_fuerza_normal_efectiva)
+            normal = dovela.peso * dovela.cos_alpha - dovela.presion_poros * dovela.longitud_arco
+            dovela.fuerza_normal_efectiva = normal
+            dovela.tiene_traccion = normal < 0
+            dovelas_en_traccion += dovela.tiene_traccion
+            
+            # Verificar mα
+            dovelas_m_alpha_problematico += dovela.cos_alpha + dovela.sin_alpha * dovela.tan_phi <= 0
     
     # Verificar porcentaje de dovelas problemáticas
     porcentaje_traccion = (dovelas_en_traccion / len(dovelas)) * 100
@@ -362,11 +382,15 @@ def validar_conjunto_dovelas(dovelas: List[Dovela]) -> ResultadoValidacion:
         )
     
     # Validar continuidad espacial (dovelas deben estar ordenadas)
-    for i in range(len(dovelas) - 1):
-        if dovelas[i].x_centro >= dovelas[i+1].x_centro:
+    if isinstance(dovelas, DovelaArrays):
+        x_centro = dovelas.x_centro.tolist()
+    else:
+        x_centro = [dovela.x_centro for dovela in dovelas]
+    for i in range(len(x_centro) - 1):
+        if x_centro[i] >= x_centro[i+1]:
             return ResultadoValidacion(
                 es_valido=False,
-                mensaje=f"Dovelas no ordenadas: dovela {i} (x={dovelas[i].x_centro}) >= dovela {i+1} (x={dovelas[i+1].x_centro})",
+                mensaje=f"Dovelas no ordenadas: dovela {i} (x={x_centro[i]}) >= dovela {i+1} (x={x_centro[i+1]})",
                 codigo_error="DOVELAS_NO_ORDENADAS"
             )
     
@@ -380,13 +404,68 @@ def validar_conjunto_dovelas(dovelas: List[Dovela]) -> ResultadoValidacion:
     )
 
 
-def validar_convergencia_bishop(factores_seguridad: List[float], 
+# Estados de _estado_convergencia
+_CONVERGENCIA = 0
+_CONTINUA = 1
+_FS_INVALIDO = 2
+_NO_CONVERGENCIA = 3
+_POSIBLE_DIVERGENCIA = 4
+
+
+@njit(cache=True)
+def _estado_diferencias(fs, iteracion, tolerancia, max_iteraciones):
+    """Estado según las últimas diferencias de un historial sin valores inválidos."""
+    n = fs.shape[0]
+    diferencia = abs(fs[n - 1] - fs[n - 2])
+    if diferencia < tolerancia:
+        return _CONVERGENCIA, -1, diferencia, 0.0
+    if iteracion >= max_iteraciones:
+        return _NO_CONVERGENCIA, -1, diferencia, 0.0
+    if n >= 3:
+        diferencia_anterior = abs(fs[n - 2] - fs[n - 3])
+        if diferencia > 2 * diferencia_anterior and diferencia > 0.1:
+            return _POSIBLE_DIVERGENCIA, -1, diferencia, diferencia_anterior
+    return _CONTINUA, -1, diferencia, 0.0
+
+
+# Sin fastmath: la búsqueda de NaN e infinitos debe respetar IEEE 754
+@njit(cache=True)
+def _estado_convergencia_jit(fs, iteracion, tolerancia, max_iteraciones):
+    """Versión compilada de _estado_convergencia: un solo recorrido del historial."""
+    for i in range(fs.shape[0]):
+        if not fs[i] > 0.0 or fs[i] == np.inf:
+            return _FS_INVALIDO, i, 0.0, 0.0
+    return _estado_diferencias(fs, iteracion, tolerancia, max_iteraciones)
+
+
+def _estado_convergencia(fs: np.ndarray, iteracion: int) -> Tuple[int, int, float, float]:
+    """
+    Clasifica un historial de Fs de Bishop (al menos 2 valores).
+    
+    Con numba usa el kernel compilado; sin numba, operaciones NumPy.
+    
+    Returns:
+        Tupla (estado, índice del primer Fs inválido o -1, Δ última,
+        Δ anterior)
+    """
+    if NUMBA_DISPONIBLE:
+        return _estado_convergencia_jit(fs, iteracion, TOLERANCIA_CONVERGENCIA_BISHOP,
+                                        MAX_ITERACIONES_BISHOP)
+    
+    invalidos = ~(fs > 0) | np.isinf(fs)
+    if invalidos.any():
+        return _FS_INVALIDO, int(invalidos.argmax()), 0.0, 0.0
+    return _estado_diferencias(fs, iteracion, TOLERANCIA_CONVERGENCIA_BISHOP, MAX_ITERACIONES_BISHOP)
+
+
+def validar_convergencia_bishop(factores_seguridad: Union[List[float], np.ndarray],
                                iteracion: int) -> ResultadoValidacion:
     """
     Valida la convergencia del método Bishop iterativo.
     
     Args:
-        factores_seguridad: Lista de factores de seguridad de iteraciones
+        factores_seguridad: Factores de seguridad de las iteraciones (lista o
+            arreglo; un arreglo float64 se revisa sin copiarlo)
         iteracion: Número de iteración actual
         
     Returns:
@@ -398,28 +477,26 @@ def validar_convergencia_bishop(factores_seguridad: List[float],
             mensaje="Insuficientes iteraciones para evaluar convergencia"
         )
     
-    # Verificar que no haya valores inválidos
-    for i, fs in enumerate(factores_seguridad):
-        if fs <= 0 or math.isnan(fs) or math.isinf(fs):
-            return ResultadoValidacion(
-                es_valido=False,
-                mensaje=f"Factor de seguridad inválido en iteración {i}: {fs}",
-                codigo_error="FS_INVALIDO",
-                valor_problematico=fs
-            )
+    estado, i, diferencia, diferencia_anterior = _estado_convergencia(
+        np.asarray(factores_seguridad, dtype=np.float64), iteracion)
+    diferencia = float(diferencia)
     
-    # Calcular diferencia entre últimas dos iteraciones
-    diferencia = abs(factores_seguridad[-1] - factores_seguridad[-2])
+    if estado == _FS_INVALIDO:
+        fs = factores_seguridad[i]
+        return ResultadoValidacion(
+            es_valido=False,
+            mensaje=f"Factor de seguridad inválido en iteración {i}: {fs}",
+            codigo_error="FS_INVALIDO",
+            valor_problematico=fs
+        )
     
-    # Verificar convergencia
-    if diferencia < TOLERANCIA_CONVERGENCIA_BISHOP:
+    if estado == _CONVERGENCIA:
         return ResultadoValidacion(
             es_valido=True,
             mensaje=f"Convergencia alcanzada en iteración {iteracion}: Δ={diferencia:.6f} < {TOLERANCIA_CONVERGENCIA_BISHOP}"
         )
     
-    # Verificar máximo de iteraciones
-    if iteracion >= MAX_ITERACIONES_BISHOP:
+    if estado == _NO_CONVERGENCIA:
         return ResultadoValidacion(
             es_valido=False,
             mensaje=f"Máximo de iteraciones alcanzado ({MAX_ITERACIONES_BISHOP}): Δ={diferencia:.6f}",
@@ -427,16 +504,13 @@ def validar_convergencia_bishop(factores_seguridad: List[float],
             valor_problematico=diferencia
         )
     
-    # Verificar divergencia (diferencia creciente)
-    if len(factores_seguridad) >= 3:
-        diferencia_anterior = abs(factores_seguridad[-2] - factores_seguridad[-3])
-        if diferencia > 2 * diferencia_anterior and diferencia > 0.1:
-            return ResultadoValidacion(
-                es_valido=False,
-                mensaje=f"Posible divergencia detectada: Δ={diferencia:.4f} > 2×Δ_anterior={2*diferencia_anterior:.4f}",
-                codigo_error="POSIBLE_DIVERGENCIA",
-                valor_problematico=diferencia
-            )
+    if estado == _POSIBLE_DIVERGENCIA:
+        return ResultadoValidacion(
+            es_valido=False,
+            mensaje=f"Posible divergencia detectada: Δ={diferencia:.4f} > 2×Δ_anterior={2*diferencia_anterior:.4f}",
+            codigo_error="POSIBLE_DIVERGENCIA",
+            valor_problematico=diferencia
+        )
     
     return ResultadoValidacion(
         es_valido=True,
@@ -512,29 +586,26 @@ def validar_perfil_terreno(perfil: List[Tuple[float, float]]) -> ResultadoValida
             valor_problematico=len(perfil)
         )
     
-    # Verificar que esté ordenado por X
-    for i in range(len(perfil) - 1):
-        if perfil[i][0] >= perfil[i+1][0]:
+    # Verificar que esté ordenado por X. Los perfiles tienen pocas decenas de
+    # puntos: convertirlos a un arreglo NumPy cuesta más que recorrerlos
+    for i, ((x0, _), (x1, _)) in enumerate(pairwise(perfil)):
+        if x0 >= x1:
             return ResultadoValidacion(
                 es_valido=False,
-                mensaje=f"Perfil no ordenado: x[{i}]={perfil[i][0]} >= x[{i+1}]={perfil[i+1][0]}",
+                mensaje=f"Perfil no ordenado: x[{i}]={x0} >= x[{i+1}]={x1}",
                 codigo_error="PERFIL_NO_ORDENADO"
             )
     
-    # Verificar pendientes extremas
-    for i in range(len(perfil) - 1):
-        dx = perfil[i+1][0] - perfil[i][0]
-        dy = perfil[i+1][1] - perfil[i][1]
-        
-        if dx > 0:
-            pendiente = abs(dy / dx)
-            if pendiente > 10.0:  # Pendiente > 10:1
-                return ResultadoValidacion(
-                    es_valido=False,
-                    mensaje=f"Pendiente extrema entre puntos {i} y {i+1}: {pendiente:.1f} > 10.0",
-                    codigo_error="PENDIENTE_EXTREMA",
-                    valor_problematico=pendiente
-                )
+    # Verificar pendientes extremas (ya ordenado, dx > 0 en todos los tramos)
+    for i, ((x0, y0), (x1, y1)) in enumerate(pairwise(perfil)):
+        pendiente = abs((y1 - y0) / (x1 - x0))
+        if pendiente > 10.0:  # Pendiente > 10:1
+            return ResultadoValidacion(
+                es_valido=False,
+                mensaje=f"Pendiente extrema entre puntos {i} y {i+1}: {pendiente:.1f} > 10.0",
+                codigo_error="PENDIENTE_EXTREMA",
+                valor_problematico=pendiente
+            )
     
     return ResultadoValidacion(
         es_valido=True,
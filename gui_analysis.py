@@ -3,7 +3,12 @@ Módulo de análisis para la GUI.
 Convierte parámetros de la GUI al formato requerido por el core.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
+
+import numpy as np
+
+from logging_utils import get_logger
 from data.models import CirculoFalla, Estrato
 from core.geometry import crear_perfil_terreno, crear_nivel_freatico, validar_geometria_basica
 from core.bishop import analizar_bishop
@@ -17,6 +22,16 @@ except ImportError:
     LIMITES_DISPONIBLES = False
     print(" Advertencia: Sistema de límites automáticos no disponible")
 
+logger = get_logger(__name__)
+
+# Una fila por valor del análisis paramétrico; Fs es NaN si el análisis falló
+RESULTADO_PARAMETRICO_DTYPE = np.dtype([
+    ('valor', 'f8'),
+    ('valido', '?'),
+    ('fs_bishop', 'f8'),
+    ('fs_fellenius', 'f8'),
+])
+
 
 def validar_parametros_gui(params: Dict[str, Any]) -> Tuple[bool, str]:
     """
@@ -153,8 +168,7 @@ def analizar_desde_gui(params: Dict[str, Any]) -> Dict[str, Any]:
             except Exception as e:
                 # Si falla el sistema de límites, continuar con círculo original
                 print(f" Error en límites automáticos: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.debug("Fallo en límites automáticos", exc_info=True)
                 mensaje_limites = f"  No se pudieron aplicar límites automáticos: {e}"
         else:
             print("  Sistema de límites automáticos no disponible")
@@ -212,57 +226,74 @@ def analizar_desde_gui(params: Dict[str, Any]) -> Dict[str, Any]:
         return respuesta
         
     except Exception as e:
-        import traceback
+        # Los barridos paramétricos prueban muchos casos inválidos: la traza
+        # solo se formatea si el nivel DEBUG está activo
+        logger.debug("Análisis falló", exc_info=True)
         return {
             'valido': False,
             'error': str(e),
-            'tipo_error': 'analisis',
-            'traceback': traceback.format_exc()
+            'tipo_error': 'analisis'
         }
 
 
+def _analizar_valor_parametrico(params: Dict[str, Any]) -> Tuple[bool, float, float, Optional[str]]:
+    """
+    Analiza un punto del barrido paramétrico (puede ejecutarse en un proceso del pool).
+    
+    Devuelve solo los Fs para no serializar los resultados completos entre procesos.
+    
+    Returns:
+        Tupla (válido, Fs Bishop, Fs Fellenius, mensaje de error)
+    """
+    resultado = analizar_desde_gui(params)
+    if resultado['valido']:
+        return True, resultado['bishop'].factor_seguridad, resultado['fellenius'].factor_seguridad, None
+    return False, np.nan, np.nan, resultado['error']
+
+
 def analizar_parametrico_gui(params_base: Dict[str, Any], 
                            parametro: str, 
-                           valores: List[float]) -> Dict[str, Any]:
+                           valores: List[float],
+                           procesos: int = 1) -> Dict[str, Any]:
     """
     Ejecuta análisis paramétrico variando un parámetro.
     
+    Los valores son independientes entre sí: con procesos > 1 se reparten
+    entre un ProcessPoolExecutor, lo que compensa el arranque de los procesos
+    solo en barridos largos.
+    
     Args:
         params_base: Parámetros base
         parametro: Nombre del parámetro a variar
         valores: Lista de valores para el parámetro
+        procesos: Número de procesos; 1 analiza en el proceso actual
         
     Returns:
-        Diccionario con resultados del análisis paramétrico
+        Diccionario con 'resultados' (arreglo RESULTADO_PARAMETRICO_DTYPE, una
+        fila por valor) y 'errores' ({valor: mensaje} de los análisis fallidos)
     """
-    resultados = []
+    resultados = np.empty(len(valores), dtype=RESULTADO_PARAMETRICO_DTYPE)
+    resultados['valor'] = valores
+    errores = {}
     
-    for valor in valores:
-        # Crear copia de parámetros
-        params_temp = params_base.copy()
-        params_temp[parametro] = valor
-        
-        # Ejecutar análisis
-        resultado = analizar_desde_gui(params_temp)
-        
-        if resultado['valido']:
-            resultados.append({
-                'valor': valor,
-                'fs_bishop': resultado['bishop'].factor_seguridad,
-                'fs_fellenius': resultado['fellenius'].factor_seguridad,
-                'valido': True
-            })
-        else:
-            resultados.append({
-                'valor': valor,
-                'error': resultado['error'],
-                'valido': False
-            })
+    # Una copia de los parámetros base por valor
+    barrido = [dict(params_base, **{parametro: valor}) for valor in valores]
+    if procesos > 1:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            analisis = list(ejecutor.map(_analizar_valor_parametrico, barrido))
+    else:
+        analisis = [_analizar_valor_parametrico(params) for params in barrido]
+    
+    for i, (valido, fs_bishop, fs_fellenius, error) in enumerate(analisis):
+        resultados[i] = (valores[i], valido, fs_bishop, fs_fellenius)
+        if not valido:
+            errores[valores[i]] = error
     
     return {
         'parametro': parametro,
         'resultados': resultados,
-        'valido': len([r for r in resultados if r['valido']]) > 0
+        'errores': errores,
+        'valido': bool(resultados['valido'].any())
     }
 
 
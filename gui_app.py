@@ -8,6 +8,7 @@ from logging_utils import get_logger
 import tkinter as tk
 import tkinter.messagebox as messagebox
 import threading
+from typing import Optional
 logger = get_logger(__name__)
 import numpy as np
 
@@ -19,13 +20,13 @@ from gui_dialogs import ParametricDialog
 class SlopeStabilityApp:
     """Aplicación principal para análisis de estabilidad de taludes."""
     
-    def __init__(self):
+    def __init__(self, root: Optional[ctk.CTk] = None):
         # Configurar tema
         ctk.set_appearance_mode("light")
         ctk.set_default_color_theme("blue")
         
-        # Crear ventana principal
-        self.root = ctk.CTk()
+        # Crear ventana principal (o reutilizar una existente, p. ej. en tests)
+        self.root = root if root is not None else ctk.CTk()
         self.setup_window()
         
         # Variables de estado
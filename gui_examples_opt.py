@@ -1,6 +1,23 @@
 # Casos de ejemplo optimizados automáticamente para FS realistas
+#
+# Los datos los escribe optimizar_circulos.generar_nuevo_gui en
+# gui_examples_opt.json y se cargan al acceder a CASOS_EJEMPLO. El JSON se
+# parsea una vez por versión del archivo: si se regenera, el siguiente acceso
+# lo vuelve a leer.
 
 import math
+from functools import lru_cache
+from pathlib import Path
+
+# orjson es opcional: si está instalado parsea los bytes del archivo
+# directamente; si no, json de la biblioteca estándar da el mismo resultado
+try:
+    from orjson import loads as _cargar_json
+except ImportError:  # pragma: no cover - depende del entorno
+    from json import loads as _cargar_json
+
+RUTA_CASOS = Path(__file__).with_name('gui_examples_opt.json')
+
 
 def calcular_perfil_terreno(altura, angulo_talud, longitud_total=40):
     angulo_rad = math.radians(angulo_talud)
@@ -12,133 +29,19 @@ def calcular_perfil_terreno(altura, angulo_talud, longitud_total=40):
         (longitud_total, 0)
     ]
 
-CASOS_EJEMPLO = {
-    "Talud Estable - Carretera": {
-        "descripcion": "Talud t\u00edpico de carretera con factor de seguridad alto",
-        "altura": 8.0,
-        "angulo_talud": 35.0,
-        "cohesion": 35.0,
-        "phi_grados": 30.0,
-        "gamma": 19.0,
-        "con_agua": false,
-        "nivel_freatico": 0.0,
-        "centro_x": 17.0,
-        "centro_y": 8.0,
-        "radio": 20.0,
-        "esperado": "Fs > 1.5 (ESTABLE)",
-        "perfil_terreno": [
-            [
-                0,
-                8.0
-            ],
-            [
-                12.0,
-                8.0
-            ],
-            [
-                23.425184053936917,
-                0
-            ],
-            [
-                40,
-                0
-            ]
-        ]
-    },
-    "Talud Marginal - Arcilla Blanda": {
-        "descripcion": "Talud en arcilla blanda con factor de seguridad l\u00edmite",
-        "altura": 10.0,
-        "angulo_talud": 45.0,
-        "cohesion": 12.0,
-        "phi_grados": 20.0,
-        "gamma": 18.0,
-        "con_agua": false,
-        "nivel_freatico": 0.0,
-        "centro_x": 17.0,
-        "centro_y": 10.0,
-        "radio": 18.0,
-        "esperado": "1.2 < Fs < 1.4 (MARGINAL)",
-        "perfil_terreno": [
-            [
-                0,
-                10.0
-            ],
-            [
-                12.0,
-                10.0
-            ],
-            [
-                22.0,
-                0
-            ],
-            [
-                40,
-                0
-            ]
-        ]
-    },
-    "Talud con Agua - Cr\u00edtico": {
-        "descripcion": "Talud con nivel fre\u00e1tico alto, condici\u00f3n cr\u00edtica",
-        "altura": 8.0,
-        "angulo_talud": 40.0,
-        "cohesion": 20.0,
-        "phi_grados": 25.0,
-        "gamma": 18.0,
-        "con_agua": true,
-        "nivel_freatico": 6.0,
-        "centro_x": 18.0,
-        "centro_y": 7.0,
-        "radio": 16.0,
-        "esperado": "Fs \u2248 1.0-1.2 (CR\u00cdTICO)",
-        "perfil_terreno": [
-            [
-                0,
-                8.0
-            ],
-            [
-                12.0,
-                8.0
-            ],
-            [
-                21.53402874075368,
-                0
-            ],
-            [
-                40,
-                0
-            ]
-        ]
-    },
-    "Talud Moderado - Arena Densa": {
-        "descripcion": "Talud en arena densa con par\u00e1metros moderados",
-        "altura": 6.0,
-        "angulo_talud": 30.0,
-        "cohesion": 5.0,
-        "phi_grados": 35.0,
-        "gamma": 20.0,
-        "con_agua": false,
-        "nivel_freatico": 0.0,
-        "centro_x": 16.0,
-        "centro_y": 6.0,
-        "radio": 16.0,
-        "esperado": "Fs > 2.0 (MUY ESTABLE)",
-        "perfil_terreno": [
-            [
-                0,
-                6.0
-            ],
-            [
-                12.0,
-                6.0
-            ],
-            [
-                22.392304845413264,
-                0
-            ],
-            [
-                40,
-                0
-            ]
-        ]
-    }
-}
+
+@lru_cache(maxsize=None)
+def _leer_casos(ruta: str, mtime_ns: int) -> dict:
+    """Casos del JSON en ruta; mtime_ns forma parte de la clave de caché."""
+    return _cargar_json(Path(ruta).read_bytes())
+
+
+def cargar_casos() -> dict:
+    """Casos de RUTA_CASOS, releídos solo si el archivo cambió desde la última carga."""
+    return _leer_casos(str(RUTA_CASOS), RUTA_CASOS.stat().st_mtime_ns)
+
+
+def __getattr__(nombre):
+    if nombre == 'CASOS_EJEMPLO':
+        return cargar_casos()
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
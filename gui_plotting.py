@@ -2,9 +2,6 @@
 Integración de matplotlib con la interfaz gráfica.
 """
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
 import customtkinter as ctk
 import tkinter as tk
 import numpy as np
@@ -12,10 +9,21 @@ from typing import Optional
 
 from core.geometry import crear_perfil_simple
 from data.models import CirculoFalla
-from visualization.plotting import *
 import math
 
 
+def _backend_tk():
+    """
+    Clases de matplotlib para incrustar figuras en Tk.
+    
+    Se importan al construir las pestañas y no al importar el módulo, para que
+    cargar gui_plotting no arrastre matplotlib.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    return Figure, FigureCanvasTkAgg, NavigationToolbar2Tk
+
+
 class PlottingPanel(ctk.CTkFrame):
     """Panel principal de visualización con matplotlib integrado."""
     
@@ -99,6 +107,7 @@ class PlottingPanel(ctk.CTkFrame):
         
     def setup_geometry_tab(self):
         """Configurar tab de geometría."""
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = _backend_tk()
         tab = self.notebook.tab("Geometría")
         
         # Frame para matplotlib
@@ -133,6 +142,7 @@ class PlottingPanel(ctk.CTkFrame):
         
     def setup_analysis_tab(self):
         """Configurar tab de análisis."""
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = _backend_tk()
         tab = self.notebook.tab("Análisis")
         
         # Frame para matplotlib
@@ -159,6 +169,7 @@ class PlottingPanel(ctk.CTkFrame):
         
     def setup_comparison_tab(self):
         """Configurar tab de comparación."""
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = _backend_tk()
         tab = self.notebook.tab("Comparación")
         
         # Frame para matplotlib
@@ -185,6 +196,7 @@ class PlottingPanel(ctk.CTkFrame):
         
     def setup_convergence_tab(self):
         """Configurar tab de convergencia."""
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = _backend_tk()
         tab = self.notebook.tab("Convergencia")
         
         # Frame para matplotlib
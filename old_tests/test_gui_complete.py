@@ -5,43 +5,57 @@ Identifica y reporta todos los problemas críticos.
 """
 
 import sys
-import traceback
+import importlib
+import logging
+from collections import Counter
 from typing import Dict, Any, List
 
+from logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Tracebacks completos que se registran por ejecución; del resto de fallos
+# solo se guarda el tipo y el mensaje de la excepción
+MAX_TRACEBACKS = 3
+_tracebacks_mostrados = 0
+_fallos_omitidos = []
+
+
+def _registrar_fallo(mensaje: str, *args) -> None:
+    """Registra la excepción en curso, con traceback solo para los primeros MAX_TRACEBACKS fallos."""
+    global _tracebacks_mostrados
+    if _tracebacks_mostrados < MAX_TRACEBACKS:
+        _tracebacks_mostrados += 1
+        logger.exception(mensaje, *args)
+    else:
+        tipo, error = sys.exc_info()[:2]
+        _fallos_omitidos.append((tipo.__name__, str(error)))
+
 def test_imports():
     """Test de importaciones críticas."""
-    print("=== TEST DE IMPORTACIONES ===")
+    logger.info("=== TEST DE IMPORTACIONES ===")
     errors = []
     
-    try:
-        from core.bishop import analizar_bishop
-        print("✓ core.bishop importado correctamente")
-    except Exception as e:
-        errors.append(f"✗ Error importando core.bishop: {e}")
-    
-    try:
-        from core.fellenius import analizar_fellenius
-        print("✓ core.fellenius importado correctamente")
-    except Exception as e:
-        errors.append(f"✗ Error importando core.fellenius: {e}")
-    
-    try:
-        from gui_components import ParameterPanel, ToolsPanel, ResultsPanel, PlottingPanel
-        print("✓ gui_components importado correctamente")
-    except Exception as e:
-        errors.append(f"✗ Error importando gui_components: {e}")
-    
-    try:
-        from gui_examples import get_caso_ejemplo, get_nombres_casos
-        print("✓ gui_examples importado correctamente")
-    except Exception as e:
-        errors.append(f"✗ Error importando gui_examples: {e}")
+    modulos = {
+        'core.bishop': ('analizar_bishop',),
+        'core.fellenius': ('analizar_fellenius',),
+        'gui_components': ('ParameterPanel', 'ToolsPanel', 'ResultsPanel', 'PlottingPanel'),
+        'gui_examples': ('get_caso_ejemplo', 'get_nombres_casos'),
+    }
+    for nombre, atributos in modulos.items():
+        try:
+            modulo = importlib.import_module(nombre)
+            for atributo in atributos:
+                getattr(modulo, atributo)
+            logger.info("OK %s importado correctamente", nombre)
+        except Exception as e:
+            errors.append(f"FAIL Error importando {nombre}: {e}")
     
     return errors
 
 def test_parameter_conversion():
     """Test de conversión de parámetros GUI a formato core."""
-    print("\n=== TEST DE CONVERSIÓN DE PARÁMETROS ===")
+    logger.info("\n=== TEST DE CONVERSIÓN DE PARÁMETROS ===")
     errors = []
     
     # Parámetros típicos de la GUI
@@ -82,7 +96,7 @@ def test_parameter_conversion():
             angulo_grados=gui_params['angulo_talud']
         )
         
-        print("✓ Conversión de parámetros exitosa")
+        logger.info("OK Conversión de parámetros exitosa")
         
         # Test de análisis Bishop
         from core.bishop import analizar_bishop
@@ -93,30 +107,30 @@ def test_parameter_conversion():
             num_dovelas=gui_params['dovelas']
         )
         
-        print(f"✓ Análisis Bishop exitoso: Fs = {resultado.factor_seguridad:.3f}")
+        logger.info("OK Análisis Bishop exitoso: Fs = %.3f", resultado.factor_seguridad)
         
     except Exception as e:
-        errors.append(f"✗ Error en conversión/análisis: {e}")
-        traceback.print_exc()
+        errors.append(f"FAIL Error en conversión/análisis: {e}")
+        _registrar_fallo("Error en conversión/análisis")
     
     return errors
 
 def test_gui_examples():
     """Test de casos de ejemplo de la GUI."""
-    print("\n=== TEST DE CASOS DE EJEMPLO ===")
+    logger.info("\n=== TEST DE CASOS DE EJEMPLO ===")
     errors = []
     
     try:
         from gui_examples import get_caso_ejemplo, get_nombres_casos
         
         nombres = get_nombres_casos()
-        print(f"✓ Casos disponibles: {len(nombres)}")
+        logger.info("OK Casos disponibles: %s", len(nombres))
         
         for nombre in nombres:
             try:
                 caso = get_caso_ejemplo(nombre)
                 if not caso:
-                    errors.append(f"✗ Caso '{nombre}' retorna vacío")
+                    errors.append(f"FAIL Caso '{nombre}' retorna vacío")
                     continue
                 
                 # Verificar campos requeridos
@@ -127,21 +141,21 @@ def test_gui_examples():
                 
                 for campo in campos_requeridos:
                     if campo not in caso:
-                        errors.append(f"✗ Caso '{nombre}' falta campo '{campo}'")
+                        errors.append(f"FAIL Caso '{nombre}' falta campo '{campo}'")
                 
-                print(f"✓ Caso '{nombre}' tiene estructura correcta")
+                logger.info("OK Caso '%s' tiene estructura correcta", nombre)
                 
             except Exception as e:
-                errors.append(f"✗ Error procesando caso '{nombre}': {e}")
+                errors.append(f"FAIL Error procesando caso '{nombre}': {e}")
     
     except Exception as e:
-        errors.append(f"✗ Error general en casos de ejemplo: {e}")
+        errors.append(f"FAIL Error general en casos de ejemplo: {e}")
     
     return errors
 
 def test_analysis_with_examples():
     """Test de análisis con casos de ejemplo."""
-    print("\n=== TEST DE ANÁLISIS CON EJEMPLOS ===")
+    logger.info("\n=== TEST DE ANÁLISIS CON EJEMPLOS ===")
     errors = []
     
     try:
@@ -182,57 +196,61 @@ def test_analysis_with_examples():
                     num_dovelas=10
                 )
                 
-                print(f"✓ Caso '{nombre}': Fs = {resultado.factor_seguridad:.3f}")
+                logger.info("OK Caso '%s': Fs = %.3f", nombre, resultado.factor_seguridad)
                 
             except Exception as e:
-                errors.append(f"✗ Error analizando caso '{nombre}': {e}")
-                traceback.print_exc()
+                errors.append(f"FAIL Error analizando caso '{nombre}': {e}")
+                _registrar_fallo("Error analizando caso '%s'", nombre)
     
     except Exception as e:
-        errors.append(f"✗ Error general en análisis: {e}")
+        errors.append(f"FAIL Error general en análisis: {e}")
     
     return errors
 
 def test_plotting_compatibility():
     """Test de compatibilidad con plotting."""
-    print("\n=== TEST DE COMPATIBILIDAD PLOTTING ===")
+    logger.info("\n=== TEST DE COMPATIBILIDAD PLOTTING ===")
     errors = []
     
     try:
         # Crear resultado mock
-        from data.models import CirculoFalla, Estrato, Dovela
-        from core.geometry import crear_perfil_terreno
+        import numpy as np
+        from data.models import DovelaArrays
         
-        # Crear dovelas mock
-        dovelas = []
-        for i in range(5):
-            dovela = Dovela(
-                x_centro=i * 2.0,
-                ancho=2.0,
-                altura_izq=5.0,
-                altura_der=4.0,
-                peso=100.0,
-                angulo_base=30.0,
-                area=10.0
-            )
-            dovelas.append(dovela)
+        # Crear dovelas mock en formato columnar
+        n = 5
+        arreglos = DovelaArrays(
+            x_centro=np.array([i * 2.0 for i in range(n)]),
+            ancho=np.full(n, 2.0),
+            altura=np.full(n, 4.5),
+            angulo_alpha=np.full(n, np.radians(30.0)),
+            cohesion=np.full(n, 10.0),
+            phi_grados=np.full(n, 25.0),
+            gamma=np.full(n, 18.0),
+            peso=np.full(n, 100.0),
+            presion_poros=np.zeros(n),
+            longitud_arco=np.full(n, 2.0 / np.cos(np.radians(30.0))),
+            y_base=np.full(n, 0.5),
+            y_superficie=np.full(n, 5.0)
+        )
+        dovelas = arreglos.a_dovelas()
         
         # Verificar que dovelas tienen atributo 'puntos' o similar
         if hasattr(dovelas[0], 'puntos'):
-            print("✓ Dovelas tienen atributo 'puntos'")
+            logger.info("OK Dovelas tienen atributo 'puntos'")
         else:
-            errors.append("✗ Dovelas no tienen atributo 'puntos' - problema plotting")
+            errors.append("FAIL Dovelas no tienen atributo 'puntos' - problema plotting")
         
-        print("✓ Test de plotting completado")
+        logger.info("OK Test de plotting completado")
         
     except Exception as e:
-        errors.append(f"✗ Error en test plotting: {e}")
+        errors.append(f"FAIL Error en test plotting: {e}")
     
     return errors
 
 def create_wrapper_function():
     """Crear función wrapper para análisis desde GUI."""
-    print("\n=== CREANDO FUNCIÓN WRAPPER ===")
+    logger.info("\n=== CREANDO FUNCIÓN WRAPPER ===")
     
     wrapper_code = '''
 def analizar_desde_gui(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -300,13 +318,13 @@ def analizar_desde_gui(params: Dict[str, Any]) -> Dict[str, Any]:
         }
 '''
     
-    print("✓ Función wrapper creada")
+    logger.info("OK Función wrapper creada")
     return wrapper_code
 
 def main():
     """Ejecutar todos los tests."""
-    print("INICIANDO TESTS COMPLETOS DE LA GUI")
-    print("=" * 50)
+    logger.info("INICIANDO TESTS COMPLETOS DE LA GUI")
+    logger.info("%s", '=' * 50)
     
     all_errors = []
     
@@ -321,27 +339,33 @@ def main():
     wrapper_code = create_wrapper_function()
     
     # Resumen
-    print("\n" + "=" * 50)
-    print("RESUMEN DE TESTS")
-    print("=" * 50)
+    logger.info("%s", '\n' + '=' * 50)
+    logger.info("RESUMEN DE TESTS")
+    logger.info("%s", '=' * 50)
     
     if all_errors:
-        print(f"❌ ENCONTRADOS {len(all_errors)} ERRORES:")
+        logger.error("FAIL ENCONTRADOS %s ERRORES:", len(all_errors))
         for i, error in enumerate(all_errors, 1):
-            print(f"{i}. {error}")
+            logger.info("%s. %s", i, error)
     else:
-        print("✅ TODOS LOS TESTS PASARON")
+        logger.info("OK TODOS LOS TESTS PASARON")
+    
+    if _fallos_omitidos:
+        por_tipo = Counter(tipo for tipo, _ in _fallos_omitidos)
+        logger.info("Otros %s fallos sin traceback: %s", len(_fallos_omitidos),
+                    ", ".join(f"{n} {tipo}" for tipo, n in por_tipo.most_common()))
     
-    print(f"\nFunción wrapper generada para integración GUI-Core")
+    logger.info("\nFunción wrapper generada para integración GUI-Core")
     
     return all_errors, wrapper_code
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     errors, wrapper = main()
     
     if errors:
-        print(f"\n⚠️  SE REQUIERE CORRECCIÓN DE {len(errors)} PROBLEMAS")
+        logger.warning("\nWARN  SE REQUIERE CORRECCIÓN DE %s PROBLEMAS", len(errors))
         sys.exit(1)
     else:
-        print("\n✅ SISTEMA LISTO PARA PRODUCCIÓN")
+        logger.info("\nOK SISTEMA LISTO PARA PRODUCCIÓN")
         sys.exit(0)
@@ -10,10 +10,6 @@ Este test valida:
 6. Funciones auxiliares
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import math
 from data.models import Estrato, CirculoFalla
 from core.bishop import (
@@ -9,13 +9,8 @@ Valida:
 - Comparación con valores teóricos
 """
 
-import sys
-import os
 import math
 
-# Agregar el directorio raíz al path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from data.models import Estrato, CirculoFalla
 from core.fellenius import (
     analizar_fellenius, fellenius_talud_homogeneo, fellenius_con_nivel_freatico,
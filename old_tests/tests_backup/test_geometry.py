@@ -9,19 +9,17 @@ Valida todas las funciones geométricas fundamentales:
 """
 
 import math
-import sys
-import os
 
-# Agregar el directorio raíz al path para importar módulos
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
 
 from core.geometry import (
     calcular_y_circulo, interpolar_terreno, calcular_angulo_alpha,
     calcular_longitud_arco, calcular_altura_dovela, calcular_peso_dovela,
     calcular_presion_poros, crear_dovelas, validar_geometria_circulo,
-    crear_perfil_simple, crear_nivel_freatico_horizontal
+    crear_perfil_simple, crear_nivel_freatico_horizontal,
+    perfil_a_arreglos, interpolar_terreno_vec
 )
-from data.models import CirculoFalla, Estrato
+from data.models import CirculoFalla, Estrato, DovelaArrays
 
 
 def test_calcular_y_circulo():
@@ -31,20 +29,16 @@ def test_calcular_y_circulo():
     # Círculo centrado en (5, 10) con radio 3
     xc, yc, radio = 5.0, 10.0, 3.0
     
-    # Punto en el centro (x = xc)
-    y_superior = calcular_y_circulo(5.0, xc, yc, radio, True)
-    y_inferior = calcular_y_circulo(5.0, xc, yc, radio, False)
+    # Centro (x = xc), parte superior e inferior, y borde (x = xc + radio)
+    puntos = [(5.0, True), (5.0, False), (8.0, True)]
+    obtenidos = np.array([calcular_y_circulo(x, xc, yc, radio, sup) for x, sup in puntos])
+    esperados = np.array([13.0, 7.0, 10.0])
     
     print(f"Círculo: centro=({xc}, {yc}), radio={radio}")
-    print(f"En x=5.0: y_superior={y_superior:.2f}, y_inferior={y_inferior:.2f}")
+    print(f"En x=5.0: y_superior={obtenidos[0]:.2f}, y_inferior={obtenidos[1]:.2f}")
+    print(f"En x=8.0 (borde): y={obtenidos[2]:.2f}")
     
-    assert abs(y_superior - 13.0) < 0.01, f"Y superior esperado 13.0, obtenido {y_superior}"
-    assert abs(y_inferior - 7.0) < 0.01, f"Y inferior esperado 7.0, obtenido {y_inferior}"
-    
-    # Punto en el borde (x = xc + radio)
-    y_borde = calcular_y_circulo(8.0, xc, yc, radio, True)
-    print(f"En x=8.0 (borde): y={y_borde:.2f}")
-    assert abs(y_borde - 10.0) < 0.01, f"Y en borde esperado 10.0, obtenido {y_borde}"
+    np.testing.assert_allclose(obtenidos, esperados, atol=0.01)
     
     # Punto fuera del círculo
     y_fuera = calcular_y_circulo(10.0, xc, yc, radio, True)
@@ -65,30 +59,17 @@ def test_interpolar_terreno():
     for x, y in perfil:
         print(f"  ({x:.1f}, {y:.1f})")
     
-    # Test interpolación en puntos conocidos
-    y_0 = interpolar_terreno(0.0, perfil)
-    y_10 = interpolar_terreno(10.0, perfil)
-    y_20 = interpolar_terreno(20.0, perfil)
-    
-    print(f"Interpolación en puntos conocidos:")
-    print(f"  x=0.0 → y={y_0:.2f} (esperado 10.0)")
-    print(f"  x=10.0 → y={y_10:.2f} (esperado 5.0)")
-    print(f"  x=20.0 → y={y_20:.2f} (esperado 0.0)")
-    
-    assert abs(y_0 - 10.0) < 0.01
-    assert abs(y_10 - 5.0) < 0.01
-    assert abs(y_20 - 0.0) < 0.01
-    
-    # Test interpolación en punto medio
-    y_5 = interpolar_terreno(5.0, perfil)
-    y_15 = interpolar_terreno(15.0, perfil)
+    # Puntos conocidos del perfil y puntos medios, en una sola evaluación
+    xs = np.array([0.0, 10.0, 20.0, 5.0, 15.0])
+    esperados = np.array([10.0, 5.0, 0.0, 7.5, 2.5])
+    obtenidos = interpolar_terreno_vec(xs, *perfil_a_arreglos(perfil))
     
-    print(f"Interpolación en puntos medios:")
-    print(f"  x=5.0 → y={y_5:.2f} (esperado 7.5)")
-    print(f"  x=15.0 → y={y_15:.2f} (esperado 2.5)")
+    for x, y, y_esperado in zip(xs, obtenidos, esperados):
+        print(f"  x={x:.1f} → y={y:.2f} (esperado {y_esperado})")
     
-    assert abs(y_5 - 7.5) < 0.01
-    assert abs(y_15 - 2.5) < 0.01
+    np.testing.assert_allclose(obtenidos, esperados, atol=0.01)
+    # La versión vectorizada coincide con la escalar
+    np.testing.assert_allclose(obtenidos, [interpolar_terreno(x, perfil) for x in xs])
     
     print("✅ Test interpolación terreno PASADO\n")
 
@@ -170,9 +151,10 @@ def test_crear_dovelas():
     
     print(f"\nPeso total de dovelas: {peso_total:.1f} kN")
     
-    assert len(dovelas) > 0, "Debe crear al menos una dovela"
-    assert all(d.peso > 0 for d in dovelas), "Todas las dovelas deben tener peso positivo"
-    assert all(d.altura > 0 for d in dovelas), "Todas las dovelas deben tener altura positiva"
+    arreglos = DovelaArrays.desde_dovelas(dovelas)
+    assert len(arreglos) > 0, "Debe crear al menos una dovela"
+    assert np.all(arreglos.peso > 0), "Todas las dovelas deben tener peso positivo"
+    assert np.all(arreglos.altura > 0), "Todas las dovelas deben tener altura positiva"
     
     print("✅ Test creación dovelas PASADO\n")
 
@@ -6,13 +6,9 @@ correctamente con parámetros típicos de ingeniería geotécnica.
 """
 
 import sys
-import os
 import math
 import pytest
 
-# Agregar el directorio padre al path para importar los módulos
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from data.models import Estrato, Dovela, CirculoFalla, crear_estrato_homogeneo, crear_circulo_simple
 
 
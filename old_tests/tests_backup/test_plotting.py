@@ -5,14 +5,9 @@ Verifica que todas las funciones de plotting funcionen correctamente
 con datos reales de análisis de estabilidad.
 """
 
-import sys
-import os
 import math
 import matplotlib.pyplot as plt
 
-# Agregar el directorio raíz al path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from visualization.plotting import *
 from data.models import CirculoFalla, Dovela, Estrato
 from core.geometry import crear_perfil_simple, crear_nivel_freatico_horizontal
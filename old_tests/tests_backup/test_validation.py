@@ -9,12 +9,10 @@ Valida todas las funciones de validación críticas:
 - Manejo de errores
 """
 
+import logging
 import math
-import sys
-import os
 
-# Agregar el directorio raíz al path para importar módulos
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
 from data.validation import (
     ResultadoValidacion, ValidacionError,
@@ -26,28 +24,54 @@ from data.validation import (
 )
 from data.models import Estrato, Dovela, CirculoFalla
 from core.geometry import crear_perfil_simple, crear_dovelas
+from logging_utils import get_logger
 
+# El detalle de cada caso va a DEBUG: bajo pytest no se formatea ni se
+# escribe salvo que se pida (--log-level=DEBUG); main() lo muestra
+logger = get_logger(__name__)
 
-def test_validar_parametros_geotecnicos():
+
+def _crear_perfil_talud():
+    """Talud de 10 m sobre 20 m de base usado por varios tests."""
+    return crear_perfil_simple(0.0, 10.0, 20.0, 0.0, 10)
+
+
+def _crear_estrato_arena():
+    """Arena típica (c'=10 kPa, φ=30°, γ=18 kN/m³)."""
+    return Estrato(cohesion=10.0, phi_grados=30.0, gamma=18.0, nombre="Arena")
+
+
+# Se construyen una vez por módulo; los tests no las modifican
+@pytest.fixture(scope="module")
+def perfil_talud():
+    return _crear_perfil_talud()
+
+
+@pytest.fixture(scope="module")
+def estrato_arena():
+    return _crear_estrato_arena()
+
+
+def test_validar_parametros_geotecnicos(estrato_arena):
     """Test para validación de parámetros geotécnicos"""
-    print("=== TEST VALIDACIÓN PARÁMETROS GEOTÉCNICOS ===")
+    logger.debug("=== TEST VALIDACIÓN PARÁMETROS GEOTÉCNICOS ===")
     
     # Estrato válido
-    estrato_valido = Estrato(cohesion=10.0, phi_grados=30.0, gamma=18.0, nombre="Arena")
+    estrato_valido = estrato_arena
     resultado = validar_parametros_geotecnicos(estrato_valido)
     
-    print(f"Estrato válido: {estrato_valido.nombre}")
-    print(f"  c'={estrato_valido.cohesion} kPa, φ={estrato_valido.phi_grados}°, γ={estrato_valido.gamma} kN/m³")
-    print(f"  Resultado: {resultado.mensaje}")
+    logger.debug("Estrato válido: %s", estrato_valido.nombre)
+    logger.debug("  c'=%s kPa, φ=%s°, γ=%s kN/m³", estrato_valido.cohesion, estrato_valido.phi_grados, estrato_valido.gamma)
+    logger.debug("  Resultado: %s", resultado.mensaje)
     assert resultado.es_valido, "Estrato válido debe pasar validación"
     
     # Cohesión fuera de rango
     estrato_cohesion_alta = Estrato(cohesion=600.0, phi_grados=20.0, gamma=18.0, nombre="Arcilla")
     resultado_cohesion = validar_parametros_geotecnicos(estrato_cohesion_alta)
     
-    print(f"\nEstrato cohesión alta: c'={estrato_cohesion_alta.cohesion} kPa")
-    print(f"  Resultado: {resultado_cohesion.mensaje}")
-    print(f"  Código error: {resultado_cohesion.codigo_error}")
+    logger.debug("\nEstrato cohesión alta: c'=%s kPa", estrato_cohesion_alta.cohesion)
+    logger.debug("  Resultado: %s", resultado_cohesion.mensaje)
+    logger.debug("  Código error: %s", resultado_cohesion.codigo_error)
     assert not resultado_cohesion.es_valido, "Cohesión alta debe fallar validación"
     assert resultado_cohesion.codigo_error == "COHESION_FUERA_RANGO"
     
@@ -57,15 +81,15 @@ def test_validar_parametros_geotecnicos():
         estrato_phi_extremo = Estrato(cohesion=5.0, phi_grados=55.0, gamma=18.0, nombre="Arena")
         # Si llega aquí, usar el estrato creado
         resultado_phi = validar_parametros_geotecnicos(estrato_phi_extremo)
-        print(f"\nEstrato φ extremo: φ={estrato_phi_extremo.phi_grados}°")
-        print(f"  Resultado: {resultado_phi.mensaje}")
+        logger.debug("\nEstrato φ extremo: φ=%s°", estrato_phi_extremo.phi_grados)
+        logger.debug("  Resultado: %s", resultado_phi.mensaje)
         assert not resultado_phi.es_valido, "Ángulo extremo debe fallar validación"
     except ValueError:
         # Si la clase rechaza el ángulo, crear uno en el límite superior del rango típico
         estrato_phi_alto = Estrato(cohesion=5.0, phi_grados=45.0, gamma=18.0, nombre="Arena")
         resultado_phi = validar_parametros_geotecnicos(estrato_phi_alto)
-        print(f"\nEstrato φ en límite: φ={estrato_phi_alto.phi_grados}°")
-        print(f"  Resultado: {resultado_phi.mensaje}")
+        logger.debug("\nEstrato φ en límite: φ=%s°", estrato_phi_alto.phi_grados)
+        logger.debug("  Resultado: %s", resultado_phi.mensaje)
         # 45° está dentro del rango típico (0-50°), así que debe ser válido
         assert resultado_phi.es_valido, "Ángulo de 45° debe ser válido"
     
@@ -73,35 +97,35 @@ def test_validar_parametros_geotecnicos():
     estrato_inusual = Estrato(cohesion=150.0, phi_grados=40.0, gamma=18.0, nombre="Suelo")
     resultado_inusual = validar_parametros_geotecnicos(estrato_inusual)
     
-    print(f"\nCombinación inusual: c'={estrato_inusual.cohesion} kPa, φ={estrato_inusual.phi_grados}°")
-    print(f"  Resultado: {resultado_inusual.mensaje}")
+    logger.debug("\nCombinación inusual: c'=%s kPa, φ=%s°", estrato_inusual.cohesion, estrato_inusual.phi_grados)
+    logger.debug("  Resultado: %s", resultado_inusual.mensaje)
     assert not resultado_inusual.es_valido, "Combinación inusual debe fallar validación"
     
-    print("✅ Test validación parámetros geotécnicos PASADO\n")
+    logger.debug("✅ Test validación parámetros geotécnicos PASADO\n")
 
 
-def test_validar_geometria_circulo():
+def test_validar_geometria_circulo(perfil_talud):
     """Test para validación de geometría de círculo"""
-    print("=== TEST VALIDACIÓN GEOMETRÍA CÍRCULO ===")
+    logger.debug("=== TEST VALIDACIÓN GEOMETRÍA CÍRCULO ===")
     
     # Perfil de terreno simple
-    perfil = crear_perfil_simple(0.0, 10.0, 20.0, 0.0, 10)
+    perfil = perfil_talud
     
     # Círculo válido
     circulo_valido = CirculoFalla(xc=10.0, yc=8.0, radio=6.0)
     resultado = validar_geometria_circulo_avanzada(circulo_valido, perfil)
     
-    print(f"Círculo válido: centro=({circulo_valido.xc}, {circulo_valido.yc}), radio={circulo_valido.radio}")
-    print(f"  Resultado: {resultado.mensaje}")
+    logger.debug("Círculo válido: centro=(%s, %s), radio=%s", circulo_valido.xc, circulo_valido.yc, circulo_valido.radio)
+    logger.debug("  Resultado: %s", resultado.mensaje)
     assert resultado.es_valido, "Círculo válido debe pasar validación"
     
     # Radio demasiado pequeño
     circulo_pequeno = CirculoFalla(xc=10.0, yc=8.0, radio=0.5)
     resultado_pequeno = validar_geometria_circulo_avanzada(circulo_pequeno, perfil)
     
-    print(f"\nCírculo pequeño: radio={circulo_pequeno.radio} m")
-    print(f"  Resultado: {resultado_pequeno.mensaje}")
-    print(f"  Código error: {resultado_pequeno.codigo_error}")
+    logger.debug("\nCírculo pequeño: radio=%s m", circulo_pequeno.radio)
+    logger.debug("  Resultado: %s", resultado_pequeno.mensaje)
+    logger.debug("  Código error: %s", resultado_pequeno.codigo_error)
     assert not resultado_pequeno.es_valido, "Radio pequeño debe fallar validación"
     assert resultado_pequeno.codigo_error == "RADIO_DEMASIADO_PEQUENO"
     
@@ -109,16 +133,16 @@ def test_validar_geometria_circulo():
     circulo_bajo = CirculoFalla(xc=10.0, yc=2.0, radio=6.0)
     resultado_bajo = validar_geometria_circulo_avanzada(circulo_bajo, perfil)
     
-    print(f"\nCírculo centro bajo: yc={circulo_bajo.yc} m")
-    print(f"  Resultado: {resultado_bajo.mensaje}")
+    logger.debug("\nCírculo centro bajo: yc=%s m", circulo_bajo.yc)
+    logger.debug("  Resultado: %s", resultado_bajo.mensaje)
     assert not resultado_bajo.es_valido, "Centro bajo debe fallar validación"
     
-    print("✅ Test validación geometría círculo PASADO\n")
+    logger.debug("✅ Test validación geometría círculo PASADO\n")
 
 
 def test_validar_dovela():
     """Test para validación de dovela individual"""
-    print("=== TEST VALIDACIÓN DOVELA ===")
+    logger.debug("=== TEST VALIDACIÓN DOVELA ===")
     
     # Dovela válida
     dovela_valida = Dovela(
@@ -129,10 +153,10 @@ def test_validar_dovela():
     
     resultado = validar_dovela_critica(dovela_valida)
     
-    print(f"Dovela válida: x={dovela_valida.x_centro}, α={math.degrees(dovela_valida.angulo_alpha):.1f}°")
-    print(f"  Peso: {dovela_valida.peso} kN")
-    print(f"  mα: {dovela_valida.cos_alpha + dovela_valida.sin_alpha * dovela_valida.tan_phi:.4f}")
-    print(f"  Resultado: {resultado.mensaje}")
+    logger.debug("Dovela válida: x=%s, α=%.1f°", dovela_valida.x_centro, math.degrees(dovela_valida.angulo_alpha))
+    logger.debug("  Peso: %s kN", dovela_valida.peso)
+    logger.debug("  mα: %.4f", dovela_valida.cos_alpha + dovela_valida.sin_alpha * dovela_valida.tan_phi)
+    logger.debug("  Resultado: %s", resultado.mensaje)
     assert resultado.es_valido, "Dovela válida debe pasar validación"
     
     # Dovela con ángulo extremo
@@ -144,8 +168,8 @@ def test_validar_dovela():
     
     resultado_extremo = validar_dovela_critica(dovela_angulo_extremo)
     
-    print(f"\nDovela ángulo extremo: α={math.degrees(dovela_angulo_extremo.angulo_alpha):.1f}°")
-    print(f"  Resultado: {resultado_extremo.mensaje}")
+    logger.debug("\nDovela ángulo extremo: α=%.1f°", math.degrees(dovela_angulo_extremo.angulo_alpha))
+    logger.debug("  Resultado: %s", resultado_extremo.mensaje)
     # 80° está dentro del rango permitido por Dovela.__post_init__ (±80°), así que debe ser válido
     assert resultado_extremo.es_valido, "Ángulo de 80° debe ser válido"
     
@@ -159,168 +183,168 @@ def test_validar_dovela():
     resultado_m_alpha = validar_dovela_critica(dovela_m_alpha)
     m_alpha = dovela_m_alpha.cos_alpha + dovela_m_alpha.sin_alpha * dovela_m_alpha.tan_phi
     
-    print(f"\nDovela mα problemático: α={math.degrees(dovela_m_alpha.angulo_alpha):.1f}°, φ={dovela_m_alpha.phi_grados}°")
-    print(f"  mα calculado: {m_alpha:.4f}")
-    print(f"  Resultado: {resultado_m_alpha.mensaje}")
+    logger.debug("\nDovela mα problemático: α=%.1f°, φ=%s°", math.degrees(dovela_m_alpha.angulo_alpha), dovela_m_alpha.phi_grados)
+    logger.debug("  mα calculado: %.4f", m_alpha)
+    logger.debug("  Resultado: %s", resultado_m_alpha.mensaje)
     
     if m_alpha <= 0:
         assert not resultado_m_alpha.es_valido, "mα ≤ 0 debe fallar validación"
         assert resultado_m_alpha.codigo_error == "M_ALPHA_NO_POSITIVO"
     
-    print("✅ Test validación dovela PASADO\n")
+    logger.debug("✅ Test validación dovela PASADO\n")
 
 
-def test_validar_conjunto_dovelas():
+def test_validar_conjunto_dovelas(estrato_arena):
     """Test para validación de conjunto de dovelas"""
-    print("=== TEST VALIDACIÓN CONJUNTO DOVELAS ===")
+    logger.debug("=== TEST VALIDACIÓN CONJUNTO DOVELAS ===")
     
     # Crear círculo y perfil que permita generar más dovelas
     # Usar un círculo más centrado y con mejor geometría
     circulo = CirculoFalla(xc=12.0, yc=10.0, radio=8.0)
     perfil = crear_perfil_simple(0.0, 15.0, 25.0, 0.0, 15)
-    estrato = Estrato(cohesion=10.0, phi_grados=30.0, gamma=18.0, nombre="Arena")
+    estrato = estrato_arena
     
     # Conjunto válido de dovelas
     dovelas_validas = crear_dovelas(circulo, perfil, estrato, num_dovelas=10)
     resultado = validar_conjunto_dovelas(dovelas_validas)
     
-    print(f"Conjunto válido: {len(dovelas_validas)} dovelas")
-    print(f"  Resultado: {resultado.mensaje}")
+    logger.debug("Conjunto válido: %s dovelas", len(dovelas_validas))
+    logger.debug("  Resultado: %s", resultado.mensaje)
     assert resultado.es_valido, "Conjunto válido debe pasar validación"
     
     # Conjunto pequeño pero válido (4 dovelas)
     dovelas_pequenas = crear_dovelas(circulo, perfil, estrato, num_dovelas=4)
     resultado_pequenas = validar_conjunto_dovelas(dovelas_pequenas)
     
-    print(f"\nConjunto pequeño: {len(dovelas_pequenas)} dovelas")
-    print(f"  Resultado: {resultado_pequenas.mensaje}")
+    logger.debug("\nConjunto pequeño: %s dovelas", len(dovelas_pequenas))
+    logger.debug("  Resultado: %s", resultado_pequenas.mensaje)
     assert resultado_pequenas.es_valido, "4 dovelas debe pasar validación"
     
-    print("✅ Test validación conjunto dovelas PASADO\n")
+    logger.debug("✅ Test validación conjunto dovelas PASADO\n")
 
 
 def test_validar_convergencia_bishop():
     """Test para validación de convergencia Bishop"""
-    print("=== TEST VALIDACIÓN CONVERGENCIA BISHOP ===")
+    logger.debug("=== TEST VALIDACIÓN CONVERGENCIA BISHOP ===")
     
     # Secuencia convergente
     factores_convergente = [1.5, 1.48, 1.485, 1.4849, 1.48485]
     resultado_conv = validar_convergencia_bishop(factores_convergente, 5)
     
-    print("Secuencia convergente:")
+    logger.debug("Secuencia convergente:")
     for i, fs in enumerate(factores_convergente):
-        print(f"  Iteración {i}: Fs = {fs:.5f}")
-    print(f"  Resultado: {resultado_conv.mensaje}")
+        logger.debug("  Iteración %s: Fs = %.5f", i, fs)
+    logger.debug("  Resultado: %s", resultado_conv.mensaje)
     assert resultado_conv.es_valido, "Secuencia convergente debe ser válida"
     
     # Secuencia no convergente
     factores_no_conv = [1.5, 1.3, 1.7, 1.2, 1.8]
     resultado_no_conv = validar_convergencia_bishop(factores_no_conv, 5)
     
-    print(f"\nSecuencia no convergente:")
+    logger.debug("\nSecuencia no convergente:")
     for i, fs in enumerate(factores_no_conv):
-        print(f"  Iteración {i}: Fs = {fs:.3f}")
-    print(f"  Resultado: {resultado_no_conv.mensaje}")
+        logger.debug("  Iteración %s: Fs = %.3f", i, fs)
+    logger.debug("  Resultado: %s", resultado_no_conv.mensaje)
     
     # Factor de seguridad inválido
     factores_invalidos = [1.5, 1.4, -0.5]
     resultado_invalido = validar_convergencia_bishop(factores_invalidos, 3)
     
-    print(f"\nSecuencia con valor inválido:")
+    logger.debug("\nSecuencia con valor inválido:")
     for i, fs in enumerate(factores_invalidos):
-        print(f"  Iteración {i}: Fs = {fs:.3f}")
-    print(f"  Resultado: {resultado_invalido.mensaje}")
+        logger.debug("  Iteración %s: Fs = %.3f", i, fs)
+    logger.debug("  Resultado: %s", resultado_invalido.mensaje)
     assert not resultado_invalido.es_valido, "Valor inválido debe fallar validación"
     
-    print("✅ Test validación convergencia Bishop PASADO\n")
+    logger.debug("✅ Test validación convergencia Bishop PASADO\n")
 
 
 def test_validar_factor_seguridad():
     """Test para validación de factor de seguridad"""
-    print("=== TEST VALIDACIÓN FACTOR DE SEGURIDAD ===")
+    logger.debug("=== TEST VALIDACIÓN FACTOR DE SEGURIDAD ===")
     
     # Factores de seguridad en diferentes rangos
     factores_test = [0.8, 1.1, 1.3, 1.6, 2.5]
     
     for fs in factores_test:
         resultado = validar_factor_seguridad(fs)
-        print(f"Fs = {fs:.1f}: {resultado.mensaje}")
+        logger.debug("Fs = %.1f: %s", fs, resultado.mensaje)
         assert resultado.es_valido, f"Factor {fs} debe ser válido"
     
     # Factor inválido (negativo)
     resultado_negativo = validar_factor_seguridad(-0.5)
-    print(f"\nFs negativo: {resultado_negativo.mensaje}")
+    logger.debug("\nFs negativo: %s", resultado_negativo.mensaje)
     assert not resultado_negativo.es_valido, "Factor negativo debe fallar validación"
     
     # Factor demasiado alto
     resultado_alto = validar_factor_seguridad(15.0)
-    print(f"Fs muy alto: {resultado_alto.mensaje}")
+    logger.debug("Fs muy alto: %s", resultado_alto.mensaje)
     assert not resultado_alto.es_valido, "Factor muy alto debe fallar validación"
     
-    print("✅ Test validación factor de seguridad PASADO\n")
+    logger.debug("✅ Test validación factor de seguridad PASADO\n")
 
 
 def test_validar_perfil_terreno():
     """Test para validación de perfil de terreno"""
-    print("=== TEST VALIDACIÓN PERFIL TERRENO ===")
+    logger.debug("=== TEST VALIDACIÓN PERFIL TERRENO ===")
     
     # Perfil válido
     perfil_valido = [(0.0, 10.0), (10.0, 5.0), (20.0, 0.0)]
     resultado = validar_perfil_terreno(perfil_valido)
     
-    print("Perfil válido:")
+    logger.debug("Perfil válido:")
     for x, y in perfil_valido:
-        print(f"  ({x:.1f}, {y:.1f})")
-    print(f"  Resultado: {resultado.mensaje}")
+        logger.debug("  (%.1f, %.1f)", x, y)
+    logger.debug("  Resultado: %s", resultado.mensaje)
     assert resultado.es_valido, "Perfil válido debe pasar validación"
     
     # Perfil insuficiente
     perfil_insuficiente = [(0.0, 10.0)]
     resultado_insuf = validar_perfil_terreno(perfil_insuficiente)
     
-    print(f"\nPerfil insuficiente: {len(perfil_insuficiente)} punto")
-    print(f"  Resultado: {resultado_insuf.mensaje}")
+    logger.debug("\nPerfil insuficiente: %s punto", len(perfil_insuficiente))
+    logger.debug("  Resultado: %s", resultado_insuf.mensaje)
     assert not resultado_insuf.es_valido, "Perfil insuficiente debe fallar validación"
     
     # Perfil no ordenado
     perfil_desordenado = [(0.0, 10.0), (20.0, 0.0), (10.0, 5.0)]
     resultado_desord = validar_perfil_terreno(perfil_desordenado)
     
-    print(f"\nPerfil desordenado:")
+    logger.debug("\nPerfil desordenado:")
     for x, y in perfil_desordenado:
-        print(f"  ({x:.1f}, {y:.1f})")
-    print(f"  Resultado: {resultado_desord.mensaje}")
+        logger.debug("  (%.1f, %.1f)", x, y)
+    logger.debug("  Resultado: %s", resultado_desord.mensaje)
     assert not resultado_desord.es_valido, "Perfil desordenado debe fallar validación"
     
-    print("✅ Test validación perfil terreno PASADO\n")
+    logger.debug("✅ Test validación perfil terreno PASADO\n")
 
 
-def test_validacion_completa():
+def test_validacion_completa(perfil_talud, estrato_arena):
     """Test para validación completa de entrada"""
-    print("=== TEST VALIDACIÓN COMPLETA ===")
+    logger.debug("=== TEST VALIDACIÓN COMPLETA ===")
     
     # Datos de entrada válidos
     circulo = CirculoFalla(xc=10.0, yc=8.0, radio=6.0)
-    perfil = crear_perfil_simple(0.0, 10.0, 20.0, 0.0, 10)
-    estrato = Estrato(cohesion=10.0, phi_grados=30.0, gamma=18.0, nombre="Arena")
+    perfil = perfil_talud
+    estrato = estrato_arena
     
     resultados = validar_entrada_completa(circulo, perfil, estrato)
     
-    print("Validación completa de entrada:")
+    logger.debug("Validación completa de entrada:")
     todas_validas, mensajes = validar_y_reportar(resultados)
     
     for mensaje in mensajes:
-        print(f"  {mensaje}")
+        logger.debug("  %s", mensaje)
     
-    print(f"\n¿Todas válidas?: {todas_validas}")
+    logger.debug("\n¿Todas válidas?: %s", todas_validas)
     assert todas_validas, "Entrada válida debe pasar todas las validaciones"
     
-    print("✅ Test validación completa PASADO\n")
+    logger.debug("✅ Test validación completa PASADO\n")
 
 
 def test_manejo_errores():
     """Test para manejo de errores y excepciones"""
-    print("=== TEST MANEJO DE ERRORES ===")
+    logger.debug("=== TEST MANEJO DE ERRORES ===")
     
     # Crear resultado inválido
     resultado_invalido = ResultadoValidacion(
@@ -330,47 +354,52 @@ def test_manejo_errores():
         valor_problematico=42.0
     )
     
-    print(f"Resultado inválido: {resultado_invalido.mensaje}")
-    print(f"  Código: {resultado_invalido.codigo_error}")
-    print(f"  Valor problemático: {resultado_invalido.valor_problematico}")
+    logger.debug("Resultado inválido: %s", resultado_invalido.mensaje)
+    logger.debug("  Código: %s", resultado_invalido.codigo_error)
+    logger.debug("  Valor problemático: %s", resultado_invalido.valor_problematico)
     
     # Test lanzar_si_invalido
     try:
         lanzar_si_invalido(resultado_invalido)
         assert False, "Debería haber lanzado excepción"
     except ValidacionError as e:
-        print(f"  Excepción capturada: {e}")
-        print(f"  Código error: {e.codigo_error}")
+        logger.debug("  Excepción capturada: %s", e)
+        logger.debug("  Código error: %s", e.codigo_error)
         assert e.codigo_error == "TEST_ERROR"
         assert e.valor_problematico == 42.0
     
-    print("✅ Test manejo de errores PASADO\n")
+    logger.debug("✅ Test manejo de errores PASADO\n")
 
 
 def main():
     """Ejecutar todos los tests"""
-    print("🧪 INICIANDO TESTS DE VALIDACIÓN")
-    print("=" * 50)
+    logger.debug("🧪 INICIANDO TESTS DE VALIDACIÓN")
+    logger.debug("=" * 50)
+    
+    # Fuera de pytest los datos compartidos se construyen aquí
+    perfil_talud = _crear_perfil_talud()
+    estrato_arena = _crear_estrato_arena()
     
     try:
-        test_validar_parametros_geotecnicos()
-        test_validar_geometria_circulo()
+        test_validar_parametros_geotecnicos(estrato_arena)
+        test_validar_geometria_circulo(perfil_talud)
         test_validar_dovela()
-        test_validar_conjunto_dovelas()
+        test_validar_conjunto_dovelas(estrato_arena)
         test_validar_convergencia_bishop()
         test_validar_factor_seguridad()
         test_validar_perfil_terreno()
-        test_validacion_completa()
+        test_validacion_completa(perfil_talud, estrato_arena)
         test_manejo_errores()
         
-        print("🎉 TODOS LOS TESTS DE VALIDACIÓN PASARON EXITOSAMENTE")
-        print("✅ El sistema de validaciones está funcionando correctamente")
-        print("✅ Todas las validaciones críticas implementadas y probadas")
+        logger.debug("🎉 TODOS LOS TESTS DE VALIDACIÓN PASARON EXITOSAMENTE")
+        logger.debug("✅ El sistema de validaciones está funcionando correctamente")
+        logger.debug("✅ Todas las validaciones críticas implementadas y probadas")
         
     except Exception as e:
-        print(f"❌ ERROR EN TESTS: {e}")
+        logger.debug("❌ ERROR EN TESTS: %s", e)
         raise
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     main()
@@ -3,8 +3,32 @@ FASE 4 FINAL: OPTIMIZACIÓN DE PARÁMETROS
 Ajustar parámetros de suelo para obtener factores de seguridad realistas
 """
 
-from data.models import CirculoFalla, Estrato
-from core.bishop import analizar_bishop
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional, Tuple
+
+from data.models import CirculoFalla, Estrato, DovelaArrays
+from data.validation import validar_entrada_completa
+from core.geometry import crear_dovelas
+from core.bishop import analizar_bishop_geometria
+
+
+def _evaluar_parametros(estrato: Estrato, geometria: Optional[DovelaArrays],
+                        circulo: CirculoFalla) -> Optional[Tuple[bool, float]]:
+    """
+    Analiza un juego de parámetros (se ejecuta en un proceso del pool).
+
+    Returns:
+        (válido y convergido, FS), o None si el análisis lanzó una excepción
+    """
+    try:
+        if geometria is None:
+            raise ValueError("Geometría del círculo inválida")
+        resultado = analizar_bishop_geometria(geometria, circulo, estrato)
+        return resultado.es_valido and resultado.convergio, resultado.factor_seguridad
+    except Exception:
+        return None
+
 
 def encontrar_parametros_optimizados():
     """
@@ -38,48 +62,52 @@ def encontrar_parametros_optimizados():
     
     resultados_optimizados = []
     
+    # La geometría de las dovelas no depende de c ni φ: se valida y discretiza una sola vez
+    estratos = [
+        Estrato(cohesion=params["cohesion"], phi_grados=params["phi"], gamma=18.0, nombre=params["nombre"])
+        for params in parametros_test
+    ]
+    geometria = None
+    if all(v.es_valido for v in validar_entrada_completa(circulo, perfil_terreno, estratos[0])):
+        geometria = DovelaArrays.desde_dovelas(crear_dovelas(circulo, perfil_terreno, estratos[0], num_dovelas=8))
+    
     print(f"\n📊 ANÁLISIS DE SENSIBILIDAD:")
     print(f"{'Nombre':<25} {'c(kPa)':<7} {'φ(°)':<5} {'FS':<6} {'Clasificación'}")
     print("-" * 70)
     
-    for params in parametros_test:
-        estrato = Estrato(
-            cohesion=params["cohesion"],
-            phi_grados=params["phi"],
-            gamma=18.0,
-            nombre=params["nombre"]
-        )
+    # Cada juego de parámetros es independiente: se reparten entre procesos
+    with ProcessPoolExecutor() as ejecutor:
+        evaluaciones = list(ejecutor.map(partial(_evaluar_parametros, geometria=geometria, circulo=circulo),
+                                         estratos))
+    
+    for params, evaluacion in zip(parametros_test, evaluaciones):
+        if evaluacion is None:
+            print(f"{params['nombre']:<25} {params['cohesion']:<7} {params['phi']:<5} {'ERROR':<6} ❌ EXCEPCIÓN")
+            continue
         
-        try:
-            resultado = analizar_bishop(circulo, perfil_terreno, estrato, num_dovelas=8)
-            
-            if resultado.es_valido and resultado.convergio:
-                fs = resultado.factor_seguridad
-                
-                # Clasificar según estándares profesionales
-                if fs < 1.0:
-                    clasificacion = "❌ INESTABLE"
-                elif 1.0 <= fs < 1.3:
-                    clasificacion = "🔶 CRÍTICO"
-                elif 1.3 <= fs < 1.8:
-                    clasificacion = "✅ ESTABLE"
-                elif 1.8 <= fs <= 3.0:
-                    clasificacion = "⭐ MUY ESTABLE"
-                else:
-                    clasificacion = "⚠️ EXCESIVO"
-                
-                resultados_optimizados.append({
-                    **params,
-                    "fs": fs,
-                    "clasificacion": clasificacion
-                })
-                
-                print(f"{params['nombre']:<25} {params['cohesion']:<7} {params['phi']:<5} {fs:<6.3f} {clasificacion}")
+        valido, fs = evaluacion
+        if valido:
+            # Clasificar según estándares profesionales
+            if fs < 1.0:
+                clasificacion = "❌ INESTABLE"
+            elif 1.0 <= fs < 1.3:
+                clasificacion = "🔶 CRÍTICO"
+            elif 1.3 <= fs < 1.8:
+                clasificacion = "✅ ESTABLE"
+            elif 1.8 <= fs <= 3.0:
+                clasificacion = "⭐ MUY ESTABLE"
             else:
-                print(f"{params['nombre']:<25} {params['cohesion']:<7} {params['phi']:<5} {'ERROR':<6} ❌ NO VÁLIDO")
-                
-        except Exception as e:
-            print(f"{params['nombre']:<25} {params['cohesion']:<7} {params['phi']:<5} {'ERROR':<6} ❌ EXCEPCIÓN")
+                clasificacion = "⚠️ EXCESIVO"
+            
+            resultados_optimizados.append({
+                **params,
+                "fs": fs,
+                "clasificacion": clasificacion
+            })
+            
+            print(f"{params['nombre']:<25} {params['cohesion']:<7} {params['phi']:<5} {fs:<6.3f} {clasificacion}")
+        else:
+            print(f"{params['nombre']:<25} {params['cohesion']:<7} {params['phi']:<5} {'ERROR':<6} ❌ NO VÁLIDO")
     
     # Seleccionar los mejores parámetros para cada categoría
     print(f"\n🎯 PARÁMETROS OPTIMIZADOS RECOMENDADOS:")
@@ -2,12 +2,17 @@
 Optimiza círculos de los casos de ejemplo para obtener factores de seguridad realistas
 """
 
+import math
 import re
-from typing import Tuple, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, List, Optional
+
+import numpy as np
 
 from gui_examples import CASOS_EJEMPLO, calcular_perfil_terreno
-from core.geometry import CirculoFalla, Estrato, crear_dovelas
-from core.bishop import analizar_bishop
+from core.geometry import Estrato
+from core.bishop import analizar_bishop_batch
+from data.validation import validar_parametros_geotecnicos, validar_perfil_terreno
 
 
 def rango_objetivo(descripcion: str) -> Tuple[float, float]:
@@ -25,10 +30,43 @@ def rango_objetivo(descripcion: str) -> Tuple[float, float]:
     return 1.5, 3.0
 
 
-def optimizar_circulo(caso: dict) -> Tuple[float, float, float, float]:
-    """Busca círculo con FS en rango objetivo, devuelve mejor (cx, cy, r, fs) o None"""
+NUM_DOVELAS = 10
+# La búsqueda solo necesita ubicar el FS en una ventana de ~0.2: la iteración de
+# Bishop en float32 basta y mueve la mitad de datos. False vuelve a float64.
+USAR_FP32 = True
+
+
+def _circulo_puede_cortar(xc, yc, radio, x_min: float, x_max: float, y_max: float):
+    """
+    Descarte O(1) de círculos que no pueden cortar el perfil: el punto más
+    bajo debe quedar bajo la cota máxima y el círculo debe solaparse en X
+    con el perfil. Acepta escalares o arreglos.
+    """
+    return ((yc - radio) < y_max) & ((xc - radio) < x_max) & ((xc + radio) > x_min)
+
+
+def _fs_lote(perfil, estrato, centro_x: float, cy, radios) -> List[Optional[float]]:
+    """FS de Bishop para varios círculos de una vez (None si no es analizable)"""
+    radios = np.asarray(radios, dtype=float)
+    resultado = analizar_bishop_batch(
+        np.full(len(radios), centro_x), np.broadcast_to(np.asarray(cy, dtype=float), radios.shape),
+        radios, perfil, estrato, num_dovelas=NUM_DOVELAS,
+        dtype=np.float32 if USAR_FP32 else np.float64
+    )
+    return [None if math.isnan(fs) else fs for fs in resultado.factor_seguridad.tolist()]
+
+
+def optimizar_circulo(caso: dict) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Busca círculo con FS en rango objetivo, devuelve mejor (cx, cy, r, fs) o None.
+
+    Los FS de los radios extremos de cada cy se calculan en un solo lote con
+    analizar_bishop_batch; si el FS objetivo queda entre ambos se biseca
+    sobre el radio evaluando solo los puntos medios.
+    """
     # Rango objetivo
     fs_min, fs_max = rango_objetivo(caso['esperado'])
+    objetivo = (fs_min + fs_max) / 2
 
     # fijar centro_x como 17-18 basado en geometría
     centro_x = 18.0
@@ -37,38 +75,90 @@ def optimizar_circulo(caso: dict) -> Tuple[float, float, float, float]:
     best_diff = float('inf')
     # Rango de búsqueda
     altura = caso['altura']
-
-    for cy in [round(y, 1) for y in frange(4.0, altura*1.3, 0.5)]:
-        for radio in [round(r, 1) for r in frange(12.0, altura*3.0, 1.0)]:
-            try:
-                circulo = CirculoFalla(centro_x, cy, radio)
-                estrato = Estrato(caso['cohesion'], caso['phi_grados'], caso['gamma'])
-                dovelas = crear_dovelas(circulo, caso['perfil_terreno'], estrato, 10)
-                res = analizar_bishop(circulo, caso['perfil_terreno'], estrato, 10)
-                fs = res['factor_seguridad']
-                if fs_min <= fs <= fs_max:
-                    return centro_x, cy, radio, fs
-                diff = abs((fs_min+fs_max)/2 - fs)
+    perfil = caso['perfil_terreno']
+    estrato = Estrato(caso['cohesion'], caso['phi_grados'], caso['gamma'])
+    cy_arr = _rango(4.0, altura*1.3, 0.5)
+    r_arr = _rango(12.0, altura*3.0, 1.0)
+    # Un círculo cuyo punto más bajo (cy - r) no queda bajo la corona no corta el talud
+    cy_grid, r_grid = np.meshgrid(cy_arr, r_arr, indexing='ij')
+    candidatos = (cy_grid - r_grid) < altura
+
+    if not (validar_parametros_geotecnicos(estrato).es_valido and validar_perfil_terreno(perfil).es_valido):
+        return None
+    xs_perfil = [p[0] for p in perfil]
+    candidatos &= _circulo_puede_cortar(centro_x, cy_grid, r_grid,
+                                        min(xs_perfil), max(xs_perfil), max(p[1] for p in perfil))
+
+    # Radio mínimo y máximo de cada cy, todos en un único lote de Bishop
+    radios_por_fila = [r_arr[fila].tolist() for fila in candidatos]
+    filas = [fila for fila, radios in enumerate(radios_por_fila) if radios]
+    fs_extremos = _fs_lote(perfil, estrato, centro_x,
+                           [cy_arr[fila] for fila in filas for _ in range(2)],
+                           [radios_por_fila[fila][k] for fila in filas for k in (0, -1)])
+
+    for n, fila in enumerate(filas):
+        cy = float(cy_arr[fila])
+        radios = radios_por_fila[fila]
+        evaluados = {radios[0]: fs_extremos[2*n], radios[-1]: fs_extremos[2*n + 1]}
+
+        def fs_en(radio):
+            nonlocal best, best_diff
+            if radio not in evaluados:
+                evaluados[radio] = _fs_lote(perfil, estrato, centro_x, cy, [radio])[0]
+            fs = evaluados[radio]
+            if fs is not None:
+                diff = abs(objetivo - fs)
                 if diff < best_diff and 0.5 < fs < 10:
                     best_diff = diff
                     best = (centro_x, cy, radio, fs)
-            except Exception:
-                continue
+            return fs
+
+        # Extremos analizables del rango de radios
+        r_lo = next((r for r in radios if fs_en(r) is not None), None)
+        if r_lo is None:
+            continue
+        r_hi = next(r for r in reversed(radios) if fs_en(r) is not None)
+
+        for radio in (r_lo, r_hi):
+            fs = evaluados[radio]
+            if fs_min <= fs <= fs_max:
+                return centro_x, cy, radio, fs
+
+        # Sin cambio de signo respecto al objetivo no hay nada que bisecar
+        signo_lo = evaluados[r_lo] > objetivo
+        if signo_lo == (evaluados[r_hi] > objetivo):
+            continue
+
+        while r_hi - r_lo >= 0.25:
+            r_mid = round((r_lo + r_hi) / 2, 1)
+            if r_mid in (r_lo, r_hi):
+                break
+            fs = fs_en(r_mid)
+            if fs is None:
+                break
+            if fs_min <= fs <= fs_max:
+                return centro_x, cy, r_mid, fs
+            if (fs > objetivo) == signo_lo:
+                r_lo = r_mid
+            else:
+                r_hi = r_mid
+
     return best  # Puede ser None
 
 
-def frange(start: float, stop: float, step: float):
-    x = start
-    while x <= stop:
-        yield x
-        x += step
+def _rango(inicio: float, fin: float, paso: float) -> np.ndarray:
+    """Valores inicio, inicio+paso, ... hasta fin inclusive, redondeados a 0.1"""
+    n = int(np.floor((fin - inicio) / paso + 1e-9)) + 1
+    return np.round(inicio + paso * np.arange(max(n, 0)), 1)
 
 
 def main():
     nuevos_casos = {}
-    for nombre, caso in CASOS_EJEMPLO.items():
+    # Los casos son independientes: se optimizan en paralelo y se reportan en orden
+    with ProcessPoolExecutor() as ejecutor:
+        configs = list(ejecutor.map(optimizar_circulo, CASOS_EJEMPLO.values()))
+    for (nombre, caso), config in zip(CASOS_EJEMPLO.items(), configs):
         print(f"\n🔍 Optimizando {nombre}")
-        config = optimizar_circulo(caso)
         if config:
             cx, cy, radio, fs = config
             print(f"  ✅ Config encontrada: FS={fs:.3f}, cx={cx}, cy={cy}, r={radio}")
@@ -81,32 +171,17 @@ def main():
             print("  ❌ No se encontró configuración adecuada, se mantiene original")
             nuevos_casos[nombre] = caso
 
-    # Generar código para reemplazar gui_examples
+    # Guardar los casos para gui_examples_opt
     generar_nuevo_gui(nuevos_casos)
 
 
 def generar_nuevo_gui(casos: dict):
-    """Escribe un nuevo archivo gui_examples_opt.py para inspección"""
+    """Escribe gui_examples_opt.json, que gui_examples_opt carga al usarse"""
     import json
-    content = """# Casos de ejemplo optimizados automáticamente para FS realistas
-
-import math
-
-def calcular_perfil_terreno(altura, angulo_talud, longitud_total=40):
-    angulo_rad = math.radians(angulo_talud)
-    proyeccion_horizontal = altura / math.tan(angulo_rad)
-    return [
-        (0, altura),
-        (longitud_total * 0.3, altura),
-        (longitud_total * 0.3 + proyeccion_horizontal, 0),
-        (longitud_total, 0)
-    ]
-
-CASOS_EJEMPLO = """ + json.dumps(casos, indent=4) + """
-"""
-    with open('gui_examples_opt.py', 'w', encoding='utf-8') as f:
-        f.write(content)
-    print("\n📄 Archivo gui_examples_opt.py generado")
+    from gui_examples_opt import RUTA_CASOS
+    with open(RUTA_CASOS, 'w', encoding='utf-8') as f:
+        json.dump(casos, f, ensure_ascii=False)
+    print(f"\n📄 Archivo {RUTA_CASOS.name} generado")
 
 if __name__ == "__main__":
     main()
@@ -3,50 +3,41 @@
 Script de inicio para la interfaz gráfica del sistema de análisis de estabilidad de taludes.
 """
 
+import importlib.util
 import sys
 import os
 
 # Agregar el directorio actual al path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# (módulo, nombre para mostrar, paquete pip)
+DEPENDENCIAS = [
+    ("customtkinter", "CustomTkinter", "customtkinter"),
+    ("matplotlib", "Matplotlib", "matplotlib"),
+    ("numpy", "NumPy", "numpy"),
+]
+
 def main():
     """Función principal para iniciar la aplicación GUI."""
     try:
-        # Verificar dependencias
+        # Verificar dependencias sin importarlas: find_spec no ejecuta el código
+        # del módulo, así que el costo de importar matplotlib y compañía se paga
+        # una sola vez al cargar la GUI
         print("Verificando dependencias...")
         
-        try:
-            import customtkinter
-            print("✓ CustomTkinter disponible")
-        except ImportError:
-            print("✗ CustomTkinter no encontrado")
-            print("Instale con: pip install customtkinter")
-            return False
-        
-        try:
-            import matplotlib
-            print("✓ Matplotlib disponible")
-        except ImportError:
-            print("✗ Matplotlib no encontrado")
-            print("Instale con: pip install matplotlib")
-            return False
-        
-        try:
-            import numpy
-            print("✓ NumPy disponible")
-        except ImportError:
-            print("✗ NumPy no encontrado")
-            print("Instale con: pip install numpy")
-            return False
+        for modulo, nombre, paquete in DEPENDENCIAS:
+            if importlib.util.find_spec(modulo) is None:
+                print(f"✗ {nombre} no encontrado")
+                print(f"Instale con: pip install {paquete}")
+                return False
+            print(f"✓ {nombre} disponible")
         
         # Verificar módulos del proyecto
-        try:
-            from core.bishop import analizar_bishop
-            from core.fellenius import analizar_fellenius
-            print("✓ Módulos de análisis disponibles")
-        except ImportError as e:
-            print(f"✗ Error importando módulos de análisis: {e}")
+        faltantes = [modulo for modulo in ("core", "gui_app") if importlib.util.find_spec(modulo) is None]
+        if faltantes:
+            print(f"✗ Módulos del proyecto no encontrados: {', '.join(faltantes)}")
             return False
+        print("✓ Módulos de análisis disponibles")
         
         try:
             from gui_app import SlopeStabilityApp
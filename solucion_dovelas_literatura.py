@@ -3,120 +3,194 @@ SOLUCIÓN PARA DOVELAS EN CASOS DE LITERATURA TÉCNICA
 Corrige el problema de "altura inválida" en dovelas para casos reales
 """
 
-from data.models import CirculoFalla, Estrato, Dovela
-from core.geometry import crear_dovelas, interpolar_terreno, calcular_y_circulo
+from data.models import CirculoFalla, Estrato, Dovela, DovelaArrays
+from core.geometry import crear_dovelas, perfil_a_arreglos, interpolar_terreno_vec
 from core.bishop import analizar_bishop
 from core.fellenius import analizar_fellenius
+import logging
 import math
+import numpy as np
+from logging_utils import get_logger
+from utils.jit import njit
+
+logger = get_logger(__name__)
+
+
+@njit(cache=True)
+def _build_dovelas_kernel(xs, perfil_x, perfil_y, xc, yc, r):
+    """
+    Kernel numérico de construcción de dovelas.
+
+    Args:
+        xs: Bordes de las dovelas (n+1 valores crecientes)
+        perfil_x: Coordenadas X del perfil, ordenadas
+        perfil_y: Coordenadas Y del perfil
+        xc, yc, r: Centro y radio del círculo
+
+    Returns:
+        Tupla de arreglos (x_centro, altura, ancho, angulo, y_base,
+        y_superficie, longitud_arco, valido) de longitud n
+    """
+    # Nombres locales: sin numba el bucle corre en Python y evita buscar en el módulo math
+    sqrt = math.sqrt
+    asin = math.asin
+    atan2 = math.atan2
+    searchsorted = np.searchsorted
+    r_sq = r * r
+    n = xs.shape[0] - 1
+    m = perfil_x.shape[0]
+    x_centro = np.empty(n)
+    altura = np.empty(n)
+    ancho = np.empty(n)
+    angulo = np.empty(n)
+    y_base = np.empty(n)
+    y_superficie = np.empty(n)
+    longitud_arco = np.empty(n)
+    valido = np.zeros(n, dtype=np.bool_)
+    x_min = perfil_x[0]
+    x_max = perfil_x[m - 1]
+    limite_angulo = math.radians(60.0)
+
+    for i in range(n):
+        xi = 0.5 * (xs[i] + xs[i + 1])
+        x_centro[i] = xi
+        ancho[i] = xs[i + 1] - xs[i]
+
+        # Longitud de arco entre los bordes de la dovela
+        s0 = min(max((xs[i] - xc) / r, -1.0), 1.0)
+        s1 = min(max((xs[i + 1] - xc) / r, -1.0), 1.0)
+        longitud_arco[i] = r * abs(asin(s1) - asin(s0))
+
+        # Elevación del terreno por interpolación lineal (búsqueda binaria)
+        j = searchsorted(perfil_x, xi)
+        if j <= 0:
+            yt = perfil_y[0]
+        elif j >= m:
+            yt = perfil_y[m - 1]
+        else:
+            x0 = perfil_x[j - 1]
+            x1 = perfil_x[j]
+            if x1 == x0:
+                yt = perfil_y[j]
+            else:
+                yt = perfil_y[j - 1] + (xi - x0) * (perfil_y[j] - perfil_y[j - 1]) / (x1 - x0)
+        y_superficie[i] = yt
+
+        # Sin saltos por dovela: fuera del círculo el discriminante se recorta
+        # a 0 (y_base = yc), el ángulo se anula y la máscara la descarta
+        dx = xi - xc
+        disc = r_sq - dx * dx
+        en_circulo = disc >= 0.0
+        yb = yc - sqrt(max(disc, 0.0))
+        y_base[i] = yb
+        h = yt - yb
+        altura[i] = h
+        # Ángulo alpha del radio respecto a la vertical (tangente al círculo)
+        a = atan2(dx, yc - yb) * en_circulo
+        angulo[i] = a
+
+        # Solo dovelas sobre el perfil, con altura entre 10cm y 50m y ángulo razonable para Bishop
+        valido[i] = (
+            en_circulo
+            and xi >= x_min and xi <= x_max
+            and h > 0.1 and h < 50.0
+            and abs(a) <= limite_angulo
+            and longitud_arco[i] > 0.0
+        )
+
+    return x_centro, altura, ancho, angulo, y_base, y_superficie, longitud_arco, valido
+
 
 def crear_dovelas_literatura(circulo, perfil_terreno, estrato, num_dovelas=20):
     """
     Versión mejorada de crear_dovelas que maneja casos de literatura técnica.
     Evita crear dovelas donde el círculo se extiende más allá del terreno.
+
+    Todo el cálculo geométrico se hace sobre arreglos NumPy; solo se construyen
+    objetos Dovela para las posiciones que superan los filtros.
+    """
+    return crear_dovelas_literatura_arrays(circulo, perfil_terreno, estrato, num_dovelas).a_dovelas()
+
+
+def crear_dovelas_literatura_estructurado(circulo, perfil_terreno, estrato, num_dovelas=20):
+    """
+    Igual que crear_dovelas_literatura, pero devuelve un arreglo estructurado
+    DOVELA_DTYPE (un registro por dovela). Para acceso por atributos a una
+    dovela concreta usar DovelaVista(registros[i]).
     """
-    print(f"DEBUG: Iniciando crear_dovelas_literatura")
-    print(f"DEBUG: Círculo centro=({circulo.xc}, {circulo.yc}), radio={circulo.radio}")
-    print(f"DEBUG: Perfil: {perfil_terreno}")
+    return crear_dovelas_literatura_arrays(circulo, perfil_terreno, estrato, num_dovelas).a_estructurado()
+
+
+def crear_dovelas_literatura_arrays(circulo, perfil_terreno, estrato, num_dovelas=20):
+    """
+    Igual que crear_dovelas_literatura, pero devuelve las dovelas en formato
+    columnar (DovelaArrays) para los cálculos vectorizados.
+    """
+    logger.debug("Iniciando crear_dovelas_literatura")
+    logger.debug("Círculo centro=(%s, %s), radio=%s", circulo.xc, circulo.yc, circulo.radio)
+    logger.debug("Perfil: %s", perfil_terreno)
     
-    # Determinar intersecciones reales del círculo con el terreno
-    x_min_perfil = min(p[0] for p in perfil_terreno) 
-    x_max_perfil = max(p[0] for p in perfil_terreno)
+    xc, yc, radio = circulo.xc, circulo.yc, circulo.radio
     
-    print(f"DEBUG: Rango perfil X: [{x_min_perfil}, {x_max_perfil}]")
+    # Perfil como arreglos ordenados por X (una sola vez; la búsqueda de segmentos es binaria)
+    perfil_x, perfil_y = perfil_a_arreglos(perfil_terreno)
     
-    # Encontrar intersecciones válidas del círculo con el terreno
-    intersecciones_validas = []
+    # Determinar intersecciones reales del círculo con el terreno
+    x_min_perfil = float(perfil_x[0])
+    x_max_perfil = float(perfil_x[-1])
     
-    # Buscar intersecciones con tolerancia
-    for x in range(int(x_min_perfil), int(x_max_perfil) + 1):
-        try:
-            y_terreno = interpolar_terreno(x, perfil_terreno)
-            y_circulo = calcular_y_circulo(x, circulo.xc, circulo.yc, circulo.radio, parte_superior=False)
-            
-            if y_circulo is not None:
-                # Si el círculo está cerca del terreno, es una intersección válida
-                if abs(y_circulo - y_terreno) < 1.0:  # 1m de tolerancia
-                    intersecciones_validas.append(x)
-                    print(f"DEBUG: Intersección válida en X={x}: terreno={y_terreno:.2f}, círculo={y_circulo:.2f}")
-        except Exception as e:
-            print(f"DEBUG: Error en X={x}: {e}")
-            continue
+    logger.debug("Rango perfil X: [%s, %s]", x_min_perfil, x_max_perfil)
+    
+    # Buscar intersecciones con tolerancia en las X enteras del perfil
+    xs = np.arange(math.ceil(x_min_perfil), math.floor(x_max_perfil) + 1, dtype=float)
+    disc = radio**2 - (xs - xc)**2
+    dentro = disc >= 0
+    y_terreno = interpolar_terreno_vec(xs, perfil_x, perfil_y)
+    y_circulo = yc - np.sqrt(np.where(dentro, disc, 0.0))
+    # Si el círculo está cerca del terreno (1m de tolerancia), es una intersección válida
+    intersecciones_validas = xs[dentro & (np.abs(y_circulo - y_terreno) < 1.0)]
     
-    print(f"DEBUG: Intersecciones válidas encontradas: {intersecciones_validas}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Intersecciones válidas encontradas: %s", intersecciones_validas.tolist())
     
     if len(intersecciones_validas) < 2:
         # Si no hay suficientes intersecciones, usar el rango completo pero limitado
-        x_inicio = max(circulo.xc - circulo.radio * 0.8, x_min_perfil)
-        x_fin = min(circulo.xc + circulo.radio * 0.8, x_max_perfil)
-        print(f"DEBUG: Usando rango limitado: [{x_inicio:.1f}, {x_fin:.1f}]")
+        x_inicio = max(xc - radio * 0.8, x_min_perfil)
+        x_fin = min(xc + radio * 0.8, x_max_perfil)
+        logger.debug("Usando rango limitado: [%.1f, %.1f]", x_inicio, x_fin)
     else:
         # Usar las intersecciones encontradas con un poco de margen
-        x_inicio = max(min(intersecciones_validas) - 2, x_min_perfil)
-        x_fin = min(max(intersecciones_validas) + 2, x_max_perfil)
-        print(f"DEBUG: Usando rango de intersecciones: [{x_inicio:.1f}, {x_fin:.1f}]")
+        x_inicio = max(float(intersecciones_validas.min()) - 2, x_min_perfil)
+        x_fin = min(float(intersecciones_validas.max()) + 2, x_max_perfil)
+        logger.debug("Usando rango de intersecciones: [%.1f, %.1f]", x_inicio, x_fin)
     
     # Crear dovelas solo en el rango válido
-    ancho_total = x_fin - x_inicio
-    ancho_dovela = ancho_total / num_dovelas
+    bordes = np.linspace(x_inicio, x_fin, num_dovelas + 1)
+    ancho_dovela = (x_fin - x_inicio) / num_dovelas
     
-    print(f"DEBUG: Ancho total={ancho_total:.2f}, ancho dovela={ancho_dovela:.2f}")
+    logger.debug("Ancho total=%.2f, ancho dovela=%.2f", x_fin - x_inicio, ancho_dovela)
     
-    dovelas = []
-    dovelas_rechazadas = 0
+    # Geometría de todas las dovelas candidatas
+    (x_centros, altura, anchos, angulo_alpha, y_circulo, y_terreno,
+     longitud_arco, mascara) = _build_dovelas_kernel(bordes, perfil_x, perfil_y, xc, yc, radio)
     
-    for i in range(num_dovelas):
-        x_centro = x_inicio + (i + 0.5) * ancho_dovela
-        
-        # Verificar que este punto está realmente en el perfil
-        if x_centro < x_min_perfil or x_centro > x_max_perfil:
-            dovelas_rechazadas += 1
-            print(f"DEBUG: Dovela {i} rechazada - fuera de perfil: X={x_centro:.2f}")
-            continue
-            
-        try:
-            y_terreno = interpolar_terreno(x_centro, perfil_terreno)
-            y_circulo = calcular_y_circulo(x_centro, circulo.xc, circulo.yc, circulo.radio, parte_superior=False)
-            
-            if y_circulo is None:
-                dovelas_rechazadas += 1
-                print(f"DEBUG: Dovela {i} rechazada - sin intersección círculo")
-                continue
-                
-            altura = y_terreno - y_circulo
-            
-            # Solo crear dovela si tiene altura positiva y razonable
-            if altura > 0.1 and altura < 50:  # Entre 10cm y 50m
-                # Calcular ángulo alpha (tangente al círculo)
-                dx = x_centro - circulo.xc
-                dy = y_circulo - circulo.yc
-                angulo_alpha = math.degrees(math.atan2(dx, dy))
-                
-                # Solo crear dovela si el ángulo es razonable para Bishop
-                if -60 <= angulo_alpha <= 60:
-                    dovela = Dovela(
-                        x_centro=x_centro,
-                        y_centro=(y_terreno + y_circulo) / 2,
-                        ancho=ancho_dovela,
-                        altura=altura,
-                        angulo_alpha=angulo_alpha,
-                        estrato=estrato
-                    )
-                    dovelas.append(dovela)
-                    print(f"DEBUG: Dovela {i} creada - X={x_centro:.2f}, altura={altura:.2f}, α={angulo_alpha:.1f}°")
-                else:
-                    dovelas_rechazadas += 1
-                    print(f"DEBUG: Dovela {i} rechazada - ángulo extremo: α={angulo_alpha:.1f}°")
-            else:
-                dovelas_rechazadas += 1
-                print(f"DEBUG: Dovela {i} rechazada - altura inválida: {altura:.2f}m")
-                    
-        except Exception as e:
-            # Si hay error en esta dovela, continuar con la siguiente
-            dovelas_rechazadas += 1
-            print(f"DEBUG: Dovela {i} rechazada - error: {e}")
-            continue
+    n_validas = int(np.count_nonzero(mascara))
+    dovelas = DovelaArrays(
+        x_centro=x_centros[mascara],
+        ancho=np.full(n_validas, ancho_dovela),
+        altura=altura[mascara],
+        angulo_alpha=angulo_alpha[mascara],
+        cohesion=np.full(n_validas, float(estrato.cohesion)),
+        phi_grados=np.full(n_validas, float(estrato.phi_grados)),
+        gamma=np.full(n_validas, float(estrato.gamma)),
+        peso=estrato.gamma * altura[mascara] * ancho_dovela,
+        presion_poros=np.zeros(n_validas),
+        longitud_arco=longitud_arco[mascara],
+        y_base=y_circulo[mascara],
+        y_superficie=y_terreno[mascara]
+    )
     
-    print(f"DEBUG: Dovelas creadas: {len(dovelas)}, rechazadas: {dovelas_rechazadas}")
+    logger.debug("Dovelas creadas: %d, rechazadas: %d", n_validas, num_dovelas - n_validas)
     return dovelas
 
 def probar_casos_literatura_mejorados():
@@ -161,7 +235,7 @@ def probar_casos_literatura_mejorados():
             if len(dovelas_mejorado) > 0:
                 # Mostrar algunas propiedades de las dovelas
                 alturas = [d.altura for d in dovelas_mejorado]
-                angulos = [d.angulo_alpha for d in dovelas_mejorado]
+                angulos = [math.degrees(d.angulo_alpha) for d in dovelas_mejorado]
                 print(f"      - Alturas: min={min(alturas):.2f}m, max={max(alturas):.2f}m")
                 print(f"      - Ángulos α: min={min(angulos):.1f}°, max={max(angulos):.1f}°")
                 
@@ -3,11 +3,24 @@
 Script de inicio mejorado para la aplicación GUI de estabilidad de taludes.
 """
 
+import importlib
 import sys
 import os
 import traceback
 from logging_utils import setup_logging
 
+def verificar_modulos() -> bool:
+    """Importa uno a uno los módulos de la GUI e informa cuál falla."""
+    print("Verificando módulos...")
+    for modulo in ("gui_examples", "gui_components", "gui_dialogs", "gui_app"):
+        try:
+            importlib.import_module(modulo)
+            print(f"✓ {modulo}")
+        except Exception as e:
+            print(f"✗ {modulo}: {e}")
+            return False
+    return True
+
 def main():
     """Función principal con manejo de errores."""
     try:
@@ -15,38 +28,14 @@ def main():
         print("Iniciando aplicación GUI de Estabilidad de Taludes...")
         print("=" * 50)
         
-        # Verificar imports
-        print("Verificando módulos...")
-        
-        try:
-            from gui_examples import get_caso_ejemplo, get_nombres_casos
-            print("✓ gui_examples")
-        except Exception as e:
-            print(f"✗ gui_examples: {e}")
-            return
-        
-        try:
-            import gui_components
-            print("✓ gui_components")
-        except Exception as e:
-            print(f"✗ gui_components: {e}")
-            return
-        
-        try:
-            import gui_dialogs
-            print("✓ gui_dialogs")
-        except Exception as e:
-            print(f"✗ gui_dialogs: {e}")
-            return
-        
-        try:
-            from gui_app import SlopeStabilityApp
-            print("✓ gui_app")
-        except Exception as e:
-            print(f"✗ gui_app: {e}")
-            return
+        # La verificación módulo por módulo solo con --check: en el arranque
+        # normal basta importar la aplicación, que carga lo que necesita
+        if "--check" in sys.argv[1:]:
+            if not verificar_modulos():
+                return
+            print("\nTodos los módulos importados correctamente.")
         
-        print("\nTodos los módulos importados correctamente.")
+        from gui_app import SlopeStabilityApp
         print("Iniciando aplicación...")
         print("=" * 50)
         
@@ -0,0 +1,104 @@
+"""
+Fixtures compartidas por la suite.
+
+Se construyen una sola vez por sesión; los tests no deben modificarlas.
+Las fixtures de GUI son la excepción: ventana y app se restablecen al
+terminar cada test.
+"""
+
+import os
+
+import matplotlib
+import pytest
+
+# Backend sin ventana para toda la sesión: los gráficos no necesitan DISPLAY
+# y no se arranca Tk solo para dibujar en memoria. Los paneles de la GUI usan
+# FigureCanvasTkAgg directamente y no dependen del backend de pyplot.
+matplotlib.use("Agg")
+
+
+@pytest.fixture(scope="session")
+def perfil_simple():
+    """Talud recto de 10 m de altura sobre 40 m de base."""
+    from core.geometry import crear_perfil_simple
+    return crear_perfil_simple(0.0, 10.0, 40.0, 0.0, 25)
+
+
+@pytest.fixture(scope="session")
+def estrato_arcilla():
+    """Arcilla típica (c=15 kPa, φ=22°, γ=19 kN/m³)."""
+    from data.models import Estrato
+    return Estrato(cohesion=15.0, phi_grados=22.0, gamma=19.0, nombre="Arcilla")
+
+
+@pytest.fixture(scope="session")
+def circulo_base():
+    """Círculo válido sobre perfil_simple."""
+    from data.models import CirculoFalla
+    return CirculoFalla(xc=20.0, yc=22.0, radio=24.0)
+
+
+@pytest.fixture(scope="session")
+def perfil_talud():
+    """Corona a 10 m hasta X=10, pie en X=20 y base hasta X=40."""
+    return [(0, 10), (10, 10), (20, 0), (40, 0)]
+
+
+@pytest.fixture(scope="session")
+def estrato_arena():
+    """Suelo de referencia de perfil_talud (c=15 kPa, φ=25°, γ=18 kN/m³)."""
+    from data.models import Estrato
+    return Estrato(cohesion=15.0, phi_grados=25.0, gamma=18.0)
+
+
+@pytest.fixture(scope="session")
+def circulo_talud():
+    """Círculo profundo que corta perfil_talud de la corona a la base."""
+    from data.models import CirculoFalla
+    return CirculoFalla(xc=15, yc=5, radio=30)
+
+
+@pytest.fixture(scope="session")
+def validador_geometrico(perfil_simple):
+    """ValidadorGeometrico de perfil_simple."""
+    from validacion_geometrica import ValidadorGeometrico
+    return ValidadorGeometrico(perfil_simple)
+
+
+@pytest.fixture(scope="session")
+def ctk_root():
+    """
+    Ventana CTk compartida: crear una por test cuesta cargar temas y fuentes.
+
+    Es la única raíz Tk de la sesión, porque los paneles crean sus variables
+    Tk sobre la raíz por defecto.
+    """
+    if os.environ.get("DISPLAY", "") == "":
+        pytest.skip("No display available for Tkinter")
+    import customtkinter as ctk
+    root = ctk.CTk()
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def ventana(ctk_root):
+    """ctk_root con los widgets que cree el test destruidos al terminar."""
+    previos = set(ctk_root.winfo_children())
+    yield ctk_root
+    for widget in ctk_root.winfo_children():
+        if widget not in previos:
+            widget.destroy()
+
+
+@pytest.fixture(scope="session")
+def _app_sesion(ctk_root):
+    from gui_app import SlopeStabilityApp
+    return SlopeStabilityApp(root=ctk_root)
+
+
+@pytest.fixture
+def app(_app_sesion):
+    """SlopeStabilityApp sobre ctk_root; clear_results la devuelve al estado inicial."""
+    yield _app_sesion
+    _app_sesion.clear_results()
@@ -1,5 +1,7 @@
-from core.bishop import bishop_talud_homogeneo
+from core.bishop import (bishop_talud_homogeneo, analizar_bishop, analizar_bishop_cacheado,
+                         comparar_bishop_fellenius, limpiar_cache_bishop)
 from core.fellenius import fellenius_talud_homogeneo
+from data.models import CirculoFalla
 
 
 def test_bishop_and_fellenius():
@@ -25,3 +27,30 @@ def test_bishop_and_fellenius():
     )
     assert res_f.es_valido
     assert 0.5 < res_f.factor_seguridad < 10.0
+
+
+def test_bishop_cacheado_reutiliza_resultado(perfil_talud, estrato_arena, circulo_talud):
+    limpiar_cache_bishop()
+    primero = analizar_bishop_cacheado(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8)
+    # Misma clave con objetos distintos: el círculo y el perfil se comparan por contenido
+    segundo = analizar_bishop_cacheado(CirculoFalla(xc=15, yc=5, radio=30), list(perfil_talud), estrato_arena,
+                                       num_dovelas=8)
+    assert segundo is primero
+    directo = analizar_bishop(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8)
+    assert primero.factor_seguridad == directo.factor_seguridad
+
+
+def test_validar_entrada_se_propaga_en_envoltorios(perfil_talud, estrato_arena, circulo_talud):
+    con = comparar_bishop_fellenius(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8)
+    sin = comparar_bishop_fellenius(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8, validar_entrada=False)
+    assert sin['factor_seguridad_bishop'] == con['factor_seguridad_bishop']
+    assert sin['factor_seguridad_fellenius'] == con['factor_seguridad_fellenius']
+
+    limpiar_cache_bishop()
+    validado = analizar_bishop_cacheado(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8)
+    rapido = analizar_bishop_cacheado(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8, validar_entrada=False)
+    assert rapido is not validado
+    assert rapido.factor_seguridad == validado.factor_seguridad
+
+    assert (fellenius_talud_homogeneo(10.0, 45.0, 2.0, 15.0, 18.0, validar_entrada=False).factor_seguridad
+            == fellenius_talud_homogeneo(10.0, 45.0, 2.0, 15.0, 18.0).factor_seguridad)
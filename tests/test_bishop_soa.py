@@ -0,0 +1,220 @@
+import math
+
+import numpy as np
+import pytest
+
+import core.bishop as bishop
+import core.fellenius as fellenius
+from core.bishop import (analizar_bishop, analizar_bishop_soa, analizar_bishop_batch,
+                         analizar_bishop_casos, analizar_bishop_geometria, iteracion_bishop,
+                         calcular_m_alpha, calcular_fuerza_resistente_bishop,
+                         calcular_fuerza_actuante_bishop, MIN_CIRCULOS_POR_PROCESO)
+from core.fellenius import (analizar_fellenius, calcular_fuerza_resistente_dovela,
+                            calcular_fuerza_actuante_dovela)
+from core.geometry import crear_dovelas
+from data.models import CirculoFalla, Estrato, DovelaArrays
+from data.validation import ValidacionError
+from gui_examples import CASOS_EJEMPLO
+
+
+def test_bishop_soa_igual_a_bishop_escalar(perfil_talud, estrato_arena, circulo_talud):
+    escalar = analizar_bishop(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8)
+    arreglos = DovelaArrays.desde_dovelas(crear_dovelas(circulo_talud, perfil_talud, estrato_arena, 8))
+    vectorial = analizar_bishop_soa(arreglos, circulo_talud)
+
+    assert len(arreglos) == len(escalar.dovelas)
+    assert math.isclose(vectorial.factor_seguridad, escalar.factor_seguridad, rel_tol=1e-12)
+    assert vectorial.iteraciones == escalar.iteraciones
+    assert vectorial.advertencias == escalar.advertencias
+    assert vectorial.arreglos is arreglos
+    assert escalar.arreglos.y_base.tolist() == [d.y_base for d in escalar.dovelas]
+
+
+def test_bishop_batch_igual_a_bishop_por_circulo(perfil_talud, estrato_arena):
+    freatico = [(0, 6), (40, -1)]
+    xc = [15.0, 18.0, 18.0, 5.0, 18.0]
+    yc = [5.0, 10.0, 9.0, 40.0, 30.0]
+    radio = [30.0, 19.0, 12.0, 3.0, 31.0]
+
+    lote = analizar_bishop_batch(xc, yc, radio, perfil_talud, estrato_arena, num_dovelas=10,
+                                 nivel_freatico=freatico)
+    for i in range(len(xc)):
+        try:
+            esperado = analizar_bishop(CirculoFalla(xc[i], yc[i], radio[i]), perfil_talud, estrato_arena,
+                                       freatico, num_dovelas=10).factor_seguridad
+        except ValidacionError:
+            assert math.isnan(lote.factor_seguridad[i]) and not lote.convergio[i]
+        else:
+            assert lote.convergio[i]
+            assert math.isclose(lote.factor_seguridad[i], esperado, rel_tol=1e-12)
+
+
+def test_bishop_geometria_reutilizada_entre_estratos(perfil_talud, circulo_talud):
+    base = Estrato(cohesion=5.0, phi_grados=15.0, gamma=18.0)
+    geometria = DovelaArrays.desde_dovelas(crear_dovelas(circulo_talud, perfil_talud, base, 8))
+
+    for estrato in (base, Estrato(cohesion=15.0, phi_grados=25.0, gamma=20.0)):
+        escalar = analizar_bishop(circulo_talud, perfil_talud, estrato, num_dovelas=8)
+        reutilizado = analizar_bishop_geometria(geometria, circulo_talud, estrato)
+        assert math.isclose(reutilizado.factor_seguridad, escalar.factor_seguridad, rel_tol=1e-12)
+        assert reutilizado.advertencias == escalar.advertencias
+
+
+def test_bishop_batch_fp32_cercano_a_fp64(perfil_talud, estrato_arena):
+    xc, yc, radio = [15.0, 18.0, 18.0], [5.0, 10.0, 9.0], [30.0, 19.0, 12.0]
+
+    doble = analizar_bishop_batch(xc, yc, radio, perfil_talud, estrato_arena)
+    simple = analizar_bishop_batch(xc, yc, radio, perfil_talud, estrato_arena, dtype=np.float32)
+    assert simple.factor_seguridad.dtype == np.float64
+    assert simple.convergio.tolist() == doble.convergio.tolist()
+    assert np.allclose(simple.factor_seguridad, doble.factor_seguridad, rtol=1e-5)
+
+
+def test_bishop_batch_fp32_rescata_los_mismos_circulos_que_fp64():
+    # Grilla de optimizar_circulos: casi todos los círculos pasan por el rescate de Brent
+    caso = CASOS_EJEMPLO['Talud Moderado - Arena Densa']
+    estrato = Estrato(caso['cohesion'], caso['phi_grados'], caso['gamma'])
+    yc, radio = (g.ravel() for g in np.meshgrid(np.arange(4.0, 13.0, 0.5), np.arange(12.0, 24.0),
+                                                indexing='ij'))
+    xc = np.full(yc.size, 18.0)
+
+    doble = analizar_bishop_batch(xc, yc, radio, caso['perfil_terreno'], estrato)
+    simple = analizar_bishop_batch(xc, yc, radio, caso['perfil_terreno'], estrato, dtype=np.float32)
+    assert doble.convergio.sum() > 100
+    assert simple.convergio.tolist() == doble.convergio.tolist()
+    assert np.allclose(simple.factor_seguridad[doble.convergio], doble.factor_seguridad[doble.convergio],
+                       rtol=1e-4)
+
+
+def test_bishop_batch_en_procesos_igual_a_secuencial(perfil_talud, estrato_arena):
+    m = 2 * MIN_CIRCULOS_POR_PROCESO + 1
+    xc = np.linspace(12.0, 20.0, m)
+    yc = np.linspace(5.0, 12.0, m)
+    radio = np.linspace(15.0, 30.0, m)
+
+    secuencial = analizar_bishop_batch(xc, yc, radio, perfil_talud, estrato_arena)
+    paralelo = analizar_bishop_batch(xc, yc, radio, perfil_talud, estrato_arena, procesos=2)
+    assert paralelo.factor_seguridad.tobytes() == secuencial.factor_seguridad.tobytes()
+    assert paralelo.iteraciones.tolist() == secuencial.iteraciones.tolist()
+    assert paralelo.convergio.tolist() == secuencial.convergio.tolist()
+    assert paralelo.num_dovelas.tolist() == secuencial.num_dovelas.tolist()
+
+
+def test_fellenius_vectorizado_igual_a_fuerzas_por_dovela(perfil_talud, estrato_arena, circulo_talud):
+    resultado = analizar_fellenius(circulo_talud, perfil_talud, estrato_arena, [(0, 6), (40, -1)],
+                                   num_dovelas=8)
+    resistentes = [calcular_fuerza_resistente_dovela(d) for d in resultado.dovelas]
+    actuantes = [calcular_fuerza_actuante_dovela(d) for d in resultado.dovelas]
+    assert all(math.isclose(a, b, rel_tol=1e-12) for a, b in zip(resultado.fuerzas_resistentes, resistentes))
+    assert all(math.isclose(a, b, rel_tol=1e-12) for a, b in zip(resultado.fuerzas_actuantes, actuantes))
+    assert math.isclose(resultado.factor_seguridad, sum(resistentes) / abs(sum(actuantes)), rel_tol=1e-12)
+
+
+def test_fellenius_rechaza_dovela_invalida_con_mensaje_escalar(monkeypatch, perfil_talud, estrato_arena,
+                                                               circulo_talud):
+    crear = fellenius.crear_dovelas
+
+    def con_dovela_invalida(**kwargs):
+        dovelas = crear(**kwargs)
+        dovelas[3].peso = -1.0
+        return dovelas
+
+    monkeypatch.setattr(fellenius, "crear_dovelas", con_dovela_invalida)
+    with pytest.raises(ValidacionError, match="dovela 3: Dovela inválida: Peso de dovela inválido"):
+        fellenius.analizar_fellenius(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8)
+
+
+def test_bishop_rescata_punto_fijo_fuera_de_dominio_con_brent(perfil_talud):
+    pytest.importorskip("scipy")
+
+    circulo = CirculoFalla(xc=19, yc=11, radio=17)
+    estrato = Estrato(cohesion=16.0, phi_grados=29.0, gamma=18.0)
+
+    # Desde Fs=1 alguna dovela tiene mα ≤ 0; desde Fs=3 el punto fijo converge
+    rescatado = analizar_bishop(circulo, perfil_talud, estrato)
+    punto_fijo = analizar_bishop(circulo, perfil_talud, estrato, factor_inicial=3.0)
+    assert any("Brent" in a for a in rescatado.advertencias)
+    assert not any("Brent" in a for a in punto_fijo.advertencias)
+    assert math.isclose(rescatado.factor_seguridad, punto_fijo.factor_seguridad, abs_tol=1e-3)
+
+    lote = analizar_bishop_batch([19.0], [11.0], [17.0], perfil_talud, estrato)
+    assert lote.convergio[0]
+    assert math.isclose(lote.factor_seguridad[0], rescatado.factor_seguridad, rel_tol=1e-12)
+
+
+def test_kernel_bishop_compilado_igual_a_numpy(monkeypatch):
+    rng = np.random.default_rng(0)
+    alpha = rng.uniform(-0.5, 1.2, 20)
+    tan_phi = math.tan(math.radians(25.0))
+    cos_alpha, sin_tan = np.cos(alpha), np.sin(alpha) * tan_phi
+    numerador = rng.uniform(10.0, 200.0, 20)
+
+    for fs in (0.1, 1.0, 2.5):
+        buffers = [np.empty(20) for _ in range(4)]
+        compilado = bishop._paso_bishop_jit(cos_alpha, sin_tan, numerador, fs, buffers[0], buffers[1])
+        monkeypatch.setattr(bishop, "NUMBA_DISPONIBLE", False)
+        vectorial = bishop._paso_bishop(cos_alpha, sin_tan, numerador, fs, buffers[2], buffers[3])
+        monkeypatch.undo()
+        assert (compilado < 0) == (vectorial < 0)
+        if vectorial >= 0:
+            assert math.isclose(compilado, vectorial, rel_tol=1e-12)
+            assert np.allclose(buffers[1], buffers[3], rtol=1e-12)
+
+
+def test_punto_fijo_compilado_igual_a_numpy(monkeypatch, perfil_talud, estrato_arena, circulo_talud):
+    arreglos = DovelaArrays.desde_dovelas(crear_dovelas(circulo_talud, perfil_talud, estrato_arena, 8))
+    cos_alpha, sin_tan = arreglos.cos_alpha, arreglos.sin_alpha * arreglos.tan_phi
+    numerador = arreglos.cohesion * arreglos.longitud_arco + arreglos.peso * arreglos.tan_phi
+    suma_actuantes = abs(float((arreglos.peso * arreglos.sin_alpha).sum()))
+
+    for inicial, max_iteraciones in ((1.0, 100), (0.05, 100), (3.0, 2), (-1.0, 10)):
+        salidas = []
+        for numba in (bishop.NUMBA_DISPONIBLE, False):
+            monkeypatch.setattr(bishop, "NUMBA_DISPONIBLE", numba)
+            historial = np.zeros(max_iteraciones + 1)
+            historial[0] = inicial
+            estado = bishop._punto_fijo_bishop(cos_alpha, sin_tan, numerador, suma_actuantes, 1e-6,
+                                               max_iteraciones, np.empty(8), np.empty(8), historial)
+            salidas.append((estado, historial))
+        monkeypatch.undo()
+        (compilado, h_compilado), (vectorial, h_vectorial) = salidas
+        assert compilado == vectorial
+        assert np.allclose(h_compilado, h_vectorial, rtol=1e-12)
+
+
+def test_bishop_casos_igual_a_bishop_por_caso(perfil_talud, estrato_arena, circulo_talud):
+    circulos = [circulo_talud, CirculoFalla(20, 20, 25), CirculoFalla(5, 40, 3), CirculoFalla(18, 10, 19)]
+    perfiles = [perfil_talud, [(0, 18.3), (36.6, 0), (60, 0)], perfil_talud, perfil_talud]
+    estratos = [estrato_arena, Estrato(20.0, 15.0, 18.0), estrato_arena, Estrato(5.0, 30.0, 19.0)]
+    freaticos = [None, None, None, [(0, 6), (40, -1)]]
+
+    lote = analizar_bishop_casos(circulos, perfiles, estratos, 10, freaticos)
+    for i in range(len(circulos)):
+        try:
+            esperado = analizar_bishop(circulos[i], perfiles[i], estratos[i], freaticos[i], 10).factor_seguridad
+        except ValidacionError:
+            assert math.isnan(lote.factor_seguridad[i]) and not lote.convergio[i]
+        else:
+            assert math.isclose(lote.factor_seguridad[i], esperado, rel_tol=1e-12)
+
+
+def test_iteracion_bishop_igual_a_funciones_por_dovela(perfil_talud, estrato_arena, circulo_talud):
+    dovelas = crear_dovelas(circulo_talud, perfil_talud, estrato_arena, 8, [(0, 6), (40, -1)])
+
+    fs, resistentes, actuantes, m_alpha = iteracion_bishop(dovelas, 1.3)
+    assert resistentes == [calcular_fuerza_resistente_bishop(d, 1.3) for d in dovelas]
+    assert actuantes == [calcular_fuerza_actuante_bishop(d) for d in dovelas]
+    assert m_alpha == [calcular_m_alpha(d, 1.3) for d in dovelas]
+    assert fs == sum(resistentes) / abs(sum(actuantes))
+
+
+def test_fuerzas_fellenius_compiladas_igual_a_numpy(monkeypatch, perfil_talud, estrato_arena, circulo_talud):
+    arreglos = DovelaArrays.desde_dovelas(crear_dovelas(circulo_talud, perfil_talud, estrato_arena, 8))
+    trig = (arreglos.sin_alpha, arreglos.cos_alpha, arreglos.tan_phi)
+
+    salidas = []
+    for numba in (fellenius.NUMBA_DISPONIBLE, False):
+        monkeypatch.setattr(fellenius, "NUMBA_DISPONIBLE", numba)
+        salidas.append(fellenius._fuerzas_fellenius(arreglos, *trig))
+    for compilado, vectorial in zip(*salidas):
+        assert np.allclose(compilado, vectorial, rtol=1e-12)
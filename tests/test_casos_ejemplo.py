@@ -0,0 +1,124 @@
+import math
+
+import pytest
+
+from core.bishop import analizar_bishop, analizar_bishop_casos
+from core.geometry import crear_dovelas
+from core.search import buscar_circulo_critico
+from data.models import CirculoFalla, Estrato
+from gui_analysis import analizar_desde_gui
+from gui_examples import CASOS_EJEMPLO
+from validacion_geometrica import ValidadorGeometrico
+
+CAMPOS_GUI = ('altura', 'angulo_talud', 'cohesion', 'phi_grados', 'gamma', 'con_agua',
+              'nivel_freatico', 'centro_x', 'centro_y', 'radio', 'perfil_terreno')
+
+
+def _estrato(caso):
+    return Estrato(cohesion=caso['cohesion'], phi_grados=caso['phi_grados'], gamma=caso['gamma'])
+
+
+def test_casos_ejemplo_en_lote():
+    casos = list(CASOS_EJEMPLO.values())
+    resultado = analizar_bishop_casos(
+        [CirculoFalla(caso['centro_x'], caso['centro_y'], caso['radio']) for caso in casos],
+        [caso['perfil_terreno'] for caso in casos],
+        [_estrato(caso) for caso in casos],
+        num_dovelas=10
+    )
+    assert resultado.convergio.all()
+    assert (resultado.factor_seguridad > 0).all()
+
+
+@pytest.mark.parametrize("nombre", list(CASOS_EJEMPLO))
+def test_bishop_por_caso_con_y_sin_validacion(nombre):
+    caso = CASOS_EJEMPLO[nombre]
+    circulo = CirculoFalla(caso['centro_x'], caso['centro_y'], caso['radio'])
+    estrato = _estrato(caso)
+
+    assert len(crear_dovelas(circulo, caso['perfil_terreno'], estrato, 10)) >= 3
+    validado = analizar_bishop(circulo, caso['perfil_terreno'], estrato, num_dovelas=10)
+    sin_validar = analizar_bishop(circulo, caso['perfil_terreno'], estrato, num_dovelas=10,
+                                  validar_entrada=False)
+    assert 0.5 < validado.factor_seguridad < 10
+    assert sin_validar.factor_seguridad == validado.factor_seguridad
+
+
+@pytest.mark.parametrize("nombre", list(CASOS_EJEMPLO))
+def test_casos_ejemplo_desde_gui(nombre):
+    resultado = analizar_desde_gui({campo: CASOS_EJEMPLO[nombre][campo] for campo in CAMPOS_GUI})
+    if resultado['valido']:
+        assert resultado['bishop'].factor_seguridad > 0
+        assert resultado['fellenius'].factor_seguridad > 0
+    else:
+        assert resultado['error']
+
+
+@pytest.mark.parametrize("nombre", list(CASOS_EJEMPLO))
+def test_circulo_critico_de_casos(nombre):
+    caso = CASOS_EJEMPLO[nombre]
+    perfil, altura = caso['perfil_terreno'], caso['altura']
+    x_cresta, x_pie = perfil[1][0], perfil[2][0]
+    resultado = buscar_circulo_critico(
+        perfil, _estrato(caso),
+        limites_x=(x_cresta - 0.5 * altura, x_pie + 0.5 * altura),
+        limites_y=(0.5 * altura, 2.5 * altura),
+        limites_radio=(altura, 3 * altura)
+    )
+    assert resultado is not None
+    assert math.isfinite(resultado.factor_seguridad) and resultado.factor_seguridad > 0
+
+
+def test_validacion_geometrica_de_casos():
+    # Un validador por perfil: los casos que comparten perfil lo reutilizan
+    validadores = {}
+    for caso in CASOS_EJEMPLO.values():
+        perfil = caso['perfil_terreno']
+        if id(perfil) not in validadores:
+            validadores[id(perfil)] = ValidadorGeometrico(perfil)
+        validador = validadores[id(perfil)]
+        resultado = validador.validar_parametros(caso['centro_x'], caso['centro_y'], caso['radio'])
+        assert resultado.mensaje
+        assert resultado.es_valido or resultado.rangos_sugeridos is not None
+
+
+def test_analisis_parametrico_en_arreglo_estructurado():
+    from gui_analysis import analizar_parametrico_gui, RESULTADO_PARAMETRICO_DTYPE
+
+    base = {campo: CASOS_EJEMPLO['Talud Estable - Carretera'][campo] for campo in CAMPOS_GUI}
+    valores = [5.0, 15.0, 25.0, -1.0]
+    parametrico = analizar_parametrico_gui(base, 'cohesion', valores)
+
+    tabla = parametrico['resultados']
+    assert tabla.dtype == RESULTADO_PARAMETRICO_DTYPE
+    assert tabla['valor'].tolist() == valores
+    assert parametrico['valido'] and not tabla['valido'][-1]
+    assert list(parametrico['errores']) == [-1.0]
+    assert math.isnan(tabla['fs_bishop'][-1])
+    for fila in tabla[tabla['valido']]:
+        params = dict(base, cohesion=fila['valor'])
+        assert fila['fs_bishop'] == analizar_desde_gui(params)['bishop'].factor_seguridad
+
+
+def test_analisis_parametrico_en_procesos_igual_a_secuencial():
+    from gui_analysis import analizar_parametrico_gui
+
+    base = {campo: CASOS_EJEMPLO['Talud Estable - Carretera'][campo] for campo in CAMPOS_GUI}
+    valores = [5.0, 15.0, -1.0]
+    secuencial = analizar_parametrico_gui(base, 'cohesion', valores)
+    paralelo = analizar_parametrico_gui(base, 'cohesion', valores, procesos=2)
+
+    assert paralelo['errores'] == secuencial['errores']
+    assert paralelo['resultados'].tobytes() == secuencial['resultados'].tobytes()
+
+
+def test_error_de_analisis_sin_traza_formateada(caplog):
+    import logging
+
+    base = {campo: CASOS_EJEMPLO['Talud Estable - Carretera'][campo] for campo in CAMPOS_GUI}
+    with caplog.at_level(logging.DEBUG, logger='gui_analysis'):
+        resultado = analizar_desde_gui(dict(base, dovelas=1))
+
+    assert not resultado['valido'] and resultado['tipo_error'] == 'analisis'
+    assert 'traceback' not in resultado
+    assert any(registro.exc_info for registro in caplog.records if registro.name == 'gui_analysis')
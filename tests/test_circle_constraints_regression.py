@@ -1,3 +1,5 @@
+import numpy as np
+
 from core.circle_constraints import CalculadorLimites, aplicar_limites_inteligentes
 from data.models import CirculoFalla
 
@@ -13,3 +15,21 @@ def test_validar_y_corregir_no_unboundlocalerror():
         circulo, limites, corregir_automaticamente=False
     )
     assert result.es_valido
+
+
+def test_corregir_circulos_lote_igual_a_escalar(perfil_talud):
+    limites = aplicar_limites_inteligentes(perfil_talud, "talud_empinado")
+    calc = CalculadorLimites()
+    circulos = np.array([
+        [limites.centro_x_min - 5, limites.centro_y_max + 5, limites.radio_min / 2],
+        [(limites.centro_x_min + limites.centro_x_max) / 2, (limites.centro_y_min + limites.centro_y_max) / 2,
+         (limites.radio_min + limites.radio_max) / 2],
+        [limites.centro_x_max + 1, limites.centro_y_min - 1, limites.radio_max * 2],
+    ])
+
+    corregidos, validos = calc.corregir_circulos_lote(circulos, limites)
+    for fila, corregida, valido in zip(circulos, corregidos, validos):
+        resultado = calc.validar_y_corregir_circulo(CirculoFalla(*fila), limites)
+        assert resultado.es_valido == valido
+        esperado = resultado.circulo_corregido or CirculoFalla(*fila)
+        assert corregida.tolist() == [esperado.xc, esperado.yc, esperado.radio]
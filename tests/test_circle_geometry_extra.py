@@ -12,6 +12,9 @@ def test_longitud_arco_half_circle():
     r = 5.0
     length = calcular_longitud_arco(-r, r, 0.0, 0.0, r)
     assert math.isclose(length, math.pi * r, rel_tol=1e-6)
+    # Fuera del dominio de asin se usa la distancia horizontal
+    assert calcular_longitud_arco(-6.0, r, 0.0, 0.0, r) == 11.0
+    assert calcular_longitud_arco(0.0, 1.0, 0.0, 0.0, 0.0) == 1.0
 
 
 def test_validar_geometria_basica_variants():
@@ -29,3 +32,63 @@ def test_generar_circulos_dentro_limites():
         assert limites.centro_x_min <= c.xc <= limites.centro_x_max
         assert limites.centro_y_min <= c.yc <= limites.centro_y_max
         assert limites.radio_min <= c.radio <= limites.radio_max
+
+
+def test_generar_circulos_reproducibles_con_semilla():
+    import random
+
+    perfil = crear_perfil_simple(0.0, 0.0, 10.0, 5.0, num_puntos=5)
+    limites = aplicar_limites_inteligentes(perfil, "talud_empinado")
+    calc = CalculadorLimites()
+    for distribucion in ("uniforme", "gaussiana", "critico"):
+        primeros = calc.generar_circulos_dentro_limites(limites, 50, distribucion, semilla=7)
+        assert primeros == calc.generar_circulos_dentro_limites(limites, 50, distribucion, semilla=7)
+        assert len(primeros) == 50 and all(isinstance(c.xc, float) for c in primeros)
+
+    gaussianos = calc.generar_circulos_dentro_limites(limites, 200, "gaussiana")
+    assert all(limites.radio_min <= c.radio <= limites.radio_max for c in gaussianos)
+
+    # Sin semilla se sigue el estado del módulo random
+    random.seed(3)
+    a = calc.generar_circulos_dentro_limites(limites, 5)
+    random.seed(3)
+    assert a == calc.generar_circulos_dentro_limites(limites, 5)
+
+
+def test_diagnostico_de_caso_memoizado():
+    from gui_examples import CASOS_EJEMPLO
+    from tools.circle_diagnostics import _diagnostico_cacheado, diagnosticar_caso_completo
+
+    nombre = next(iter(CASOS_EJEMPLO))
+    primero = diagnosticar_caso_completo(nombre, mostrar_graficos=False)
+    aciertos = _diagnostico_cacheado.cache_info().hits
+    segundo = diagnosticar_caso_completo(nombre, mostrar_graficos=False)
+
+    assert _diagnostico_cacheado.cache_info().hits == aciertos + 1
+    assert segundo == primero and segundo is not primero
+    assert primero.num_dovelas_total == 10 and primero.centro_x == CASOS_EJEMPLO[nombre]["centro_x"]
+
+
+def test_contexto_compartido_crea_dovelas_una_vez(monkeypatch, perfil_simple, estrato_arcilla, circulo_base):
+    import core.circle_geometry as circle_geometry
+
+    llamadas = []
+    original = circle_geometry.crear_dovelas
+    monkeypatch.setattr(circle_geometry, "crear_dovelas",
+                        lambda *args: llamadas.append(args) or original(*args))
+
+    geom = circle_geometry.GeometriaCirculoAvanzada()
+    contexto = geom.preparar(circulo_base, perfil_simple, estrato_arcilla, 10)
+    validaciones = geom.validar_circulo_completo(circulo_base, perfil_simple, estrato_arcilla, 10, contexto)
+    metricas = geom.calcular_metricas_circulo(circulo_base, perfil_simple, estrato_arcilla, 10, contexto)
+
+    assert len(llamadas) == 1
+    assert len(validaciones) == 5
+    assert metricas.longitud_interseccion == contexto.longitud_arco
+    assert metricas.num_dovelas_validas == len(contexto.dovelas)
+
+    # Un error al crear las dovelas se informa en la validación
+    fallido = geom.preparar(circulo_base, perfil_simple, estrato_arcilla, 2)
+    assert fallido.dovelas is None
+    resultado = geom.validar_circulo_completo(circulo_base, perfil_simple, estrato_arcilla, 2, fallido)[-1]
+    assert not resultado.es_valido and resultado.mensaje.startswith("Error creando dovelas")
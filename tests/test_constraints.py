@@ -15,3 +15,25 @@ def test_validar_circulo_geometricamente():
     assert limites.centro_x_min <= c.xc <= limites.centro_x_max
     assert limites.centro_y_min <= c.yc <= limites.centro_y_max
     assert limites.radio_min <= c.radio <= limites.radio_max
+
+
+def test_limites_memoizados_por_perfil():
+    from core.circle_constraints import CalculadorLimites, _limites_cacheados
+
+    perfil = [(0, 0), (10, 5), (20, 0)]
+    primero = aplicar_limites_inteligentes(perfil, "talud_empinado")
+    primero.radio_max = -1.0
+    aciertos = _limites_cacheados.cache_info().hits
+    segundo = aplicar_limites_inteligentes(list(perfil), "talud_critico")
+    assert _limites_cacheados.cache_info().hits == aciertos + 1
+    assert segundo is not primero and segundo.radio_max > 0
+
+    configurado = CalculadorLimites().calcular_limites_desde_perfil(perfil, {"factor_radio_max": 4.0})
+    assert math.isclose(configurado.radio_max, 4.0 * configurado.altura_talud)
+
+
+def test_limites_no_dependen_del_preset():
+    perfil = [(0, 0), (10, 5), (20, 0)]
+    suave = aplicar_limites_inteligentes(perfil, "talud_suave")
+    conservador = aplicar_limites_inteligentes(perfil, "talud_conservador")
+    assert suave == conservador and suave is not conservador
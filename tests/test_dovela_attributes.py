@@ -1,6 +1,10 @@
+import math
+from dataclasses import replace
+
+import numpy as np
 import pytest
 from core.geometry import crear_dovelas, crear_perfil_simple
-from data.models import CirculoFalla, Estrato
+from data.models import CirculoFalla, Estrato, Dovela, DovelaArrays, DovelaVista, DOVELA_DTYPE
 
 
 def test_dovelas_expose_base_and_surface_attributes():
@@ -12,3 +16,133 @@ def test_dovelas_expose_base_and_surface_attributes():
     assert hasattr(d, "y_base"), "y_base attribute missing"
     assert hasattr(d, "y_superficie"), "y_superficie attribute missing"
     assert d.y_superficie > d.y_base
+
+
+def test_dovelas_estructuradas_ida_y_vuelta(perfil_talud, estrato_arena, circulo_talud):
+    dovelas = crear_dovelas(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8)
+
+    registros = DovelaArrays.desde_dovelas(dovelas).a_estructurado()
+    assert registros.dtype == DOVELA_DTYPE
+    vista = DovelaVista(registros[2])
+    assert vista.altura == dovelas[2].altura
+    assert vista.sin_alpha == pytest.approx(dovelas[2].sin_alpha)
+    with pytest.raises(AttributeError):
+        vista.no_existe
+
+    copia = DovelaArrays.desde_estructurado(registros).a_dovelas()
+    assert [d.peso for d in copia] == [d.peso for d in dovelas]
+
+
+def test_desde_dovelas_columnas_contiguas(perfil_talud, estrato_arena, circulo_talud):
+    dovelas = crear_dovelas(circulo_talud, perfil_talud, estrato_arena, num_dovelas=8)
+
+    arreglos = DovelaArrays.desde_dovelas(dovelas)
+    for nombre in DovelaArrays.__dataclass_fields__:
+        columna = getattr(arreglos, nombre)
+        assert columna.flags.c_contiguous
+        assert columna.tolist() == [float(getattr(d, nombre)) for d in dovelas]
+    assert len(DovelaArrays.desde_dovelas([])) == 0
+
+
+def test_tan_phi_precalculada_en_estrato_y_dovela(perfil_talud, circulo_talud):
+    estrato = Estrato(cohesion=10.0, phi_grados=30.0, gamma=18.0)
+    assert estrato.phi_radianes == math.radians(30.0)
+    assert estrato.tan_phi == math.tan(math.radians(30.0))
+    # replace vuelve a pasar por el __init__ generado
+    assert replace(estrato, phi_grados=20.0).tan_phi == math.tan(math.radians(20.0))
+    assert estrato == Estrato(cohesion=10.0, phi_grados=30.0, gamma=18.0)
+    modificado = Estrato(cohesion=10.0, phi_grados=30.0, gamma=18.0)
+    modificado.phi_grados = 25.0
+    assert modificado.phi_radianes == math.radians(25.0)
+    assert modificado.tan_phi == math.tan(math.radians(25.0))
+
+    dovela = crear_dovelas(circulo_talud, perfil_talud, estrato, num_dovelas=4)[0]
+    assert dovela.tan_phi == estrato.tan_phi
+    assert dovela.sin_alpha == math.sin(dovela.angulo_alpha)
+    assert dovela.cos_alpha == math.cos(dovela.angulo_alpha)
+    assert dovela.tan_alpha == pytest.approx(math.tan(dovela.angulo_alpha))
+    # Igual que en Estrato, los derivados siguen a phi_grados y angulo_alpha
+    dovela.angulo_alpha = 0.3
+    dovela.phi_grados = 20.0
+    assert dovela.sin_alpha == math.sin(0.3)
+    assert dovela.cos_alpha == math.cos(0.3)
+    assert dovela.tan_phi == math.tan(math.radians(20.0))
+
+
+def test_circulo_dovelas_arreglos(perfil_talud, estrato_arena, circulo_talud):
+    # Círculo propio: el test le agrega dovelas
+    circulo = CirculoFalla(xc=15, yc=5, radio=30)
+    for dovela in crear_dovelas(circulo_talud, perfil_talud, estrato_arena, num_dovelas=6):
+        circulo.agregar_dovela(dovela)
+
+    arreglos = circulo.dovelas_arreglos()
+    assert len(arreglos) == circulo.num_dovelas
+    assert arreglos.peso.sum() == pytest.approx(circulo.peso_total)
+    assert np.dot(arreglos.peso, arreglos.sin_alpha) == pytest.approx(
+        sum(d.calcular_fuerza_actuante_fellenius() for d in circulo.dovelas))
+
+
+def test_resistencia_fellenius_en_traccion_solo_cohesion():
+    dovela = Dovela(x_centro=5.0, ancho=1.0, altura=2.0, angulo_alpha=math.radians(45),
+                    cohesion=5.0, phi_grados=20.0, gamma=16.0, peso=32.0,
+                    presion_poros=50.0, longitud_arco=1.41)
+    assert dovela.calcular_fuerza_normal_efectiva() < 0
+    assert dovela.tiene_traccion
+    assert dovela.calcular_resistencia_fellenius() == dovela.cohesion * dovela.longitud_arco
+
+    dovela.presion_poros = 0.0
+    normal = dovela.calcular_fuerza_normal_efectiva()
+    assert not dovela.tiene_traccion
+    assert dovela.calcular_resistencia_fellenius() == pytest.approx(
+        dovela.cohesion * dovela.longitud_arco + normal * dovela.tan_phi)
+
+
+def test_totales_del_circulo_siguen_a_la_lista(perfil_talud, estrato_arena, circulo_talud):
+    dovelas = crear_dovelas(circulo_talud, perfil_talud, estrato_arena, num_dovelas=6)
+
+    circulo = CirculoFalla(xc=15, yc=5, radio=30, dovelas=dovelas[:2])
+    for dovela in dovelas[2:4]:
+        circulo.agregar_dovela(dovela)
+    assert circulo.peso_total == pytest.approx(sum(d.peso for d in dovelas[:4]))
+
+    # Modificar la lista directamente también se refleja en los totales
+    circulo.dovelas.extend(dovelas[4:])
+    assert circulo.peso_total == pytest.approx(sum(d.peso for d in dovelas))
+    assert circulo.longitud_total_arco == pytest.approx(sum(d.longitud_arco for d in dovelas))
+
+    # Aunque el número de dovelas no cambie
+    circulo.dovelas[0] = dovelas[5]
+    assert circulo.peso_total == pytest.approx(sum(d.peso for d in dovelas[1:]) + dovelas[5].peso)
+    circulo.dovelas = list(reversed(dovelas[:3])) + dovelas[:3]
+    assert circulo.peso_total == pytest.approx(2 * sum(d.peso for d in dovelas[:3]))
+
+
+def test_agregar_dovelas_lote(perfil_talud, estrato_arena, circulo_talud):
+    # a_dovelas construye las dovelas con argumentos posicionales
+    campos = tuple(DovelaArrays.__dataclass_fields__)
+    assert tuple(Dovela.__dataclass_fields__)[:len(campos)] == campos
+
+    dovelas = crear_dovelas(circulo_talud, perfil_talud, estrato_arena, num_dovelas=6)
+
+    # Círculo propio: el test le agrega dovelas
+    circulo = CirculoFalla(xc=15, yc=5, radio=30)
+    circulo.agregar_dovela(dovelas[0])
+    circulo.agregar_dovelas_lote(DovelaArrays.desde_dovelas(dovelas[1:]))
+    assert circulo.dovelas == dovelas
+    assert circulo.peso_total == pytest.approx(sum(d.peso for d in dovelas))
+    assert circulo.longitud_total_arco == pytest.approx(sum(d.longitud_arco for d in dovelas))
+
+
+def test_dovela_validar_false_omite_validaciones(perfil_talud, estrato_arena, circulo_talud):
+    datos = dict(x_centro=5.0, ancho=0.0, altura=2.0, angulo_alpha=math.radians(20),
+                 cohesion=5.0, phi_grados=20.0, gamma=16.0, peso=32.0,
+                 presion_poros=0.0, longitud_arco=1.1)
+    with pytest.raises(ValueError, match="Ancho"):
+        Dovela(**datos)
+    dovela = Dovela(**datos, validar=False)
+    assert dovela.tan_phi == math.tan(math.radians(20.0))
+
+    # El camino vectorizado de crear_dovelas construye sin revalidar
+    dovelas = crear_dovelas(circulo_talud, perfil_talud, estrato_arena, num_dovelas=60)
+    assert dovelas == [Dovela(**{campo: getattr(d, campo) for campo in datos}, y_base=d.y_base,
+                              y_superficie=d.y_superficie) for d in dovelas]
@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+import pytest
+
+import solucion_dovelas_literatura as literatura
+from core.geometry import (calcular_angulo_alpha, calcular_longitud_arco, calcular_y_circulo,
+                           interpolar_terreno, perfil_a_arreglos)
+from data.models import CirculoFalla, Estrato
+
+# Caso Bishop (1955) de probar_casos_literatura_mejorados
+PERFIL = [(0, 18.3), (36.6, 0), (60, 0)]
+XC, YC, RADIO = 25.9, 27.4, 28.1
+
+
+def _referencia(bordes):
+    """Salidas esperadas del kernel, dovela a dovela con las funciones escalares."""
+    filas = []
+    for x_izq, x_der in zip(bordes[:-1].tolist(), bordes[1:].tolist()):
+        x = 0.5 * (x_izq + x_der)
+        y_base = calcular_y_circulo(x, XC, YC, RADIO, parte_superior=False)
+        y_superficie = interpolar_terreno(x, PERFIL)
+        if y_base is None:
+            filas.append((x, y_superficie, None, None, None, False))
+            continue
+        alpha = calcular_angulo_alpha(x, XC, YC, RADIO)
+        arco = calcular_longitud_arco(x_izq, x_der, XC, YC, RADIO)
+        altura = y_superficie - y_base
+        valido = 0.1 < altura < 50.0 and abs(alpha) <= math.radians(60.0) and arco > 0
+        filas.append((x, y_superficie, y_base, alpha, arco, valido))
+    return filas
+
+
+@pytest.mark.parametrize("compilado", [True, False])
+def test_kernel_dovelas_literatura_igual_a_funciones_escalares(compilado):
+    kernel = literatura._build_dovelas_kernel
+    if not compilado:
+        # Versión Python del kernel, la que corre sin numba
+        kernel = getattr(kernel, "py_func", kernel)
+    perfil_x, perfil_y = perfil_a_arreglos(PERFIL)
+    # Todo el perfil: hay dovelas fuera del círculo, con α > 60° y válidas
+    bordes = np.linspace(0.0, 60.0, 31)
+
+    (x_centro, altura, ancho, angulo, y_base, y_superficie,
+     longitud_arco, valido) = kernel(bordes, perfil_x, perfil_y, XC, YC, RADIO)
+
+    referencia = _referencia(bordes)
+    assert valido.tolist() == [fila[5] for fila in referencia]
+    assert 0 < valido.sum() < len(referencia)
+    assert np.allclose(ancho, np.diff(bordes), rtol=1e-12)
+    for i, (x, y_sup, y_b, alpha, arco, _) in enumerate(referencia):
+        assert math.isclose(x_centro[i], x, rel_tol=1e-12)
+        assert math.isclose(y_superficie[i], y_sup, rel_tol=1e-12, abs_tol=1e-12)
+        if y_b is None:
+            continue
+        assert math.isclose(y_base[i], y_b, rel_tol=1e-12)
+        assert math.isclose(altura[i], y_sup - y_b, rel_tol=1e-9, abs_tol=1e-9)
+        assert math.isclose(angulo[i], alpha, rel_tol=1e-12, abs_tol=1e-12)
+        if abs(bordes[i] - XC) <= RADIO and abs(bordes[i + 1] - XC) <= RADIO:
+            assert math.isclose(longitud_arco[i], arco, rel_tol=1e-12)
+
+
+@pytest.mark.parametrize("compilado", [True, False])
+def test_crear_dovelas_literatura_solo_dovelas_validas(monkeypatch, compilado):
+    if not compilado:
+        monkeypatch.setattr(literatura, "_build_dovelas_kernel",
+                            getattr(literatura._build_dovelas_kernel, "py_func",
+                                    literatura._build_dovelas_kernel))
+    circulo = CirculoFalla(xc=XC, yc=YC, radio=RADIO)
+    estrato = Estrato(cohesion=20, phi_grados=15, gamma=18)
+
+    dovelas = literatura.crear_dovelas_literatura(circulo, PERFIL, estrato, num_dovelas=20)
+    arreglos = literatura.crear_dovelas_literatura_arrays(circulo, PERFIL, estrato, num_dovelas=20)
+    registros = literatura.crear_dovelas_literatura_estructurado(circulo, PERFIL, estrato, num_dovelas=20)
+
+    assert 0 < len(dovelas) == len(arreglos) == len(registros) <= 20
+    for dovela in dovelas:
+        # α en radianes, con el signo de calcular_angulo_alpha
+        assert math.isclose(dovela.angulo_alpha, calcular_angulo_alpha(dovela.x_centro, XC, YC, RADIO),
+                            rel_tol=1e-12, abs_tol=1e-12)
+        assert abs(dovela.angulo_alpha) <= math.radians(60.0)
+        assert 0.1 < dovela.altura < 50.0
+        assert dovela.longitud_arco > 0
+        assert math.isclose(dovela.peso, estrato.gamma * dovela.altura * dovela.ancho, rel_tol=1e-12)
+    assert np.array_equal(registros["angulo_alpha"], arreglos.angulo_alpha)
@@ -1,9 +1,18 @@
 import math
+
+import core.geometry as geometria
 from core.geometry import (
     calcular_y_circulo,
+    calcular_y_circulo_vec,
+    crear_dovelas,
+    crear_nivel_freatico_horizontal,
+    crear_perfil_terreno,
     interpolar_terreno,
     validar_geometria_circulo,
     crear_perfil_simple,
+    InterpoladorTerreno,
+    perfil_a_arreglos,
+    interpolar_terreno_vec,
 )
 from data.models import CirculoFalla
 
@@ -22,3 +31,89 @@ def test_geometry_functions():
 
     circulo = CirculoFalla(xc=15.0, yc=8.0, radio=10.0)
     assert validar_geometria_circulo(circulo, perfil)
+
+
+def test_interpolador_terreno_igual_a_interpolar():
+    perfil = [(0.0, 10.0), (10.0, 10.0), (10.0, 8.0), (20.0, 0.0), (40.0, 0.0)]
+    interpolador = InterpoladorTerreno(perfil)
+    # Recorrido creciente, salto hacia atrás y vértice con escalón vertical
+    for x in [0.0, 2.5, 9.0, 10.0, 15.0, 22.0, 40.0, 3.0, 10.0, 35.0]:
+        assert interpolador(x) == interpolar_terreno(x, perfil)
+    assert interpolar_terreno(15.0, interpolador) == interpolar_terreno(15.0, perfil)
+
+
+def test_interpolar_terreno_vec_igual_a_escalar():
+    perfil = [(20.0, 0.0), (0.0, 10.0), (10.0, 10.0), (10.0, 8.0), (40.0, 0.0)]
+    px, py = perfil_a_arreglos(perfil)
+    xs = [0.0, 2.5, 10.0, 15.0, 20.0, 33.3, 40.0]
+    ys = interpolar_terreno_vec(xs, px, py)
+    assert ys.tolist() == [interpolar_terreno(x, perfil) for x in xs]
+
+
+def test_crear_dovelas_interpola_el_terreno_una_vez_por_dovela(monkeypatch, estrato_arena, circulo_talud):
+    llamadas = []
+    original = InterpoladorTerreno.__call__
+
+    def contar(self, x):
+        llamadas.append(x)
+        return original(self, x)
+
+    monkeypatch.setattr(InterpoladorTerreno, "__call__", contar)
+    perfil = [(0.0, 10.0), (10.0, 10.0), (20.0, 0.0), (40.0, 0.0)]
+    dovelas = crear_dovelas(circulo_talud, perfil, estrato_arena, 8, [(0.0, 6.0), (40.0, -1.0)])
+    # Una consulta al terreno y otra al freático por dovela
+    assert len(llamadas) == 2 * len(dovelas) == 16
+
+
+def test_perfil_memoizado_por_contenido():
+    perfil = [(0.0, 10.0), (10.0, 10.0), (20.0, 0.0), (40.0, 0.0)]
+    px, _ = perfil_a_arreglos(perfil)
+    assert perfil_a_arreglos(list(perfil))[0] is px
+    assert not px.flags.writeable
+
+    # Modificar la lista cambia la clave: no se reutiliza el perfil anterior
+    perfil[2] = (20.0, 4.0)
+    assert interpolar_terreno(20.0, perfil) == 4.0
+    assert perfil_a_arreglos(perfil)[1][2] == 4.0
+
+
+def test_crear_dovelas_vectorizado_igual_a_escalar(monkeypatch, perfil_talud, estrato_arena, circulo_talud):
+    freatico = [(0, 6), (40, 1)]
+
+    vectorizadas = crear_dovelas(circulo_talud, perfil_talud, estrato_arena, 60, freatico)
+    monkeypatch.setattr(geometria, "MIN_DOVELAS_VECTORIZADO", 10**9)
+    escalares = crear_dovelas(circulo_talud, perfil_talud, estrato_arena, 60, freatico)
+
+    assert len(vectorizadas) == len(escalares)
+    for v, e in zip(vectorizadas, escalares):
+        for campo in ("x_centro", "altura", "angulo_alpha", "peso", "presion_poros", "longitud_arco"):
+            assert math.isclose(getattr(v, campo), getattr(e, campo), rel_tol=1e-12)
+
+
+def test_perfiles_memoizados_devuelven_listas_nuevas():
+    perfil = crear_perfil_terreno(10.0, 45.0)
+    perfil.append((99.0, 99.0))
+    repetido = crear_perfil_terreno(10.0, 45.0)
+    assert repetido is not perfil and (99.0, 99.0) not in repetido
+    assert repetido == crear_perfil_terreno(10.0, 45.0)
+
+    simple = crear_perfil_simple(0.0, 10.0, 30.0, 0.0, num_puntos=5)
+    simple[0] = (1.0, 1.0)
+    assert crear_perfil_simple(0.0, 10.0, 30.0, 0.0, num_puntos=5)[0] == (0.0, 10.0)
+
+    freatico = crear_nivel_freatico_horizontal(0.0, 30.0, 4.0, num_puntos=4)
+    assert freatico == [(0.0, 4.0), (10.0, 4.0), (20.0, 4.0), (30.0, 4.0)]
+    freatico.clear()
+    assert len(crear_nivel_freatico_horizontal(0.0, 30.0, 4.0, num_puntos=4)) == 4
+
+
+def test_y_circulo_vec_igual_a_escalar():
+    xs = [-1.0, 0.0, 2.5, 5.0, 9.9, 10.0, 12.0]
+    for superior in (True, False):
+        ys = calcular_y_circulo_vec(xs, 5.0, 5.0, 5.0, parte_superior=superior)
+        for x, y in zip(xs, ys):
+            esperado = calcular_y_circulo(x, 5.0, 5.0, 5.0, parte_superior=superior)
+            if esperado is None:
+                assert math.isnan(y)
+            else:
+                assert math.isclose(y, esperado, rel_tol=1e-12)
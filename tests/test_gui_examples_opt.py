@@ -0,0 +1,18 @@
+import json
+import os
+
+import gui_examples_opt
+
+
+def test_casos_se_releen_solo_si_cambia_el_archivo(tmp_path, monkeypatch):
+    ruta = tmp_path / "casos.json"
+    ruta.write_text(json.dumps({"A": {"altura": 5}}), encoding="utf-8")
+    monkeypatch.setattr(gui_examples_opt, "RUTA_CASOS", ruta)
+
+    primero = gui_examples_opt.CASOS_EJEMPLO
+    assert primero == {"A": {"altura": 5}}
+    assert gui_examples_opt.CASOS_EJEMPLO is primero
+
+    ruta.write_text(json.dumps({"B": {"altura": 8}}), encoding="utf-8")
+    os.utime(ruta, ns=(0, ruta.stat().st_mtime_ns + 1_000_000))
+    assert gui_examples_opt.CASOS_EJEMPLO == {"B": {"altura": 8}}
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from utils.lazy import lazy_import
+
+
+def test_lazy_import_modulo_ausente():
+    assert lazy_import("modulo_que_no_existe") is None
+
+
+def test_importar_core_no_carga_scipy_optimize():
+    codigo = ("import sys, core, core.search; "
+              "print('scipy.optimize._optimize' in sys.modules)")
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True,
+                            check=True, cwd=Path(__file__).resolve().parents[1])
+    assert salida.stdout.strip() == "False"
+
+
+def test_importar_core_y_data_no_carga_numba():
+    codigo = ("import sys, core, data, core.bishop; antes = 'numba' in sys.modules; "
+              "from utils.jit import NUMBA_DISPONIBLE; "
+              "from core.bishop import analizar_bishop; from data.models import CirculoFalla, Estrato; "
+              "analizar_bishop(CirculoFalla(xc=15, yc=5, radio=30), [(0, 10), (10, 10), (20, 0), (40, 0)], "
+              "Estrato(cohesion=15.0, phi_grados=25.0, gamma=18.0), num_dovelas=10); "
+              "print(antes, ('numba' in sys.modules) == NUMBA_DISPONIBLE)")
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True,
+                            check=True, cwd=Path(__file__).resolve().parents[1])
+    # numba se importa recién al ejecutar el primer kernel
+    assert salida.stdout.strip() == "False True"
+
+
+def test_njit_diferido_compila_en_la_primera_llamada():
+    from utils import jit
+
+    @jit.njit(cache=False)
+    def doble(x):
+        return 2 * x
+
+    assert doble(3.0) == 6.0
+    assert doble.py_func(4.0) == 8.0
+    if jit.NUMBA_DISPONIBLE:
+        assert doble.compilar() is doble.compilar()
+        assert type(doble.compilar()).__module__.startswith("numba")
+
+
+def test_all_de_core_solo_lista_nombres_importados():
+    import core
+
+    assert [nombre for nombre in core.__all__ if not hasattr(core, nombre)] == []
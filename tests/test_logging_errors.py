@@ -1,4 +1,3 @@
-import os
 import pytest
 from logging_utils import setup_logging
 from utils.file_utils import load_text_file
@@ -19,6 +18,18 @@ def test_load_text_file_logs_error(caplog):
     assert any("Archivo no encontrado" in r.message for r in caplog.records)
 
 
+def test_load_text_file_rereads_changed_file(tmp_path):
+    import os
+
+    path = tmp_path / "nota.txt"
+    path.write_text("uno", encoding="utf-8")
+    assert load_text_file(str(path)) == "uno"
+
+    path.write_text("dos", encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    assert load_text_file(str(path)) == "dos"
+
+
 def test_calcular_m_alpha_invalid_fs_logs(caplog):
     dovela = Dovela(
         x_centro=0.0,
@@ -41,20 +52,13 @@ def test_calcular_m_alpha_invalid_fs_logs(caplog):
     assert any("Factor de seguridad" in r.message for r in caplog.records)
 
 
-def test_gui_show_error_logs(caplog, monkeypatch):
-    if os.environ.get("DISPLAY", "") == "":
-        pytest.skip("No display available for Tkinter")
-
-    from gui_app import SlopeStabilityApp
-
+def test_gui_show_error_logs(caplog, monkeypatch, app):
     messages = []
     monkeypatch.setattr("tkinter.messagebox.showerror", lambda *a, **k: messages.append(a))
 
-    app = SlopeStabilityApp()
     app._show_analysis_error("prueba")
 
     assert messages
     assert any("prueba" in m[1] for m in messages)
     assert any("prueba" in r.message for r in caplog.records)
-    app.root.destroy()
 
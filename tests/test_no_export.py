@@ -1,20 +1,16 @@
-import os
-import pytest
-import customtkinter as ctk
+# Los módulos de GUI se importan dentro de cada test: importar customtkinter
+# es lento y sin DISPLAY los tests con ventana se saltan de todos modos
 
-from gui_components import ToolsPanel
-from gui_dialogs import AppUtils
 
+def test_export_button_removed(ventana):
+    from gui_components import ToolsPanel
 
-def test_export_button_removed():
-    if os.environ.get("DISPLAY", "") == "":
-        pytest.skip("No display available for Tkinter")
-    root = ctk.CTk()
-    panel = ToolsPanel(root, app_instance=None)
+    panel = ToolsPanel(ventana, app_instance=None)
     assert not hasattr(panel, "export_btn")
     assert not hasattr(panel, "export_results")
-    root.destroy()
 
 
 def test_export_function_removed():
+    from gui_dialogs import AppUtils
+
     assert not hasattr(AppUtils, "export_results")
@@ -0,0 +1,54 @@
+import matplotlib
+import matplotlib.pyplot as plt
+
+from visualization.plotting import configurar_estilo_grafico
+
+
+def test_estilo_se_reaplica_si_cambian_los_rcparams():
+    configurar_estilo_grafico()
+    assert plt.rcParams["font.size"] == 10
+
+    # Sin cambios la llamada no toca nada
+    configurar_estilo_grafico()
+    assert plt.rcParams["font.size"] == 10
+
+    plt.rcParams["font.size"] = 20
+    plt.rcParams["lines.linewidth"] = 7.0
+    configurar_estilo_grafico()
+    assert plt.rcParams["font.size"] == 10
+    assert plt.rcParams["lines.linewidth"] == matplotlib.rcParamsDefault["lines.linewidth"]
+
+
+def test_interpolar_elevacion_por_busqueda_binaria():
+    import numpy as np
+    from visualization.plotting import _interpolar_elevacion, _interpolar_elevacion_vec
+
+    # Desordenado y con escalón vertical en x = 5
+    perfil = [(8.0, 0.0), (0.0, 10.0), (5.0, 6.0), (5.0, 4.0)]
+    assert _interpolar_elevacion(perfil, -1.0) == 10.0
+    assert _interpolar_elevacion(perfil, 2.5) == 8.0
+    assert _interpolar_elevacion(perfil, 5.0) == 6.0
+    assert _interpolar_elevacion(perfil, 6.5) == 2.0
+    assert _interpolar_elevacion(perfil, 9.0) == 0.0
+    assert _interpolar_elevacion([], 1.0) is None
+    assert _interpolar_elevacion([(3.0, 7.0)], 1.0) == 7.0
+
+    xs = [-1.0, 2.5, 5.0, 6.5, 9.0]
+    assert np.array_equal(_interpolar_elevacion_vec(perfil, xs),
+                          [_interpolar_elevacion(perfil, x) for x in xs])
+
+
+def test_grafico_con_nivel_freatico():
+    from core.geometry import crear_perfil_simple, crear_nivel_freatico_horizontal, crear_dovelas
+    from data.models import CirculoFalla, Estrato
+    from visualization.plotting import graficar_con_nivel_freatico
+
+    perfil = crear_perfil_simple(0.0, 10.0, 40.0, 0.0, 10)
+    freatico = crear_nivel_freatico_horizontal(0.0, 40.0, 6.0)
+    circulo = CirculoFalla(xc=20.0, yc=22.0, radio=24.0)
+    dovelas = crear_dovelas(circulo, perfil, Estrato(cohesion=15.0, phi_grados=22.0, gamma=19.0), 10)
+    fig = graficar_con_nivel_freatico(perfil, circulo, freatico, dovelas, 1.5)
+    try:
+        assert "Zona saturada" in [t.get_text() for t in fig.gca().get_legend().get_texts()]
+    finally:
+        plt.close(fig)
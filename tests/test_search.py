@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from core.bishop import analizar_bishop_batch, _analizar_bishop_por_clave, limpiar_cache_bishop
+from core.search import buscar_circulo_critico
+
+
+def test_buscar_circulo_critico_mejora_la_grilla(perfil_talud, estrato_arena):
+    limites = [(8.0, 25.0), (5.0, 25.0), (10.0, 30.0)]
+
+    resultado = buscar_circulo_critico(perfil_talud, estrato_arena, *limites, puntos_grilla=4, num_semillas=2,
+                                       metodo='L-BFGS-B')
+
+    ejes = [np.linspace(minimo, maximo, 4) for minimo, maximo in limites]
+    xc, yc, radio = (eje.ravel() for eje in np.meshgrid(*ejes, indexing='ij'))
+    grilla = analizar_bishop_batch(xc, yc, radio, perfil_talud, estrato_arena)
+
+    assert resultado is not None
+    assert resultado.factor_seguridad <= np.nanmin(grilla.factor_seguridad)
+    assert resultado.evaluaciones >= len(xc)
+    for valor, (minimo, maximo) in zip((resultado.circulo.xc, resultado.circulo.yc, resultado.circulo.radio), limites):
+        assert minimo <= valor <= maximo
+
+
+def test_buscar_circulo_critico_con_nelder_mead(perfil_talud, estrato_arena):
+    limites = [(8.0, 25.0), (5.0, 25.0), (10.0, 30.0)]
+
+    grilla = buscar_circulo_critico(perfil_talud, estrato_arena, *limites, puntos_grilla=4, num_semillas=0)
+    simplex = buscar_circulo_critico(perfil_talud, estrato_arena, *limites, puntos_grilla=4, num_semillas=2)
+
+    assert simplex.factor_seguridad <= grilla.factor_seguridad
+    for valor, (minimo, maximo) in zip((simplex.circulo.xc, simplex.circulo.yc, simplex.circulo.radio), limites):
+        assert minimo <= valor <= maximo
+    with pytest.raises(ValueError):
+        buscar_circulo_critico(perfil_talud, estrato_arena, *limites, metodo='Powell')
+
+
+def test_refinamiento_reutiliza_circulos_repetidos(perfil_talud, estrato_arena):
+    limites = [(8.0, 25.0), (5.0, 25.0), (10.0, 30.0)]
+
+    limpiar_cache_bishop()
+    resultado = buscar_circulo_critico(perfil_talud, estrato_arena, *limites, metodo='L-BFGS-B')
+    info = _analizar_bishop_por_clave.cache_info()
+    assert info.hits > 0
+    assert info.hits + info.misses <= resultado.evaluaciones
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from core.bishop import analizar_bishop
+from core.geometry import crear_dovelas
+from data.models import CirculoFalla
+from data.validation import (
+    validar_conjunto_dovelas,
+    validar_convergencia_bishop,
+    validar_factor_seguridad,
+    validar_geometria_circulo_avanzada,
+    validar_perfil_terreno,
+)
+
+
+def test_validaciones_sobre_dovelas(perfil_simple, estrato_arcilla, circulo_base):
+    dovelas = crear_dovelas(circulo_base, perfil_simple, estrato_arcilla, num_dovelas=8)
+    assert dovelas
+    assert validar_conjunto_dovelas(dovelas).es_valido
+    assert all(d.fuerza_normal_efectiva == d.peso * d.cos_alpha - d.presion_poros * d.longitud_arco
+               and d.tiene_traccion == (d.fuerza_normal_efectiva < 0) for d in dovelas)
+    assert validar_convergencia_bishop([1.0, 1.1], 1).es_valido
+    assert validar_factor_seguridad(1.2).es_valido
+
+
+def test_bishop_geometria_correcta(perfil_simple, estrato_arcilla, circulo_base):
+    resultado = analizar_bishop(circulo_base, perfil_simple, estrato_arcilla)
+    assert resultado.convergio
+    assert resultado.dovelas
+    assert 1.0 < resultado.factor_seguridad < 10.0
+
+
+def test_validador_geometrico_acepta_circulo_base(validador_geometrico, circulo_base):
+    resultado = validador_geometrico.validar_parametros(circulo_base.xc, circulo_base.yc, circulo_base.radio)
+    assert resultado.es_valido, resultado.mensaje
+    assert resultado.dovelas_validas_estimadas > 0
+
+    rangos = validador_geometrico.calcular_rangos_validos()
+    fuera = validador_geometrico.validar_parametros(circulo_base.xc, rangos.centro_y_min - 1.0, circulo_base.radio)
+    assert not fuera.es_valido and fuera.rangos_sugeridos is not None
+
+
+def test_validacion_geometria_simple(perfil_talud):
+    circulo = CirculoFalla(xc=20, yc=-5, radio=20)
+    resultado = validar_geometria_circulo_avanzada(circulo, perfil_talud)
+    assert resultado.es_valido, f"La geometría simple debería ser válida: {resultado.mensaje}"
+
+
+def test_validador_descarta_circulo_sobre_el_terreno_sin_intersecciones(validador_geometrico, monkeypatch):
+    def no_llamar(*args):
+        raise AssertionError("no debería recorrer el perfil")
+
+    monkeypatch.setattr(validador_geometrico, "calcular_intersecciones_circulo_terreno", no_llamar)
+    # yc - r = 30 m, por encima del punto más alto del perfil (10 m)
+    resultado = validador_geometrico._validar_parametros(20.0, 40.0, 10.0)
+    assert not resultado.es_valido
+    assert resultado.mensaje == "El círculo no intersecta suficientemente con el terreno"
+
+
+def test_validar_perfil_terreno_reporta_el_primer_tramo_invalido():
+    assert validar_perfil_terreno([(0, 10), (10, 10), (20, 0)]).es_valido
+    assert validar_perfil_terreno([(0, 0)]).codigo_error == "PERFIL_INSUFICIENTE"
+
+    # El orden se revisa antes que las pendientes
+    desordenado = validar_perfil_terreno([(0, 0), (1, 50), (3, 0), (2, 0)])
+    assert desordenado.codigo_error == "PERFIL_NO_ORDENADO"
+    assert desordenado.mensaje == "Perfil no ordenado: x[2]=3 >= x[3]=2"
+
+    empinado = validar_perfil_terreno([(0, 0), (1, 1), (2, 13)])
+    assert empinado.codigo_error == "PENDIENTE_EXTREMA"
+    assert empinado.valor_problematico == 12.0
+    assert "puntos 1 y 2" in empinado.mensaje
+
+
+@pytest.mark.parametrize("con_numba", [True, False])
+def test_validar_convergencia_bishop_con_y_sin_numba(monkeypatch, con_numba):
+    import data.validation as validation
+    monkeypatch.setattr(validation, "NUMBA_DISPONIBLE", con_numba and validation.NUMBA_DISPONIBLE)
+
+    invalido = validar_convergencia_bishop([1.2, float("nan"), -1.0], 2)
+    assert invalido.codigo_error == "FS_INVALIDO"
+    assert invalido.mensaje == "Factor de seguridad inválido en iteración 1: nan"
+
+    assert validar_convergencia_bishop(np.array([1.5, 1.4, 1.3995]), 2).es_valido
+    assert validar_convergencia_bishop([1.5, 1.4], 50).codigo_error == "NO_CONVERGENCIA"
+    divergente = validar_convergencia_bishop([1.0, 1.05, 1.3], 2)
+    assert divergente.codigo_error == "POSIBLE_DIVERGENCIA"
+    assert divergente.valor_problematico == pytest.approx(0.25)
@@ -5,14 +5,39 @@ Diagnóstico completo, tests automáticos y corrección de problemas.
 """
 
 import matplotlib.pyplot as plt
+from dataclasses import replace
+from functools import lru_cache
 from typing import List, Tuple
 from gui_examples import CASOS_EJEMPLO
-from core.circle_geometry import GeometriaCirculoAvanzada
+from core.circle_geometry import (ContextoCirculo, GeometriaCirculoAvanzada, MetricasCirculo,
+                                  ResultadoValidacionCirculo)
+from core.geometry import _clave_perfil
 from core.circle_optimizer import OptimizadorCirculos, ParametrosOptimizacion, TipoOptimizacion, MetodoOptimizacion
 from visualization.circle_plots import VisualizadorCirculos
 from data.models import CirculoFalla, Estrato
 
 
+# GeometriaCirculoAvanzada solo guarda su tolerancia: una instancia para todos los casos
+_GEOMETRIA = GeometriaCirculoAvanzada()
+
+
+@lru_cache(maxsize=256)
+def _diagnostico_cacheado(xc: float, yc: float, radio: float,
+                          perfil_terreno: Tuple[Tuple[float, float], ...],
+                          cohesion: float, phi_grados: float, gamma: float,
+                          num_dovelas: int) -> Tuple[Tuple[ResultadoValidacionCirculo, ...], MetricasCirculo,
+                                                     ContextoCirculo]:
+    """Validaciones, métricas y contexto geométrico de un círculo, para un perfil hashable."""
+    circulo = CirculoFalla(xc, yc, radio)
+    estrato = Estrato(cohesion, phi_grados, gamma)
+    perfil = list(perfil_terreno)
+    # Intersecciones y dovelas se calculan una vez y las usan ambas etapas
+    contexto = _GEOMETRIA.preparar(circulo, perfil, estrato, num_dovelas)
+    validaciones = _GEOMETRIA.validar_circulo_completo(circulo, perfil, estrato, num_dovelas, contexto)
+    metricas = _GEOMETRIA.calcular_metricas_circulo(circulo, perfil, estrato, num_dovelas, contexto)
+    return tuple(validaciones), metricas, contexto
+
+
 def diagnosticar_caso_completo(nombre_caso: str, mostrar_graficos: bool = True):
     """Diagnóstico completo de un caso de ejemplo"""
     print(f"\n{'='*60}")
@@ -23,19 +48,19 @@ def diagnosticar_caso_completo(nombre_caso: str, mostrar_graficos: bool = True):
     circulo = CirculoFalla(caso['centro_x'], caso['centro_y'], caso['radio'])
     estrato = Estrato(caso['cohesion'], caso['phi_grados'], caso['gamma'])
     
-    # Geometría avanzada
-    geom = GeometriaCirculoAvanzada()
+    # Validaciones y métricas se calculan una vez por círculo, perfil y estrato
+    validaciones, metricas, contexto = _diagnostico_cacheado(
+        circulo.xc, circulo.yc, circulo.radio, _clave_perfil(caso['perfil_terreno']),
+        estrato.cohesion, estrato.phi_grados, estrato.gamma, 10)
     
     # 1. Validaciones
     print("\n📋 VALIDACIONES:")
-    validaciones = geom.validar_circulo_completo(circulo, caso['perfil_terreno'], estrato, 10)
     for v in validaciones:
         icono = "✅" if v.es_valido else "❌"
         print(f"   {icono} {v.tipo.value}: {v.mensaje}")
     
     # 2. Métricas
     print("\n📊 MÉTRICAS:")
-    metricas = geom.calcular_metricas_circulo(circulo, caso['perfil_terreno'], estrato, 10)
     print(f"   🎯 Dovelas válidas: {metricas.num_dovelas_validas}/{metricas.num_dovelas_total}")
     print(f"   🌊 Cobertura terreno: {metricas.cobertura_terreno:.1f}%")
     print(f"   ⚖️  Fuerzas actuantes: {metricas.suma_fuerzas_actuantes:.1f} N")
@@ -43,10 +68,11 @@ def diagnosticar_caso_completo(nombre_caso: str, mostrar_graficos: bool = True):
     # 3. Gráficos si se solicita
     if mostrar_graficos:
         viz = VisualizadorCirculos()
-        fig = viz.plot_diagnostico_completo(circulo, caso['perfil_terreno'], estrato, 10)
+        fig = viz.plot_diagnostico_completo(circulo, caso['perfil_terreno'], estrato, 10, contexto)
         plt.show()
     
-    return metricas
+    # Copia: quien llama puede modificarla sin tocar la caché
+    return replace(metricas)
 
 
 def test_sistema_completo():
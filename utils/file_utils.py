@@ -1,14 +1,27 @@
 import logging
+import os
+from functools import lru_cache
 from logging_utils import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a file once per (mtime, size) version; the stat values are only cache keys."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 def load_text_file(path: str) -> str:
-    """Load text file contents, logging an error if the file is missing."""
+    """Load text file contents, logging an error if the file is missing.
+
+    Repeated reads of an unchanged file are served from memory; a rewrite
+    changes its mtime/size and the next call reads it again.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+        stat = os.stat(path)
+        return _read_text_cached(os.fspath(path), stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError:
         logger.error("Archivo no encontrado: %s", path)
         raise
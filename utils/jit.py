@@ -0,0 +1,67 @@
+"""
+Compilación JIT opcional con Numba.
+
+``njit`` acepta los mismos argumentos que ``numba.njit``, pero no importa
+numba al decorar: devuelve un kernel diferido que importa numba y compila la
+función en su primera llamada. Así, importar core o data no paga el import de
+numba (~0.3 s) hasta que se ejecuta un kernel. Tras compilar, el kernel
+reemplaza su nombre en el módulo por el dispatcher de numba, de modo que las
+llamadas siguientes (y los kernels que lo llaman) usan numba directamente.
+
+Si numba no está instalado, ``NUMBA_DISPONIBLE`` es False y los kernels se
+ejecutan como Python/NumPy puro.
+"""
+
+import functools
+import importlib.util
+
+NUMBA_DISPONIBLE = importlib.util.find_spec("numba") is not None
+
+
+class _KernelDiferido:
+    """Función decorada con njit que se compila en su primera llamada."""
+
+    def __init__(self, func, args, opciones):
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self._args = args
+        self._opciones = opciones
+        self._compilado = None
+
+    def compilar(self):
+        """Compila el kernel (una sola vez) y devuelve la función a llamar."""
+        if self._compilado is not None:
+            return self._compilado
+        func = self.py_func
+        # numba solo puede llamar a otros kernels ya compilados: los que
+        # este usa se compilan antes y quedan como dispatchers en el módulo
+        for nombre in func.__code__.co_names:
+            dependencia = func.__globals__.get(nombre)
+            if isinstance(dependencia, _KernelDiferido):
+                dependencia.compilar()
+        try:
+            from numba import njit as numba_njit
+        except ImportError:  # pragma: no cover - numba presente pero no importable
+            compilado = func
+        else:
+            compilado = numba_njit(*self._args, **self._opciones)(func)
+        self._compilado = compilado
+        if func.__globals__.get(func.__name__) is self:
+            func.__globals__[func.__name__] = compilado
+        return compilado
+
+    def __call__(self, *args, **kwargs):
+        return self.compilar()(*args, **kwargs)
+
+
+def njit(*args, **kwargs):
+    """Equivalente diferido de ``numba.njit`` (con o sin argumentos)."""
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return njit()(args[0])
+
+    def decorador(func):
+        if not NUMBA_DISPONIBLE:
+            return func
+        return _KernelDiferido(func, args, kwargs)
+
+    return decorador
@@ -0,0 +1,39 @@
+"""
+Importación diferida de dependencias pesadas u opcionales.
+
+``lazy_import`` devuelve el módulo sin ejecutarlo: el código del módulo corre
+al acceder al primer atributo. Así, importar core no arrastra scipy.optimize
+(~0.5 s) si nunca se usa Brent ni L-BFGS-B. Si el módulo no está instalado
+devuelve None, igual que los fallbacks de utils.jit.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Optional
+
+
+def lazy_import(nombre: str) -> Optional[ModuleType]:
+    """
+    Importa un módulo de forma diferida.
+
+    Args:
+        nombre: Nombre completo del módulo (p. ej. "scipy.optimize")
+
+    Returns:
+        Módulo que se carga en el primer acceso a un atributo, o None si
+        no está instalado
+    """
+    if nombre in sys.modules:
+        return sys.modules[nombre]
+    try:
+        spec = importlib.util.find_spec(nombre)
+    except ImportError:  # pragma: no cover - paquete padre ausente
+        return None
+    if spec is None:
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nombre] = modulo
+    spec.loader.exec_module(modulo)
+    return modulo
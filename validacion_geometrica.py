@@ -4,6 +4,7 @@ Determina rangos válidos y valida configuraciones antes del análisis.
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import Tuple, List, Dict, Optional
 from dataclasses import dataclass
 
@@ -40,12 +41,18 @@ class ValidadorGeometrico:
         """
         self.perfil_terreno = sorted(perfil_terreno, key=lambda p: p[0])
         self.num_dovelas_minimas = num_dovelas_minimas
+        # Clave de caché de validar_parametros; si el perfil cambia se crea otro validador
+        self._perfil_key = tuple(map(tuple, self.perfil_terreno))
+        
+        # Coordenadas del perfil como arreglos, para los límites del terreno
+        self._px = np.array([p[0] for p in self.perfil_terreno], dtype=float)
+        self._py = np.array([p[1] for p in self.perfil_terreno], dtype=float)
         
         # Calcular límites del terreno
-        self.x_min = min(p[0] for p in perfil_terreno)
-        self.x_max = max(p[0] for p in perfil_terreno)
-        self.y_min = min(p[1] for p in perfil_terreno)
-        self.y_max = max(p[1] for p in perfil_terreno)
+        self.x_min = float(self._px.min())
+        self.x_max = float(self._px.max())
+        self.y_min = float(self._py.min())
+        self.y_max = float(self._py.max())
         
     def interpolar_y_terreno(self, x: float) -> float:
         """Interpola la altura del terreno en una coordenada x"""
@@ -181,9 +188,20 @@ class ValidadorGeometrico:
         """
         Valida si los parámetros geométricos son válidos
         
+        Los resultados se cachean por (perfil, centro, radio): validar el mismo
+        círculo sobre el mismo perfil, aunque sea desde otro validador, no
+        repite el cálculo de intersecciones. El resultado devuelto es compartido
+        y no debe modificarse.
+        
         Returns:
             ResultadoValidacionGeometrica con el resultado de la validación
         """
+        return _validar_cacheado(self._perfil_key, self.num_dovelas_minimas,
+                                 float(centro_x), float(centro_y), float(radio), num_dovelas)
+    
+    def _validar_parametros(self, centro_x: float, centro_y: float, 
+                            radio: float, num_dovelas: int = 20) -> ResultadoValidacionGeometrica:
+        """Validación sin caché (ver validar_parametros)"""
         # Verificar rangos básicos
         rangos = self.calcular_rangos_validos()
         
@@ -211,8 +229,15 @@ class ValidadorGeometrico:
                 rangos_sugeridos=rangos
             )
         
+        # Un círculo por encima del punto más alto o por debajo del más bajo
+        # no corta el terreno: se descarta sin recorrer el perfil
+        fuera_del_terreno = centro_y - radio > self.y_max or centro_y + radio < self.y_min
+        
         # Verificar intersecciones con terreno
-        intersecciones = self.calcular_intersecciones_circulo_terreno(centro_x, centro_y, radio)
+        if fuera_del_terreno:
+            intersecciones = []
+        else:
+            intersecciones = self.calcular_intersecciones_circulo_terreno(centro_x, centro_y, radio)
         
         if len(intersecciones) < 2:
             return ResultadoValidacionGeometrica(
@@ -266,6 +291,15 @@ class ValidadorGeometrico:
             'radio': radio
         }
 
+@lru_cache(maxsize=512)
+def _validar_cacheado(perfil_key: Tuple[Tuple[float, float], ...], num_dovelas_minimas: int,
+                      centro_x: float, centro_y: float, radio: float,
+                      num_dovelas: int) -> ResultadoValidacionGeometrica:
+    """Validación geométrica memoizada por perfil y círculo"""
+    validador = ValidadorGeometrico(list(perfil_key), num_dovelas_minimas)
+    return validador._validar_parametros(centro_x, centro_y, radio, num_dovelas)
+
+
 def validar_caso_ejemplo(caso: Dict) -> ResultadoValidacionGeometrica:
     """
     Valida un caso de ejemplo completo
@@ -19,7 +19,7 @@ from typing import List, Tuple, Optional, Dict, Any
 from matplotlib.colors import LinearSegmentedColormap
 
 from data.models import CirculoFalla, Estrato, Dovela
-from core.circle_geometry import GeometriaCirculoAvanzada, MetricasCirculo
+from core.circle_geometry import ContextoCirculo, GeometriaCirculoAvanzada, MetricasCirculo
 from core.geometry import crear_dovelas
 
 
@@ -196,10 +196,17 @@ class VisualizadorCirculos:
                                  circulo: CirculoFalla,
                                  perfil_terreno: List[Tuple[float, float]],
                                  estrato: Estrato,
-                                 num_dovelas: int = 10) -> plt.Figure:
+                                 num_dovelas: int = 10,
+                                 contexto: Optional[ContextoCirculo] = None) -> plt.Figure:
         """
         Dashboard completo de diagnóstico de círculo.
+        
+        Los paneles comparten un ContextoCirculo (el recibido o uno preparado
+        aquí) en lugar de recalcular intersecciones y dovelas cada uno.
         """
+        if contexto is None:
+            contexto = self.geometria.preparar(circulo, perfil_terreno, estrato, num_dovelas)
+        
         fig = plt.figure(figsize=(16, 12))
         
         # Layout: 2x2 grid
@@ -207,11 +214,11 @@ class VisualizadorCirculos:
         
         # 1. Gráfico principal con dovelas
         ax1 = fig.add_subplot(gs[0, :])
-        self._plot_circulo_principal(ax1, circulo, perfil_terreno, estrato, num_dovelas)
+        self._plot_circulo_principal(ax1, circulo, perfil_terreno, estrato, num_dovelas, contexto)
         
         # 2. Métricas de validación
         ax2 = fig.add_subplot(gs[1, 0])
-        self._plot_metricas_validacion(ax2, circulo, perfil_terreno, estrato, num_dovelas)
+        self._plot_metricas_validacion(ax2, circulo, perfil_terreno, estrato, num_dovelas, contexto)
         
         # 3. Información geométrica
         ax3 = fig.add_subplot(gs[1, 1])
@@ -219,12 +226,12 @@ class VisualizadorCirculos:
         
         # 4. Recomendaciones
         ax4 = fig.add_subplot(gs[2, :])
-        self._plot_recomendaciones(ax4, circulo, perfil_terreno, estrato, num_dovelas)
+        self._plot_recomendaciones(ax4, circulo, perfil_terreno, estrato, num_dovelas, contexto)
         
         fig.suptitle('Diagnóstico Completo de Círculo de Falla', fontsize=16, fontweight='bold')
         return fig
     
-    def _plot_circulo_principal(self, ax, circulo, perfil_terreno, estrato, num_dovelas):
+    def _plot_circulo_principal(self, ax, circulo, perfil_terreno, estrato, num_dovelas, contexto=None):
         """Subplot principal con círculo y dovelas"""
         # Dibujar terreno
         terreno_x = [p[0] for p in perfil_terreno]
@@ -234,7 +241,7 @@ class VisualizadorCirculos:
         
         # Validar círculo
         validaciones = self.geometria.validar_circulo_completo(
-            circulo, perfil_terreno, estrato, num_dovelas)
+            circulo, perfil_terreno, estrato, num_dovelas, contexto)
         
         # Determinar color del círculo basado en validación
         errores = [v for v in validaciones if not v.es_valido and v.severidad == "ERROR"]
@@ -265,8 +272,11 @@ class VisualizadorCirculos:
         ax.plot(circulo.centro_x, circulo.centro_y, 'ko', markersize=8)
         
         # Intersecciones
-        intersecciones = self.geometria.calcular_intersecciones_circulo_terreno(
-            circulo, perfil_terreno)
+        if contexto is not None:
+            intersecciones = contexto.intersecciones
+        else:
+            intersecciones = self.geometria.calcular_intersecciones_circulo_terreno(
+                circulo, perfil_terreno)
         if intersecciones:
             int_x = [p[0] for p in intersecciones]
             int_y = [p[1] for p in intersecciones]
@@ -278,13 +288,13 @@ class VisualizadorCirculos:
         ax.set_title('Vista Principal - Círculo de Falla')
         ax.legend()
     
-    def _plot_metricas_validacion(self, ax, circulo, perfil_terreno, estrato, num_dovelas):
+    def _plot_metricas_validacion(self, ax, circulo, perfil_terreno, estrato, num_dovelas, contexto=None):
         """Subplot con métricas de validación"""
         ax.axis('off')
         
         # Calcular métricas
         metricas = self.geometria.calcular_metricas_circulo(
-            circulo, perfil_terreno, estrato, num_dovelas)
+            circulo, perfil_terreno, estrato, num_dovelas, contexto)
         
         # Texto de métricas
         texto_metricas = f"""
@@ -349,13 +359,13 @@ INFORMACIÓN GEOMÉTRICA
                verticalalignment='top',
                bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue", alpha=0.8))
     
-    def _plot_recomendaciones(self, ax, circulo, perfil_terreno, estrato, num_dovelas):
+    def _plot_recomendaciones(self, ax, circulo, perfil_terreno, estrato, num_dovelas, contexto=None):
         """Subplot con recomendaciones de mejora"""
         ax.axis('off')
         
         # Validaciones
         validaciones = self.geometria.validar_circulo_completo(
-            circulo, perfil_terreno, estrato, num_dovelas)
+            circulo, perfil_terreno, estrato, num_dovelas, contexto)
         
         # Generar recomendaciones
         recomendaciones = []
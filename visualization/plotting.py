@@ -23,6 +23,8 @@ from dataclasses import dataclass
 from data.models import CirculoFalla, Dovela
 from core.fellenius import ResultadoFellenius
 from core.bishop import ResultadoBishop
+from core.geometry import (calcular_y_circulo, calcular_y_circulo_vec, perfil_a_arreglos,
+                           interpolar_terreno_vec)
 
 
 @dataclass
@@ -41,14 +43,28 @@ class ConfiguracionGrafico:
     leyenda_fontsize: int = 10
 
 
+# rcParams tal como quedaron tras la última configuración completa del estilo
+_rc_estilo: Optional[Dict[str, Any]] = None
+
+
 def configurar_estilo_grafico():
-    """Configura el estilo general de los gráficos."""
+    """
+    Configura el estilo general de los gráficos.
+    
+    plt.style.use('default') reescribe todos los rcParams (~1 ms). Si nadie
+    los modificó desde la última llamada el estilo ya está aplicado y se omite.
+    """
+    global _rc_estilo
+    if _rc_estilo is not None and _rc_estilo == dict(plt.rcParams):
+        return
+    
     plt.style.use('default')
     plt.rcParams['figure.facecolor'] = 'white'
     plt.rcParams['axes.facecolor'] = 'white'
     plt.rcParams['axes.grid'] = True
     plt.rcParams['grid.alpha'] = 0.3
     plt.rcParams['font.size'] = 10
+    _rc_estilo = dict(plt.rcParams)
 
 
 def graficar_perfil_basico(perfil_terreno: List[Tuple[float, float]], 
@@ -138,6 +154,9 @@ def graficar_dovelas(perfil_terreno: List[Tuple[float, float]],
     fig = graficar_perfil_basico(perfil_terreno, circulo, titulo, config)
     ax = fig.gca()
     
+    # Intersecciones con el círculo de todas las dovelas en una sola llamada
+    ys_circulo = _calcular_y_circulo_dovelas(circulo, dovelas)
+    
     # Graficar dovelas
     for i, dovela in enumerate(dovelas):
         # Calcular límites de la dovela
@@ -147,10 +166,8 @@ def graficar_dovelas(perfil_terreno: List[Tuple[float, float]],
         # Encontrar elevación del terreno en el centro
         y_terreno = _interpolar_elevacion(perfil_terreno, dovela.x_centro)
         
-        # Encontrar intersección con círculo
-        y_circulo = _calcular_y_circulo(circulo, dovela.x_centro)
-        
-        if y_circulo is not None and y_terreno is not None:
+        y_circulo = ys_circulo[i]
+        if not math.isnan(y_circulo) and y_terreno is not None:
             # Dibujar dovela como rectángulo
             altura_dovela = y_terreno - y_circulo
             rect = patches.Rectangle((x_izq, y_circulo), dovela.ancho, altura_dovela,
@@ -397,19 +414,12 @@ def graficar_con_nivel_freatico(perfil_terreno: List[Tuple[float, float]],
         x_coords = [p[0] for p in perfil_terreno]
         y_coords = [p[1] for p in perfil_terreno]
         
-        # Crear área de agua
-        x_agua = []
-        y_agua = []
-        for x in x_coords:
-            y_terreno = _interpolar_elevacion(perfil_terreno, x)
-            y_agua_nivel = _interpolar_elevacion(nivel_freatico, x)
-            if y_agua_nivel is not None and y_terreno is not None and y_agua_nivel < y_terreno:
-                x_agua.extend([x, x])
-                y_agua.extend([y_agua_nivel, y_terreno])
+        # Crear área de agua: nivel freático en los X del perfil, en una llamada
+        y_agua_nivel = _interpolar_elevacion_vec(nivel_freatico, x_coords)
+        y_terreno = _interpolar_elevacion_vec(perfil_terreno, x_coords)
         
-        if x_agua:
-            ax.fill_between(x_coords, [_interpolar_elevacion(nivel_freatico, x) or 0 for x in x_coords],
-                           y_coords, where=[(_interpolar_elevacion(nivel_freatico, x) or 0) < y for x, y in zip(x_coords, y_coords)],
+        if (y_agua_nivel < y_terreno).any():
+            ax.fill_between(x_coords, y_agua_nivel, y_coords, where=y_agua_nivel < np.asarray(y_coords),
                            color=config.color_agua, alpha=0.3, label='Zona saturada')
     
     ax.legend(fontsize=config.leyenda_fontsize)
@@ -463,37 +473,39 @@ def _interpolar_elevacion(perfil: List[Tuple[float, float]], x: float) -> Option
     """Interpola la elevación en un punto x dado un perfil."""
     if not perfil:
         return None
+    return float(_interpolar_elevacion_vec(perfil, x)[0])
+
+
+def _interpolar_elevacion_vec(perfil: List[Tuple[float, float]], xs) -> np.ndarray:
+    """
+    Versión vectorizada de _interpolar_elevacion para un perfil no vacío.
     
-    # Ordenar perfil por x
-    perfil_ordenado = sorted(perfil, key=lambda p: p[0])
-    
-    # Casos extremos
-    if x <= perfil_ordenado[0][0]:
-        return perfil_ordenado[0][1]
-    if x >= perfil_ordenado[-1][0]:
-        return perfil_ordenado[-1][1]
-    
-    # Interpolación lineal
-    for i in range(len(perfil_ordenado) - 1):
-        x1, y1 = perfil_ordenado[i]
-        x2, y2 = perfil_ordenado[i + 1]
-        
-        if x1 <= x <= x2:
-            if x2 == x1:
-                return y1
-            return y1 + (y2 - y1) * (x - x1) / (x2 - x1)
-    
-    return None
+    Fuera del perfil devuelve la elevación del extremo más cercano. El perfil
+    ordenado se reutiliza entre llamadas (perfil_a_arreglos) y los segmentos
+    se localizan con np.searchsorted.
+    """
+    if len(perfil) == 1:
+        return np.full(np.atleast_1d(xs).shape, float(perfil[0][1]))
+    px, py = perfil_a_arreglos(perfil)
+    xs = np.atleast_1d(np.asarray(xs, dtype=float))
+    elevaciones = interpolar_terreno_vec(np.clip(xs, px[0], px[-1]), px, py)
+    # En los extremos manda el primer y el último punto ordenados, también
+    # si el perfil empieza o termina en un escalón vertical (el primero tiene
+    # prioridad, como en el recorrido escalar)
+    elevaciones = np.where(xs >= px[-1], py[-1], elevaciones)
+    return np.where(xs <= px[0], py[0], elevaciones)
 
 
 def _calcular_y_circulo(circulo: CirculoFalla, x: float) -> Optional[float]:
     """Calcula la coordenada y inferior del círculo en x."""
-    dx = x - circulo.xc
-    if abs(dx) > circulo.radio:
-        return None
-    
-    dy = math.sqrt(circulo.radio**2 - dx**2)
-    return circulo.yc - dy  # Parte inferior del círculo
+    return calcular_y_circulo(x, circulo.xc, circulo.yc, circulo.radio, parte_superior=False)
+
+
+def _calcular_y_circulo_dovelas(circulo: CirculoFalla, dovelas: List[Dovela]) -> List[float]:
+    """Coordenada y inferior del círculo en el centro de cada dovela (NaN fuera del círculo)."""
+    x_centros = np.fromiter((dovela.x_centro for dovela in dovelas), dtype=float, count=len(dovelas))
+    return calcular_y_circulo_vec(x_centros, circulo.xc, circulo.yc, circulo.radio,
+                                  parte_superior=False).tolist()
 
 
 def _dibujar_fuerzas_dovela(ax, dovela: Dovela, y_terreno: float, y_circulo: float, config: ConfiguracionGrafico):
@@ -530,14 +542,15 @@ def _graficar_en_subplot(ax, perfil_terreno: List[Tuple[float, float]],
     ax.add_patch(circulo_patch)
     
     # Graficar dovelas
+    ys_circulo = _calcular_y_circulo_dovelas(circulo, dovelas)
     for i, dovela in enumerate(dovelas):
         x_izq = dovela.x_centro - dovela.ancho / 2
         x_der = dovela.x_centro + dovela.ancho / 2
         
         y_terreno = _interpolar_elevacion(perfil_terreno, dovela.x_centro)
-        y_circulo = _calcular_y_circulo(circulo, dovela.x_centro)
+        y_circulo = ys_circulo[i]
         
-        if y_circulo is not None and y_terreno is not None:
+        if not math.isnan(y_circulo) and y_terreno is not None:
             altura_dovela = y_terreno - y_circulo
             rect = patches.Rectangle((x_izq, y_circulo), dovela.ancho, altura_dovela,
                                    linewidth=1, edgecolor='black', 